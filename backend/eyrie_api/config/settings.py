@@ -19,3 +19,17 @@ VALID_ROLES = ['user', 'admin', 'uploader']
 
 # Valid QC statuses
 VALID_QC_STATUSES = ['passed', 'failed', 'unprocessed']
+
+# Live sample updates (Server-Sent Events)
+SAMPLE_EVENTS_POLL_INTERVAL = float(os.getenv('SAMPLE_EVENTS_POLL_INTERVAL', '2'))
+SAMPLE_EVENTS_HEARTBEAT = 15
+
+# Taxonomy lineage entries cached in-process (per worker)
+TAXONOMY_CACHE_SIZE = int(os.getenv('TAXONOMY_CACHE_SIZE', '50000'))
+
+# Pipeline output files served at /data; content-addressed artifacts live under <DATA_DIR>/cas
+DATA_DIR = os.getenv('DATA_DIR', '/app/data')
+
+# Chunked artifact uploads
+ARTIFACT_CHUNK_SIZE = int(os.getenv('ARTIFACT_CHUNK_SIZE', str(8 * 1024 * 1024)))
+ARTIFACT_MAX_SIZE = int(os.getenv('ARTIFACT_MAX_SIZE', str(4 * 1024 * 1024 * 1024)))
@@ -0,0 +1,160 @@
+import hashlib
+import os
+import re
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .connection import db
+from ..config.settings import DATA_DIR, ARTIFACT_CHUNK_SIZE
+
+# Same layout as eyrie-popup's local artifact store
+BLOBS_DIR = 'cas/blobs'
+UPLOADS_DIR = 'cas/uploads'
+
+MIN_CHUNK_SIZE = 256 * 1024
+MAX_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Upload ids are the content's sha256 plus its lower-case suffix
+UPLOAD_ID_PATTERN = re.compile(r'^([0-9a-f]{64})(\.[a-z0-9]{1,10})?$')
+
+def blob_name(sha256: str, suffix: str) -> str:
+    """Blob path relative to the data directory"""
+    return f"{BLOBS_DIR}/{sha256[:2]}/{sha256}{suffix.lower()}"
+
+def _part_path(upload_id: str) -> str:
+    return os.path.join(DATA_DIR, UPLOADS_DIR, f"{upload_id}.part")
+
+def _state(upload: Dict[str, Any]) -> Dict[str, Any]:
+    received = sorted(upload.get('received', []))
+    return {
+        'upload_id': upload['_id'],
+        'sha256': upload['sha256'],
+        'size': upload['size'],
+        'chunk_size': upload['chunk_size'],
+        'chunks': upload['chunks'],
+        'received': received,
+        'complete': False
+    }
+
+def start_upload(sha256: str, size: int, suffix: str, chunk_size: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Start or resume an upload of one file.
+
+    Uploads are keyed by content, so starting the same file again returns the
+    chunks already received; if the blob is already stored nothing needs sending.
+    """
+    name = blob_name(sha256, suffix)
+    if os.path.exists(os.path.join(DATA_DIR, name)):
+        return {'sha256': sha256, 'blob': name, 'complete': True}
+
+    upload_id = f"{sha256}{suffix.lower()}"
+    upload = db.artifact_uploads.find_one({'_id': upload_id})
+    if upload and upload['size'] == size:
+        return _state(upload)
+
+    chunk_size = min(max(chunk_size or ARTIFACT_CHUNK_SIZE, MIN_CHUNK_SIZE), MAX_CHUNK_SIZE)
+    upload = {
+        '_id': upload_id,
+        'sha256': sha256,
+        'suffix': suffix.lower(),
+        'size': size,
+        'chunk_size': chunk_size,
+        'chunks': max(1, -(-size // chunk_size)),
+        'received': [],
+        'created_date': datetime.now(),
+        'updated_date': datetime.now()
+    }
+    os.makedirs(os.path.dirname(_part_path(upload_id)), exist_ok=True)
+    with open(_part_path(upload_id), 'wb') as f:
+        f.truncate(size)
+    db.artifact_uploads.replace_one({'_id': upload_id}, upload, upsert=True)
+    return _state(upload)
+
+def stored_blob(upload_id: str) -> Optional[Dict[str, Any]]:
+    """Completed state of an upload whose content is already in the blob store, or None"""
+    match = UPLOAD_ID_PATTERN.match(upload_id)
+    if not match:
+        return None
+    sha256, suffix = match.group(1), match.group(2) or ''
+    name = blob_name(sha256, suffix)
+    if not os.path.exists(os.path.join(DATA_DIR, name)):
+        return None
+    return {'sha256': sha256, 'blob': name, 'complete': True}
+
+def find_upload(upload_id: str) -> Optional[Dict[str, Any]]:
+    """Progress of an upload, or None if unknown"""
+    upload = db.artifact_uploads.find_one({'_id': upload_id})
+    return _state(upload) if upload else None
+
+def chunk_length(upload: Dict[str, Any], index: int) -> int:
+    """Expected byte length of a chunk (the last one may be short)"""
+    return min(upload['chunk_size'], upload['size'] - index * upload['chunk_size'])
+
+def write_chunk(upload_id: str, offset: int, data: bytes):
+    """
+    Write a verified chunk at its offset in the upload's partial file.
+
+    Raises:
+        FileNotFoundError: the upload was completed or discarded meanwhile
+    """
+    fd = os.open(_part_path(upload_id), os.O_WRONLY)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(fd, view, offset)
+            view, offset = view[written:], offset + written
+    finally:
+        os.close(fd)
+
+def mark_chunk_received(upload_id: str, index: int):
+    db.artifact_uploads.update_one(
+        {'_id': upload_id},
+        {'$addToSet': {'received': index}, '$set': {'updated_date': datetime.now()}}
+    )
+
+def complete_upload(upload_id: str) -> Dict[str, Any]:
+    """
+    Verify the assembled file against its sha256 and move it into the blob store.
+
+    Another client pushing the same content may complete it first; then the
+    stored blob is returned.
+
+    Raises:
+        LookupError: the upload is unknown and its content is not stored
+        ValueError: chunks are missing or the content does not match its hash
+    """
+    upload = db.artifact_uploads.find_one({'_id': upload_id})
+    if upload is None:
+        stored = stored_blob(upload_id)
+        if stored:
+            return stored
+        raise LookupError(f"Upload {upload_id} not found")
+    missing = set(range(upload['chunks'])) - set(upload.get('received', []))
+    if missing:
+        raise ValueError(f"{len(missing)} chunks missing")
+
+    part = _part_path(upload_id)
+    name = blob_name(upload['sha256'], upload['suffix'])
+    blob = os.path.join(DATA_DIR, name)
+    try:
+        digest = hashlib.sha256()
+        with open(part, 'rb') as f:
+            for piece in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(piece)
+        if digest.hexdigest() != upload['sha256']:
+            # Start over rather than keep chunks that were acknowledged but are wrong
+            db.artifact_uploads.delete_one({'_id': upload_id})
+            os.remove(part)
+            raise ValueError("Uploaded content does not match its sha256")
+
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        os.chmod(part, 0o444)
+        os.replace(part, blob)
+    except FileNotFoundError:
+        # A concurrent complete of the same upload moved the partial file first
+        stored = stored_blob(upload_id)
+        if stored:
+            return stored
+        raise LookupError(f"Upload {upload_id} not found")
+    db.artifact_uploads.delete_one({'_id': upload_id})
+    return {'sha256': upload['sha256'], 'blob': name, 'complete': True}
@@ -0,0 +1,92 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .connection import db
+
+# Task status whose resource usage is aggregated
+COMPLETED = 'COMPLETED'
+
+def _summary(tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    statuses: Dict[str, int] = {}
+    for task in tasks:
+        statuses[task['status']] = statuses.get(task['status'], 0) + 1
+    completed = [task for task in tasks if task['status'] == COMPLETED]
+    return {
+        'tasks': len(tasks),
+        'statuses': statuses,
+        'task_seconds': round(sum(task.get('duration') or 0 for task in completed), 3),
+        'cpu_seconds': round(sum((task.get('realtime') or 0) * (task.get('cpu_percent') or 0) / 100 for task in completed), 3),
+        'max_peak_rss': max((task.get('peak_rss') or 0 for task in completed), default=0)
+    }
+
+def upsert_pipeline_run(pipeline_run_id: str, run_data: Dict[str, Any]):
+    """Store a parsed execution trace, replacing an earlier upload of the same trace"""
+    document = {
+        **run_data,
+        'summary': _summary(run_data.get('tasks', [])),
+        'uploaded_date': datetime.now()
+    }
+    db.pipeline_runs.replace_one({'_id': pipeline_run_id}, document, upsert=True)
+
+def get_pipeline_runs(sequencing_run_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Pipeline runs with their summaries but without tasks, most recent first"""
+    query = {'sequencing_run_id': sequencing_run_id} if sequencing_run_id else {}
+    return list(db.pipeline_runs.find(query, {'tasks': 0}).sort('started', -1))
+
+def find_pipeline_run(pipeline_run_id: str) -> Optional[Dict[str, Any]]:
+    return db.pipeline_runs.find_one({'_id': pipeline_run_id})
+
+def aggregate_process_stats(sequencing_run_id: Optional[str] = None, since: Optional[str] = None,
+                            by_run: bool = False) -> List[Dict[str, Any]]:
+    """
+    Time and memory per pipeline process over completed tasks of all matching runs.
+
+    With by_run, stats are grouped per process and pipeline run (ordered by start)
+    so a process's trend across runs shows regressions.
+    """
+    match: Dict[str, Any] = {}
+    if sequencing_run_id:
+        match['sequencing_run_id'] = sequencing_run_id
+    if since:
+        match['started'] = {'$gte': since}
+
+    group_id: Dict[str, Any] = {'process': '$tasks.process'}
+    if by_run:
+        group_id.update({'pipeline_run_id': '$_id', 'started': '$started'})
+
+    pipeline = [
+        {'$match': match},
+        {'$unwind': '$tasks'},
+        {'$match': {'tasks.status': COMPLETED}},
+        {'$group': {
+            '_id': group_id,
+            'tasks': {'$sum': 1},
+            'runs': {'$addToSet': '$_id'},
+            'mean_duration': {'$avg': '$tasks.duration'},
+            'max_duration': {'$max': '$tasks.duration'},
+            'total_duration': {'$sum': '$tasks.duration'},
+            'mean_realtime': {'$avg': '$tasks.realtime'},
+            'max_realtime': {'$max': '$tasks.realtime'},
+            'mean_cpu_percent': {'$avg': '$tasks.cpu_percent'},
+            'mean_peak_rss': {'$avg': '$tasks.peak_rss'},
+            'max_peak_rss': {'$max': '$tasks.peak_rss'},
+            'max_peak_vmem': {'$max': '$tasks.peak_vmem'},
+            'total_rchar': {'$sum': '$tasks.rchar'},
+            'total_wchar': {'$sum': '$tasks.wchar'},
+        }},
+    ]
+
+    stats = []
+    for group in db.pipeline_runs.aggregate(pipeline):
+        key = group.pop('_id')
+        group['runs'] = len(group['runs'])
+        stats.append({**key, **{
+            field: round(value, 3) if isinstance(value, float) else value
+            for field, value in group.items()
+        }})
+
+    if by_run:
+        stats.sort(key=lambda row: (row['process'], row.get('started') or ''))
+    else:
+        stats.sort(key=lambda row: row['total_duration'] or 0, reverse=True)
+    return stats
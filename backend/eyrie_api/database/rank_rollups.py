@@ -0,0 +1,68 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .connection import db
+from .taxonomy import expand_taxonomic_data, get_taxa, get_taxonomy_version
+
+# Ranks a sample's species hits can be rolled up to
+ROLLUP_RANKS = ['genus', 'family', 'order', 'class', 'phylum']
+
+# Group name for hits whose lineage lacks the requested rank
+UNASSIGNED = 'Unassigned'
+
+def compute_rank_rollups(taxonomic_data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """Sum species hits per taxon at every rollup rank, most abundant first"""
+    hits = expand_taxonomic_data(taxonomic_data).get('hits') or []
+    taxa = get_taxa(hit['tax_id'] for hit in hits if hit.get('tax_id'))
+
+    rollups = {}
+    for rank in ROLLUP_RANKS:
+        groups: Dict[str, Dict[str, Any]] = {}
+        for hit in hits:
+            # Prefer the shared lineage; fall back to ranks stored on the hit itself
+            name = taxa.get(hit.get('tax_id'), {}).get(rank) or hit.get(rank) or UNASSIGNED
+            group = groups.setdefault(name, {'name': name, 'abundance': 0.0, 'estimated_counts': 0.0, 'species_count': 0})
+            group['abundance'] += hit.get('abundance') or 0
+            group['estimated_counts'] += hit.get('estimated_counts') or 0
+            group['species_count'] += 1
+
+        for group in groups.values():
+            group['abundance'] = round(group['abundance'], 4)
+            group['estimated_counts'] = round(group['estimated_counts'], 2)
+        rollups[rank] = sorted(groups.values(), key=lambda group: group['abundance'], reverse=True)
+    return rollups
+
+def get_rank_rollup(sample_id: str, rank: str) -> Optional[Dict[str, Any]]:
+    """
+    A sample's abundances rolled up to one rank.
+
+    All ranks are computed together on first request and stored in the
+    rank_rollups collection keyed by the sample's updated_date, so later
+    requests (and switches between ranks) are a single document read until
+    the sample changes; upsert_taxa drops those of samples containing a taxon
+    it added or changed. Returns None if the sample does not exist.
+    """
+    sample = db.samples.find_one({'sample_id': sample_id}, {'updated_date': 1})
+    if not sample:
+        return None
+    updated_date = sample.get('updated_date')
+
+    cached = db.rank_rollups.find_one({'_id': sample_id}, {'updated_date': 1, f'ranks.{rank}': 1})
+    if cached and cached.get('updated_date') == updated_date and rank in cached.get('ranks', {}):
+        taxa = cached['ranks'][rank]
+    else:
+        version = get_taxonomy_version()
+        sample = db.samples.find_one({'sample_id': sample_id}, {'taxonomic_data': 1})
+        rollups = compute_rank_rollups((sample or {}).get('taxonomic_data') or {})
+        computed_date = datetime.now()
+        db.rank_rollups.replace_one(
+            {'_id': sample_id},
+            {'updated_date': updated_date, 'computed_date': computed_date, 'ranks': rollups},
+            upsert=True
+        )
+        if get_taxonomy_version() != version:
+            # Lineages changed mid-computation and upsert_taxa may have dropped the memo before we wrote it
+            db.rank_rollups.delete_one({'_id': sample_id, 'computed_date': computed_date})
+        taxa = rollups[rank]
+
+    return {'sample_id': sample_id, 'rank': rank, 'total_taxa': len(taxa), 'taxa': taxa}
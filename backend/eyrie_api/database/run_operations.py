@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .connection import db
+
+# Run fields returned alongside (or instead of) the matrices
+RUN_SUMMARY_FIELDS = ['sequencing_run_id', 'classification_type', 'samples', 'ranks',
+                      'created_date', 'updated_date']
+
+def upsert_run(run_id: str, run_data: Dict[str, Any]) -> bool:
+    """Replace the run-level document of a sequencing run; returns True if it was created"""
+    now = datetime.now()
+    existing = db.runs.find_one({'_id': run_id}, {'created_date': 1})
+    document = {
+        **run_data,
+        'sequencing_run_id': run_id,
+        'ranks': sorted(run_data.get('matrices', {})),
+        'created_date': existing.get('created_date', now) if existing else now,
+        'updated_date': now
+    }
+    db.runs.replace_one({'_id': run_id}, document, upsert=True)
+    return existing is None
+
+def get_runs() -> List[Dict[str, Any]]:
+    """All runs without their matrices, most recently updated first"""
+    projection = {field: 1 for field in RUN_SUMMARY_FIELDS}
+    return list(db.runs.find({}, projection).sort('updated_date', -1))
+
+def find_run(run_id: str, rank: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """A run document; with a rank, only that rank's matrix is read"""
+    projection = None
+    if rank:
+        projection = {field: 1 for field in RUN_SUMMARY_FIELDS}
+        projection[f'matrices.{rank}'] = 1
+    return db.runs.find_one({'_id': run_id}, projection)
@@ -0,0 +1,173 @@
+import asyncio
+import hashlib
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+
+import bson
+from pymongo.errors import OperationFailure, PyMongoError
+
+from .connection import db
+from .sample_operations import SAMPLE_LIST_FIELDS
+from ..config.settings import SAMPLE_EVENTS_POLL_INTERVAL
+
+# Fields pushed to open pages so they can patch rows in place
+LIVE_FIELDS = SAMPLE_LIST_FIELDS + ['spike']
+
+# Samples whose last seen state the polling fallback remembers
+POLL_SNAPSHOT_SIZE = 10000
+
+def _fingerprint(value: Any) -> str:
+    """Digest of a field value, so polling can tell which other fields changed"""
+    return hashlib.sha1(bson.encode({'v': value})).hexdigest()
+
+def change_to_event(change: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Convert a change stream document to a compact sample event"""
+    document = change.get('fullDocument')
+    if not document or 'sample_id' not in document:
+        return None
+
+    if change['operationType'] == 'insert':
+        return {
+            'sample_id': document['sample_id'],
+            'operation': 'insert',
+            'fields': {field: document.get(field) for field in LIVE_FIELDS},
+            'other_fields': []
+        }
+
+    description = change.get('updateDescription', {})
+    changed = {key.split('.')[0] for key in description.get('updatedFields', {})}
+    changed |= {key.split('.')[0] for key in description.get('removedFields', [])}
+    return {
+        'sample_id': document['sample_id'],
+        'operation': 'update',
+        'fields': {field: document.get(field) for field in LIVE_FIELDS if field in changed},
+        'other_fields': sorted(changed - set(LIVE_FIELDS))
+    }
+
+class SampleEventHub:
+    """Watches the samples collection once and fans change events out to subscribers.
+
+    Uses a MongoDB change stream when available (replica sets) and falls back to
+    polling ``updated_date`` on a standalone server.
+    """
+
+    def __init__(self):
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a subscriber, starting the watcher if it is not running"""
+        queue = asyncio.Queue(maxsize=100)
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Remove a subscriber, stopping the watcher when nobody is listening"""
+        self._subscribers.discard(queue)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def publish(self, event: Dict[str, Any]):
+        """Send an event to every subscriber, dropping it for clients that lag behind"""
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                pass
+
+    async def _run(self):
+        use_change_stream = True
+        while True:
+            try:
+                if use_change_stream:
+                    use_change_stream = await self._watch_change_stream()
+                else:
+                    await self._poll()
+            except PyMongoError as e:
+                print(f"Sample event watcher error: {e}")
+                await asyncio.sleep(SAMPLE_EVENTS_POLL_INTERVAL)
+
+    async def _watch_change_stream(self) -> bool:
+        """Publish events from a change stream; returns False if streams are unsupported"""
+        pipeline = [
+            {'$match': {'operationType': {'$in': ['insert', 'update']}}},
+            {'$project': {
+                'operationType': 1,
+                'updateDescription': 1,
+                **{f'fullDocument.{field}': 1 for field in LIVE_FIELDS}
+            }}
+        ]
+        try:
+            stream = await asyncio.to_thread(
+                db.samples.watch, pipeline, full_document='updateLookup', max_await_time_ms=1000
+            )
+        except OperationFailure as e:
+            print(f"Change streams unavailable ({e}), polling for sample changes")
+            return False
+
+        try:
+            while True:
+                change = await asyncio.to_thread(stream.try_next)
+                if change is not None:
+                    event = change_to_event(change)
+                    if event:
+                        self.publish(event)
+        finally:
+            stream.close()
+
+    async def _poll(self):
+        """Publish events by polling for samples with a newer updated_date"""
+        started = datetime.now()
+        last_seen = started
+        seen_at_last: Set[str] = set()
+        snapshots: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        while True:
+            await asyncio.sleep(SAMPLE_EVENTS_POLL_INTERVAL)
+            # $gte because several samples can share an updated_date; the ones already
+            # published at last_seen are skipped below
+            documents = await asyncio.to_thread(
+                lambda: list(db.samples.find({'updated_date': {'$gte': last_seen}}, {'_id': 0}).sort('updated_date', 1))
+            )
+            for document in documents:
+                sample_id = document.get('sample_id')
+                updated = document['updated_date']
+                if sample_id is None or (updated == last_seen and sample_id in seen_at_last):
+                    continue
+                if updated > last_seen:
+                    last_seen, seen_at_last = updated, set()
+                seen_at_last.add(sample_id)
+
+                current = {field: document.get(field) for field in LIVE_FIELDS}
+                other = {field: _fingerprint(value) for field, value in document.items() if field not in LIVE_FIELDS}
+                previous = snapshots.pop(sample_id, None)
+                snapshots[sample_id] = {'fields': current, 'other': other}
+                if len(snapshots) > POLL_SNAPSHOT_SIZE:
+                    snapshots.popitem(last=False)
+
+                if previous is None:
+                    created = document.get('created_date')
+                    is_new = isinstance(created, datetime) and created > started
+                    fields = current
+                    # Earlier state unknown, so pages refetch whatever they show beyond the live fields
+                    other_fields = [] if is_new else sorted(other)
+                else:
+                    is_new = False
+                    fields = {field: value for field, value in current.items() if previous['fields'].get(field) != value}
+                    other_fields = sorted(
+                        field for field in other.keys() | previous['other'].keys()
+                        if other.get(field) != previous['other'].get(field)
+                    )
+
+                self.publish({
+                    'sample_id': sample_id,
+                    'operation': 'insert' if is_new else 'update',
+                    'fields': fields,
+                    'other_fields': other_fields
+                })
+
+sample_event_hub = SampleEventHub()
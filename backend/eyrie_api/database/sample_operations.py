@@ -1,15 +1,43 @@
 from datetime import datetime
+from pymongo import ReturnDocument
 from .connection import db
+from .sample_stats import STATS_FIELDS, apply_sample_change, merged_sample
+from .species_occurrences import OCCURRENCE_SOURCE_FIELDS, replace_sample_occurrences
 from typing import Dict, Any
 
+# Fields needed to render the samples listing table
+SAMPLE_LIST_FIELDS = [
+    'sample_name', 'sample_id', 'sequencing_run_id', 'lims_id', 'classification',
+    'flagged_top_hits', 'flagged_contaminants', 'qc', 'comments',
+    'created_date', 'updated_date'
+]
+
 def get_all_samples():
     """Get all samples"""
     return list(db.samples.find())
 
+def get_samples_page(skip: int = 0, limit: int = 50):
+    """Get one page of samples, projected to the listing fields, newest first"""
+    projection = {field: 1 for field in SAMPLE_LIST_FIELDS}
+    cursor = db.samples.find({}, projection).sort([('created_date', -1), ('_id', -1)]).skip(skip).limit(limit)
+    return list(cursor)
+
+def get_samples_version() -> Dict[str, Any]:
+    """Get sample count and latest update time, used to validate cached listings"""
+    latest = db.samples.find_one({}, {'updated_date': 1}, sort=[('updated_date', -1)])
+    return {
+        'count': db.samples.estimated_document_count(),
+        'last_updated': latest.get('updated_date') if latest else None
+    }
+
 def find_sample(sample_id):
     """Find sample by sample_id"""
     return db.samples.find_one({'sample_id': sample_id})
 
+def find_sample_nanoplot_data(sample_id):
+    """Find only a sample's NanoPlot chart series"""
+    return db.samples.find_one({'sample_id': sample_id}, {'_id': 0, 'sample_id': 1, 'nanoplot_data': 1})
+
 def create_sample(sample_data: Dict[str, Any]) -> str:
     """Create a new sample"""
     # Check if sample already exists
@@ -22,6 +50,8 @@ def create_sample(sample_data: Dict[str, Any]) -> str:
     sample_data['updated_date'] = datetime.now()
 
     result = db.samples.insert_one(sample_data)
+    apply_sample_change(None, sample_data)
+    replace_sample_occurrences(sample_data)
     return str(result.inserted_id)
 
 def update_sample(sample_id: str, update_data: Dict[str, Any]) -> bool:
@@ -35,11 +65,11 @@ def update_sample(sample_id: str, update_data: Dict[str, Any]) -> bool:
     # Add updated timestamp
     filtered_data['updated_date'] = datetime.now()
 
-    result = db.samples.update_one(
-        {'sample_id': sample_id},
-        {'$set': filtered_data}
-    )
-    return result.matched_count > 0
+    updated = _update_with_stats(sample_id, filtered_data)
+    if updated and 'taxonomic_data' in filtered_data:
+        projection = {field: 1 for field in OCCURRENCE_SOURCE_FIELDS}
+        replace_sample_occurrences(db.samples.find_one({'sample_id': sample_id}, projection))
+    return updated
 
 def upsert_sample(sample_data: Dict[str, Any]) -> tuple[str, bool]:
     """Create sample if it doesn't exist, update if it does. Returns (id, was_created)"""
@@ -50,31 +80,25 @@ def upsert_sample(sample_data: Dict[str, Any]) -> tuple[str, bool]:
         update_data = {k: v for k, v in sample_data.items() if k != 'sample_id'}
         update_data['updated_date'] = datetime.now()
 
-        db.samples.update_one(
-            {'sample_id': sample_data['sample_id']},
-            {'$set': update_data}
-        )
+        _update_with_stats(sample_data['sample_id'], update_data)
+        replace_sample_occurrences(sample_data)
         return str(existing['_id']), False
     else:
         # Create new sample
         sample_data['created_date'] = datetime.now()
         sample_data['updated_date'] = datetime.now()
         result = db.samples.insert_one(sample_data)
+        apply_sample_change(None, sample_data)
+        replace_sample_occurrences(sample_data)
         return str(result.inserted_id), True
 
 def update_sample_qc(sample_id, qc_status, comments):
     """Update sample QC status and comments"""
-    result = db.samples.update_one(
-        {'sample_id': sample_id},
-        {
-            '$set': {
-                'qc': qc_status,
-                'comments': comments,
-                'updated_date': datetime.now()
-            }
-        }
-    )
-    return result.matched_count > 0
+    return _update_with_stats(sample_id, {
+        'qc': qc_status,
+        'comments': comments,
+        'updated_date': datetime.now()
+    })
 
 def update_sample_comment(sample_id, comments):
     """Update sample comments only"""
@@ -100,8 +124,17 @@ def update_sample_species_flags(sample_id, flagged_contaminants=None, flagged_to
     if flagged_top_hits is not None:
         update_data['flagged_top_hits'] = flagged_top_hits
 
-    result = db.samples.update_one(
+    return _update_with_stats(sample_id, update_data)
+
+def _update_with_stats(sample_id: str, update_data: Dict[str, Any]) -> bool:
+    """Apply a $set to a sample and move its contribution in the sample_stats counters"""
+    before = db.samples.find_one_and_update(
         {'sample_id': sample_id},
-        {'$set': update_data}
+        {'$set': update_data},
+        projection={field: 1 for field in STATS_FIELDS},
+        return_document=ReturnDocument.BEFORE
     )
-    return result.matched_count > 0
+    if before is None:
+        return False
+    apply_sample_change(before, merged_sample(before, update_data))
+    return True
@@ -0,0 +1,139 @@
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .connection import db
+
+# Stats documents: one for all samples plus one per sequencing run
+ALL_STATS_ID = 'all'
+RUN_STATS_PREFIX = 'run:'
+
+# Sample fields that contribute to the stats counters
+STATS_FIELDS = ['sequencing_run_id', 'qc', 'classification', 'spike',
+                'flagged_contaminants', 'flagged_top_hits']
+
+def _counter_key(value: Any) -> str:
+    """Make a value safe to use as a MongoDB field name"""
+    return str(value or 'unknown').replace('.', '_').replace('$', '_')
+
+def sample_contribution(sample: Optional[Dict[str, Any]]) -> Counter:
+    """Counters a single sample adds to its stats documents"""
+    if not sample:
+        return Counter()
+
+    contaminants = sample.get('flagged_contaminants') or []
+    top_hits = sample.get('flagged_top_hits') or []
+    return Counter({
+        'samples': 1,
+        f"qc.{_counter_key(sample.get('qc'))}": 1,
+        f"classification.{_counter_key(sample.get('classification'))}": 1,
+        'spike_detected': 1 if sample.get('spike') else 0,
+        'contaminated_samples': 1 if contaminants else 0,
+        'flagged_contaminants': len(contaminants),
+        'flagged_top_hits': len(top_hits),
+    })
+
+def _stats_ids(sample: Optional[Dict[str, Any]]):
+    if not sample:
+        return []
+    return [ALL_STATS_ID, f"{RUN_STATS_PREFIX}{sample.get('sequencing_run_id')}"]
+
+def apply_sample_change(before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]):
+    """Move a sample's contribution from its old to its new state with $inc deltas"""
+    deltas: Dict[str, Counter] = {}
+    for stats_id in _stats_ids(before):
+        deltas.setdefault(stats_id, Counter()).subtract(sample_contribution(before))
+    for stats_id in _stats_ids(after):
+        deltas.setdefault(stats_id, Counter()).update(sample_contribution(after))
+
+    for stats_id, delta in deltas.items():
+        increments = {key: value for key, value in delta.items() if value}
+        if not increments:
+            continue
+        update = {'$inc': increments, '$set': {'updated_date': datetime.now()}}
+        if stats_id.startswith(RUN_STATS_PREFIX):
+            update['$setOnInsert'] = {'sequencing_run_id': stats_id[len(RUN_STATS_PREFIX):]}
+        db.sample_stats.update_one({'_id': stats_id}, update, upsert=True)
+
+def merged_sample(before: Optional[Dict[str, Any]], changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The stats-relevant state of a sample after applying a $set of changes"""
+    if before is None:
+        return None
+    return {**before, **changes}
+
+def _with_rates(stats: Dict[str, Any]) -> Dict[str, Any]:
+    samples = stats.get('samples', 0)
+    stats['qc_pass_rate'] = stats.get('qc', {}).get('passed', 0) / samples if samples else None
+    stats['spike_detection_rate'] = stats.get('spike_detected', 0) / samples if samples else None
+    return stats
+
+def get_sample_stats() -> Dict[str, Any]:
+    """Read the precomputed stats, overall and per sequencing run"""
+    overall = db.sample_stats.find_one({'_id': ALL_STATS_ID}, {'_id': 0}) or {'samples': 0}
+    runs = db.sample_stats.find(
+        {'_id': {'$regex': f"^{RUN_STATS_PREFIX}"}, 'samples': {'$gt': 0}},
+        {'_id': 0}
+    ).sort('sequencing_run_id', 1)
+    return {
+        'overall': _with_rates(overall),
+        'runs': [_with_rates(run) for run in runs]
+    }
+
+def compute_sample_stats() -> Dict[str, Counter]:
+    """Recompute all stats counters with a full scan of the samples collection"""
+    totals: Dict[str, Counter] = {}
+    projection = {field: 1 for field in STATS_FIELDS}
+    for sample in db.samples.find({}, projection):
+        contribution = sample_contribution(sample)
+        for stats_id in _stats_ids(sample):
+            totals.setdefault(stats_id, Counter()).update(contribution)
+    return totals
+
+def _stored_counters(document: Dict[str, Any]) -> Counter:
+    counters = Counter()
+    for key, value in document.items():
+        if isinstance(value, dict):
+            counters.update({f"{key}.{sub_key}": sub_value for sub_key, sub_value in value.items()})
+        elif isinstance(value, int) and not isinstance(value, bool):
+            counters[key] = value
+    return +counters
+
+def find_stats_drift() -> Dict[str, Dict[str, Any]]:
+    """Compare stored counters with a full recount; returns the documents that differ"""
+    expected = compute_sample_stats()
+    stored = {
+        document['_id']: _stored_counters(document)
+        for document in db.sample_stats.find({}, {'updated_date': 0, 'sequencing_run_id': 0})
+    }
+
+    drift = {}
+    for stats_id in set(expected) | set(stored):
+        want = +expected.get(stats_id, Counter())
+        have = stored.get(stats_id, Counter())
+        if want != have:
+            drift[stats_id] = {'expected': dict(want), 'stored': dict(have)}
+    return drift
+
+def rebuild_sample_stats() -> int:
+    """Replace the stats collection with a full recount; returns the number of documents"""
+    totals = compute_sample_stats()
+    now = datetime.now()
+    for stats_id, counters in totals.items():
+        document = {'updated_date': now}
+        if stats_id.startswith(RUN_STATS_PREFIX):
+            document['sequencing_run_id'] = stats_id[len(RUN_STATS_PREFIX):]
+        for key, value in (+counters).items():
+            if '.' in key:
+                group, name = key.split('.', 1)
+                document.setdefault(group, {})[name] = value
+            else:
+                document[key] = value
+        db.sample_stats.replace_one({'_id': stats_id}, document, upsert=True)
+    db.sample_stats.delete_many({'_id': {'$nin': list(totals)}})
+    return len(totals)
+
+def init_sample_stats():
+    """Build the stats collection once for databases that predate it"""
+    if db.sample_stats.find_one({'_id': ALL_STATS_ID}) is None and db.samples.find_one({}, {'_id': 1}):
+        count = rebuild_sample_stats()
+        print(f"Initialized sample stats ({count} documents)")
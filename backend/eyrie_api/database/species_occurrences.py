@@ -0,0 +1,63 @@
+from typing import Any, Dict, List, Optional
+
+from .connection import db
+from .taxonomy import COLUMNAR_ENCODING, expand_taxonomic_data
+
+# Sample fields needed to derive species occurrences
+OCCURRENCE_SOURCE_FIELDS = ['sample_id', 'sequencing_run_id', 'taxonomic_data']
+
+def occurrences_from_sample(sample: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """One occurrence row per classified species in a sample"""
+    hits = expand_taxonomic_data(sample.get('taxonomic_data') or {}).get('hits') or []
+    return [
+        {
+            'tax_id': str(hit['tax_id']) if hit.get('tax_id') is not None else None,
+            'species': hit.get('species'),
+            'sample_id': sample['sample_id'],
+            'sequencing_run_id': sample.get('sequencing_run_id'),
+            'abundance': hit.get('abundance', 0)
+        }
+        for hit in hits
+        if hit.get('species')
+    ]
+
+def replace_sample_occurrences(sample: Dict[str, Any]):
+    """Replace the occurrence rows of one sample with those of its current taxonomic data"""
+    db.species_occurrences.delete_many({'sample_id': sample['sample_id']})
+    occurrences = occurrences_from_sample(sample)
+    if occurrences:
+        db.species_occurrences.insert_many(occurrences)
+
+def find_species_occurrences(tax_id: Optional[str] = None, species: Optional[str] = None,
+                             min_abundance: float = 0, limit: int = 100) -> List[Dict[str, Any]]:
+    """Samples containing a species (by tax_id or name) above an abundance, most abundant first"""
+    query: Dict[str, Any] = {'abundance': {'$gte': min_abundance}}
+    if tax_id is not None:
+        query['tax_id'] = str(tax_id)
+    else:
+        query['species'] = species
+
+    cursor = db.species_occurrences.find(query, {'_id': 0}).sort('abundance', -1).limit(limit)
+    return list(cursor)
+
+def rebuild_species_occurrences() -> int:
+    """Regenerate all occurrence rows from the samples collection; returns the row count"""
+    db.species_occurrences.delete_many({})
+    total = 0
+    projection = {field: 1 for field in OCCURRENCE_SOURCE_FIELDS}
+    for sample in db.samples.find({}, projection):
+        occurrences = occurrences_from_sample(sample)
+        if occurrences:
+            db.species_occurrences.insert_many(occurrences)
+            total += len(occurrences)
+    return total
+
+def init_species_occurrences():
+    """Build the occurrence index once for databases that predate it"""
+    has_hits = db.samples.find_one({'$or': [
+        {'taxonomic_data.hits.0': {'$exists': True}},
+        {'taxonomic_data.encoding': COLUMNAR_ENCODING}
+    ]}, {'_id': 1})
+    if has_hits and db.species_occurrences.find_one({}, {'_id': 1}) is None:
+        total = rebuild_species_occurrences()
+        print(f"Initialized species occurrences ({total} rows)")
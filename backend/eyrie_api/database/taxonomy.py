@@ -0,0 +1,172 @@
+import base64
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from pymongo import ReturnDocument, UpdateOne
+
+from .connection import db
+from ..config.settings import TAXONOMY_CACHE_SIZE
+
+# Lineage ranks stored per taxon in the shared taxonomy collection
+LINEAGE_RANKS = ['genus', 'family', 'order', 'class', 'phylum', 'superkingdom']
+
+# taxonomic_data.encoding value for hits stored as parallel arrays
+COLUMNAR_ENCODING = 'columnar-v1'
+
+# Float32 columns of a columnar encoding, besides the tax_ids list
+COLUMNAR_FLOAT_FIELDS = ['abundance', 'estimated_counts', 'absolute_abundance']
+
+# taxonomy_state document counting lineage changes, shared by every worker
+TAXONOMY_VERSION_ID = 'lineages'
+
+class LineageCache:
+    """Thread-safe in-process LRU of taxonomy entries keyed by tax_id.
+
+    Entries belong to one taxonomy version; syncing to a newer version (written
+    by upsert_taxa in any worker) empties the cache.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.version: Optional[int] = None
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def sync(self, version: int):
+        with self._lock:
+            if version != self.version:
+                self._entries.clear()
+                self.version = version
+
+    def get(self, tax_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(tax_id)
+            if entry is not None:
+                self._entries.move_to_end(tax_id)
+            return entry
+
+    def put(self, tax_id: str, entry: Dict[str, Any], version: Optional[int] = None):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if version is not None and version != self.version:
+                # Read before a taxonomy change another thread has synced to
+                return
+            self._entries[tax_id] = entry
+            self._entries.move_to_end(tax_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, tax_id: str):
+        with self._lock:
+            self._entries.pop(tax_id, None)
+
+lineage_cache = LineageCache(TAXONOMY_CACHE_SIZE)
+
+def get_taxonomy_version() -> int:
+    """Number of upsert_taxa calls that changed a lineage, across all workers"""
+    state = db.taxonomy_state.find_one({'_id': TAXONOMY_VERSION_ID}, {'version': 1})
+    return state['version'] if state else 0
+
+def upsert_taxa(taxa: Iterable[Dict[str, Any]]) -> int:
+    """Insert or refresh taxonomy entries keyed by tax_id; returns the number received"""
+    entries = {}
+    for taxon in taxa:
+        entry = {'species': taxon.get('species')}
+        entry.update({rank: value for rank, value in (taxon.get('lineage') or {}).items() if rank in LINEAGE_RANKS})
+        entries[str(taxon['tax_id'])] = entry
+
+    if not entries:
+        return 0
+    existing = {taxon['_id']: taxon for taxon in db.taxonomy.find({'_id': {'$in': list(entries)}})}
+    changed = [
+        tax_id for tax_id, entry in entries.items()
+        if tax_id not in existing or any(existing[tax_id].get(key) != value for key, value in entry.items())
+    ]
+    if not changed:
+        return len(entries)
+
+    db.taxonomy.bulk_write(
+        [UpdateOne({'_id': tax_id}, {'$set': entries[tax_id]}, upsert=True) for tax_id in changed],
+        ordered=False
+    )
+    # Other workers drop their cached lineages once they see the new version
+    version = db.taxonomy_state.find_one_and_update(
+        {'_id': TAXONOMY_VERSION_ID}, {'$inc': {'version': 1}},
+        upsert=True, return_document=ReturnDocument.AFTER
+    )['version']
+    lineage_cache.sync(version)
+
+    # Memoized rank rollups of samples with these taxa were built from the previous lineages
+    affected = db.species_occurrences.distinct('sample_id', {'tax_id': {'$in': changed}})
+    if affected:
+        db.rank_rollups.delete_many({'_id': {'$in': affected}})
+    return len(entries)
+
+def get_taxa(tax_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Taxonomy entries for the given tax_ids, keyed by tax_id; served from the LRU when cached"""
+    version = get_taxonomy_version()
+    lineage_cache.sync(version)
+
+    taxa = {}
+    missing = []
+    for tax_id in set(tax_ids):
+        entry = lineage_cache.get(tax_id)
+        if entry is None:
+            missing.append(tax_id)
+        else:
+            taxa[tax_id] = entry
+
+    if missing:
+        for taxon in db.taxonomy.find({'_id': {'$in': missing}}):
+            lineage_cache.put(taxon['_id'], taxon, version)
+            taxa[taxon['_id']] = taxon
+    return taxa
+
+def decode_float32(encoded: str) -> List[float]:
+    """Decode a base64 little-endian float32 column"""
+    values = array('f')
+    values.frombytes(base64.b64decode(encoded))
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values.tolist()
+
+def is_columnar(taxonomic_data: Any) -> bool:
+    """Whether taxonomic data holds hits as columnar arrays rather than a hits list"""
+    return isinstance(taxonomic_data, dict) and taxonomic_data.get('encoding') == COLUMNAR_ENCODING
+
+def expand_taxonomic_data(taxonomic_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Expand columnar hits into the hits list of dicts, joining names from the taxonomy collection"""
+    if not is_columnar(taxonomic_data):
+        return taxonomic_data
+
+    tax_ids = taxonomic_data.get('tax_ids', [])
+    columns = {
+        field: decode_float32(taxonomic_data[field])
+        for field in COLUMNAR_FLOAT_FIELDS
+        if taxonomic_data.get(field)
+    }
+    taxa = get_taxa(tax_ids)
+
+    hits = []
+    for i, tax_id in enumerate(tax_ids):
+        taxon = taxa.get(tax_id, {})
+        hit = {
+            'tax_id': tax_id,
+            'species': taxon.get('species') or tax_id,
+            'genus': taxon.get('genus', ''),
+            'family': taxon.get('family', ''),
+        }
+        for field, values in columns.items():
+            hit[field] = round(values[i], 4)
+        hits.append(hit)
+
+    expanded = {
+        key: value for key, value in taxonomic_data.items()
+        if key not in COLUMNAR_FLOAT_FIELDS and key not in ('tax_ids', 'encoding')
+    }
+    expanded['hits'] = hits
+    return expanded
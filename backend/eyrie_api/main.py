@@ -6,8 +6,10 @@ from eyrie_api.config.settings import (
     APP_TITLE, APP_HOST, APP_PORT,
     CORS_ORIGINS, CORS_CREDENTIALS, CORS_METHODS, CORS_HEADERS
 )
-from eyrie_api.database.connection import init_default_user
-from eyrie_api.routes import admin, samples, frontend, auth
+from eyrie_api.database.connection import init_default_user, init_indexes
+from eyrie_api.database.sample_stats import init_sample_stats
+from eyrie_api.database.species_occurrences import init_species_occurrences
+from eyrie_api.routes import admin, samples, frontend, auth, taxonomy, runs, pipeline_runs, artifacts
 
 app = FastAPI(title=APP_TITLE)
 
@@ -20,13 +22,20 @@ app.add_middleware(
     allow_headers=CORS_HEADERS,
 )
 
-# Initialize default user on startup
+# Initialize default user, indexes and derived collections on startup
 init_default_user()
+init_indexes()
+init_sample_stats()
+init_species_occurrences()
 
 # Include routers
 app.include_router(auth.router)
 app.include_router(admin.router)
 app.include_router(samples.router)
+app.include_router(taxonomy.router)
+app.include_router(runs.router)
+app.include_router(pipeline_runs.router)
+app.include_router(artifacts.router)
 app.include_router(frontend.router)
 
 # Mount static file directories
@@ -0,0 +1,51 @@
+"""Maintenance commands for the Eyrie API database.
+
+Usage:
+    python -m eyrie_api.manage rebuild-stats [--check]
+    python -m eyrie_api.manage rebuild-occurrences
+"""
+import argparse
+import sys
+
+from eyrie_api.database.sample_stats import find_stats_drift, rebuild_sample_stats
+from eyrie_api.database.species_occurrences import rebuild_species_occurrences
+
+def rebuild_stats(check: bool = False) -> int:
+    """Recount sample_stats from the samples collection, or only report drift"""
+    drift = find_stats_drift()
+    for stats_id, counters in sorted(drift.items()):
+        print(f"Drift in {stats_id}: expected {counters['expected']}, stored {counters['stored']}")
+
+    if check:
+        print(f"{len(drift)} stats document(s) out of date")
+        return 1 if drift else 0
+
+    count = rebuild_sample_stats()
+    print(f"Rebuilt {count} stats document(s)")
+    return 0
+
+def rebuild_occurrences() -> int:
+    """Regenerate the species_occurrences collection from the samples collection"""
+    total = rebuild_species_occurrences()
+    print(f"Rebuilt {total} species occurrence(s)")
+    return 0
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='eyrie-api-manage', description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    stats_parser = commands.add_parser('rebuild-stats', help='Recount the sample_stats collection')
+    stats_parser.add_argument('--check', action='store_true',
+                              help='Only report counters that differ from a full recount')
+
+    commands.add_parser('rebuild-occurrences', help='Regenerate the species_occurrences collection')
+
+    args = parser.parse_args(argv)
+    if args.command == 'rebuild-stats':
+        return rebuild_stats(check=args.check)
+    if args.command == 'rebuild-occurrences':
+        return rebuild_occurrences()
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
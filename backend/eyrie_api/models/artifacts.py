@@ -0,0 +1,8 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+
+class ArtifactUploadCreate(BaseModel):
+    sha256: str = Field(..., regex=r'^[0-9a-f]{64}$')
+    size: int = Field(..., ge=0)
+    suffix: str = Field('', regex=r'^(\.[A-Za-z0-9]{1,10})?$')  # File extension kept on the blob
+    chunk_size: Optional[int] = None  # Proposed by the client; the server clamps it
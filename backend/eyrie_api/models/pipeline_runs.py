@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class PipelineTask(BaseModel):
+    task_id: str
+    name: str
+    process: str
+    tag: Optional[str] = None
+    status: str
+    exit: Optional[int] = None
+    submit: Optional[str] = None
+    duration: Optional[float] = None  # Seconds
+    realtime: Optional[float] = None  # Seconds
+    cpu_percent: Optional[float] = None
+    peak_rss: Optional[int] = None  # Bytes
+    peak_vmem: Optional[int] = None  # Bytes
+    rchar: Optional[int] = None  # Bytes
+    wchar: Optional[int] = None  # Bytes
+
+class PipelineRunCreate(BaseModel):
+    pipeline_run_id: str
+    sequencing_run_id: str
+    trace_file: str
+    started: Optional[str] = None
+    tasks: List[PipelineTask] = []
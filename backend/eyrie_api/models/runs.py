@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+
+class RunMatrix(BaseModel):
+    """Taxa x samples matrix at one rank, stored column-wise"""
+    taxa: Dict[str, List[str]]  # Lineage column name -> value per taxon row
+    abundance: List[List[float]]  # One column per sample, relative abundance in percent
+    counts: Optional[List[List[float]]] = None  # One column per sample, estimated read counts
+
+class RunCreate(BaseModel):
+    sequencing_run_id: str
+    classification_type: Optional[str] = None
+    samples: List[str]  # Sample IDs in matrix column order
+    matrices: Dict[str, RunMatrix]  # Rank -> matrix
@@ -31,6 +31,10 @@ class SampleCreate(BaseModel):
     flagged_top_hits: List[str] = []
     nanoplot: Optional[Dict[str, Any]] = None
     spike: Optional[str] = None
+    spike_qc: Optional[Dict[str, Any]] = None
+    multiqc: Optional[Dict[str, Any]] = None
+    fastqc: Optional[Dict[str, Any]] = None
+    nanoplot_data: Optional[Dict[str, Any]] = None
 
 class SampleUpdate(BaseModel):
     sample_name: Optional[str] = None
@@ -48,3 +52,7 @@ class SampleUpdate(BaseModel):
     flagged_top_hits: Optional[List[str]] = None
     nanoplot: Optional[Dict[str, Any]] = None
     spike: Optional[str] = None
+    spike_qc: Optional[Dict[str, Any]] = None
+    multiqc: Optional[Dict[str, Any]] = None
+    fastqc: Optional[Dict[str, Any]] = None
+    nanoplot_data: Optional[Dict[str, Any]] = None
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+from typing import Dict
+
+class TaxonEntry(BaseModel):
+    tax_id: str
+    species: str
+    lineage: Dict[str, str] = {}
@@ -0,0 +1,96 @@
+from fastapi import APIRouter, HTTPException, Depends, Request
+from starlette.concurrency import run_in_threadpool
+from eyrie_api.models.artifacts import ArtifactUploadCreate
+from eyrie_api.database.artifact_uploads import (
+    start_upload, find_upload, stored_blob, chunk_length, write_chunk, mark_chunk_received, complete_upload
+)
+from eyrie_api.routes.auth import require_admin_or_uploader
+from eyrie_api.config.settings import ARTIFACT_MAX_SIZE
+import hashlib
+
+router = APIRouter(prefix="/api/artifacts", tags=["artifacts"])
+
+@router.post("/uploads")
+async def create_upload(
+    upload: ArtifactUploadCreate,
+    current_user: dict = Depends(require_admin_or_uploader)
+):
+    """Start or resume a chunked upload; returns the chunk size and chunks already received"""
+    if upload.size > ARTIFACT_MAX_SIZE:
+        raise HTTPException(status_code=413, detail=f"Artifact larger than {ARTIFACT_MAX_SIZE} bytes")
+    try:
+        return await run_in_threadpool(start_upload, upload.sha256, upload.size, upload.suffix, upload.chunk_size)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/uploads/{upload_id}")
+async def get_upload(upload_id: str, current_user: dict = Depends(require_admin_or_uploader)):
+    """Progress of an upload"""
+    upload = find_upload(upload_id)
+    if not upload:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return upload
+
+@router.put("/uploads/{upload_id}/chunks/{index}")
+async def put_chunk(
+    upload_id: str,
+    index: int,
+    request: Request,
+    current_user: dict = Depends(require_admin_or_uploader)
+):
+    """
+    Store one chunk at its offset in the partial file.
+
+    The chunk (at most the upload's chunk size) is buffered and written only
+    once it matches its X-Chunk-SHA256 header, so a corrupt chunk is neither
+    recorded nor overwrites one already received, and can simply be sent again.
+    If another client already stored the same content, the stored blob is
+    returned with complete set.
+    """
+    upload = find_upload(upload_id)
+    if not upload:
+        stored = stored_blob(upload_id)
+        if stored:
+            return {'upload_id': upload_id, 'index': index, 'received': True, **stored}
+        raise HTTPException(status_code=404, detail="Upload not found")
+    if not 0 <= index < upload['chunks']:
+        raise HTTPException(status_code=400, detail=f"Chunk index must be below {upload['chunks']}")
+    expected_checksum = request.headers.get('x-chunk-sha256')
+    if not expected_checksum:
+        raise HTTPException(status_code=400, detail="X-Chunk-SHA256 header required")
+
+    expected_length = chunk_length(upload, index)
+    data = bytearray()
+    async for piece in request.stream():
+        if len(data) + len(piece) > expected_length:
+            raise HTTPException(status_code=400, detail=f"Chunk {index} must be {expected_length} bytes")
+        data += piece
+
+    if len(data) != expected_length:
+        raise HTTPException(status_code=400, detail=f"Chunk {index} must be {expected_length} bytes")
+    if hashlib.sha256(data).hexdigest() != expected_checksum.lower():
+        raise HTTPException(status_code=422, detail=f"Chunk {index} checksum mismatch")
+
+    try:
+        await run_in_threadpool(write_chunk, upload_id, index * upload['chunk_size'], bytes(data))
+    except FileNotFoundError:
+        # Completed by another client while this chunk was in flight
+        stored = stored_blob(upload_id)
+        if stored:
+            return {'upload_id': upload_id, 'index': index, 'received': True, **stored}
+        raise HTTPException(status_code=404, detail="Upload not found")
+
+    mark_chunk_received(upload_id, index)
+    return {'upload_id': upload_id, 'index': index, 'received': True}
+
+@router.post("/uploads/{upload_id}/complete")
+async def finish_upload(upload_id: str, current_user: dict = Depends(require_admin_or_uploader)):
+    """Verify the whole file and add it to the content-addressed store"""
+    try:
+        return await run_in_threadpool(complete_upload, upload_id)
+    except LookupError:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
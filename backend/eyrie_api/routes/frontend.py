@@ -1,13 +1,24 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import HTMLResponse, FileResponse
+from eyrie_api.config.settings import DATA_DIR
 import os
 
 router = APIRouter(tags=["frontend"])
 
+# Content-addressed blobs never change, so clients may cache them forever
+ARTIFACT_BLOBS_PREFIX = 'cas/blobs/'
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
 @router.get("/data/{file_path:path}")
 async def serve_data_file(file_path: str):
-    file_full_path = f"/app/data/{file_path}"
+    file_full_path = os.path.join(DATA_DIR, file_path)
     if os.path.exists(file_full_path):
+        if file_path.startswith(ARTIFACT_BLOBS_PREFIX):
+            digest = os.path.basename(file_path).split('.', 1)[0]
+            return FileResponse(file_full_path, headers={
+                'Cache-Control': IMMUTABLE_CACHE_CONTROL,
+                'ETag': f'"{digest}"'
+            })
         return FileResponse(file_full_path)
     raise HTTPException(status_code=404, detail="File not found")
 
@@ -0,0 +1,68 @@
+from fastapi import APIRouter, HTTPException, Depends
+from typing import Optional
+from eyrie_api.models.pipeline_runs import PipelineRunCreate
+from eyrie_api.database.pipeline_runs import (
+    upsert_pipeline_run, get_pipeline_runs, find_pipeline_run, aggregate_process_stats
+)
+from eyrie_api.routes.auth import require_admin_or_uploader
+from eyrie_api.utils.json_encoder import JSONEncoder
+import json
+
+router = APIRouter(prefix="/api/pipeline-runs", tags=["pipeline-runs"])
+
+@router.get("")
+async def list_pipeline_runs(sequencing_run_id: Optional[str] = None):
+    """List pipeline runs with task summaries"""
+    try:
+        return json.loads(JSONEncoder().encode(get_pipeline_runs(sequencing_run_id)))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/stats")
+async def pipeline_process_stats(
+    sequencing_run_id: Optional[str] = None,
+    since: Optional[str] = None,
+    by_run: bool = False
+):
+    """Time and memory per process over completed tasks; by_run gives one row per process and run"""
+    try:
+        return aggregate_process_stats(sequencing_run_id, since, by_run)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/{pipeline_run_id}")
+async def get_pipeline_run(pipeline_run_id: str):
+    """Get a pipeline run with all its tasks"""
+    try:
+        pipeline_run = find_pipeline_run(pipeline_run_id)
+        if not pipeline_run:
+            raise HTTPException(status_code=404, detail="Pipeline run not found")
+        return json.loads(JSONEncoder().encode(pipeline_run))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.put("/{pipeline_run_id}")
+async def upsert_pipeline_run_endpoint(
+    pipeline_run_id: str,
+    run_data: PipelineRunCreate,
+    current_user: dict = Depends(require_admin_or_uploader)
+):
+    """Create or replace a pipeline run's execution trace (requires admin or uploader role)"""
+    try:
+        if run_data.pipeline_run_id != pipeline_run_id:
+            raise HTTPException(
+                status_code=400,
+                detail="Pipeline run ID in URL must match pipeline_run_id in data"
+            )
+        upsert_pipeline_run(pipeline_run_id, run_data.dict())
+        return {
+            "message": f"Pipeline run '{pipeline_run_id}' stored successfully",
+            "pipeline_run_id": pipeline_run_id,
+            "tasks": len(run_data.tasks)
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,62 @@
+from fastapi import APIRouter, HTTPException, Depends
+from typing import Optional
+from eyrie_api.models.runs import RunCreate
+from eyrie_api.database.run_operations import upsert_run, get_runs, find_run
+from eyrie_api.routes.auth import require_admin_or_uploader
+from eyrie_api.utils.json_encoder import JSONEncoder
+import json
+
+router = APIRouter(prefix="/api/runs", tags=["runs"])
+
+@router.get("")
+async def list_runs():
+    """List sequencing runs with run-level matrices (without the matrices)"""
+    try:
+        return json.loads(JSONEncoder().encode(get_runs()))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/{run_id}")
+async def get_run(run_id: str, rank: Optional[str] = None):
+    """Get a run with its taxa x samples matrices; ?rank= limits it to one rank"""
+    try:
+        run = find_run(run_id, rank)
+        if not run:
+            raise HTTPException(status_code=404, detail="Run not found")
+        if rank and rank not in run.get('matrices', {}):
+            raise HTTPException(status_code=404, detail=f"No {rank} matrix for run '{run_id}'")
+        return json.loads(JSONEncoder().encode(run))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.put("/{run_id}")
+async def upsert_run_endpoint(
+    run_id: str,
+    run_data: RunCreate,
+    current_user: dict = Depends(require_admin_or_uploader)
+):
+    """Create or replace a run's combined matrices (requires admin or uploader role)"""
+    try:
+        if run_data.sequencing_run_id != run_id:
+            raise HTTPException(
+                status_code=400,
+                detail="Run ID in URL must match sequencing_run_id in data"
+            )
+        for rank, matrix in run_data.matrices.items():
+            columns = [matrix.abundance] + ([matrix.counts] if matrix.counts is not None else [])
+            if any(len(values) != len(run_data.samples) for values in columns):
+                raise HTTPException(status_code=400, detail=f"{rank} matrix must have one column per sample")
+
+        was_created = upsert_run(run_id, run_data.dict())
+        action = "created" if was_created else "updated"
+        return {
+            "message": f"Run '{run_id}' {action} successfully",
+            "sequencing_run_id": run_id,
+            "created": was_created
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,35 +1,141 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Optional
 from eyrie_api.models.samples import QCUpdate, CommentUpdate, SampleCreate, SampleUpdate, SpeciesFlagsUpdate
 from eyrie_api.database.sample_operations import (
     get_all_samples, find_sample, update_sample_qc, update_sample_comment,
-    create_sample, update_sample, upsert_sample, update_sample_species_flags
+    create_sample, update_sample, upsert_sample, update_sample_species_flags,
+    get_samples_page, get_samples_version, find_sample_nanoplot_data
 )
+from eyrie_api.database.sample_events import sample_event_hub
+from eyrie_api.database.sample_stats import get_sample_stats
+from eyrie_api.database.species_occurrences import find_species_occurrences
+from eyrie_api.database.taxonomy import expand_taxonomic_data
+from eyrie_api.database.rank_rollups import ROLLUP_RANKS, get_rank_rollup
 from eyrie_api.routes.auth import require_admin_or_uploader
 from eyrie_api.utils.json_encoder import JSONEncoder
+from eyrie_api.utils.etag import make_listing_etag, etag_matches
+from eyrie_api.config.settings import SAMPLE_EVENTS_HEARTBEAT
+import asyncio
 import json
 
 router = APIRouter(prefix="/api/samples", tags=["samples"])
 
 @router.get("")
-async def get_samples():
+async def get_samples(request: Request, skip: int = 0, limit: Optional[int] = None):
+    """List samples; with a limit, return one projected page for the listing table"""
     try:
-        samples = get_all_samples()
-        return json.loads(JSONEncoder().encode(samples))
+        version = get_samples_version()
+        etag = make_listing_etag(version, skip, limit)
+        headers = {
+            'ETag': etag,
+            'Cache-Control': 'no-cache',
+            'X-Total-Count': str(version['count'])
+        }
+        if etag_matches(request.headers.get('if-none-match'), etag):
+            return Response(status_code=304, headers=headers)
+
+        if limit is None:
+            samples = get_all_samples()
+        else:
+            samples = get_samples_page(max(skip, 0), max(limit, 1))
+        return JSONResponse(json.loads(JSONEncoder().encode(samples)), headers=headers)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/stats")
+async def sample_stats():
+    """Dashboard counters (QC, spike detection, contamination) overall and per run"""
+    try:
+        return json.loads(JSONEncoder().encode(get_sample_stats()))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/occurrences")
+async def species_occurrences(
+    tax_id: Optional[str] = None,
+    species: Optional[str] = None,
+    min_abundance: float = 0,
+    limit: int = 100
+):
+    """Samples containing a species above min_abundance (percent), most abundant first"""
+    if tax_id is None and not species:
+        raise HTTPException(status_code=400, detail="Either tax_id or species is required")
+    try:
+        occurrences = find_species_occurrences(tax_id, species, min_abundance, min(max(limit, 1), 1000))
+        return {'count': len(occurrences), 'occurrences': occurrences}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/events")
+async def sample_events(request: Request, sample_id: Optional[str] = None):
+    """Stream compact sample changes (sample_id plus changed fields) as Server-Sent Events"""
+    queue = sample_event_hub.subscribe()
+
+    async def event_stream():
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=SAMPLE_EVENTS_HEARTBEAT)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if sample_id and event['sample_id'] != sample_id:
+                    continue
+                yield f"event: sample\ndata: {JSONEncoder().encode(event)}\n\n"
+        finally:
+            sample_event_hub.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @router.get("/{sample_id}")
-async def get_sample(sample_id: str):
+async def get_sample(sample_id: str, expand: bool = True):
+    """Get a sample; columnar taxonomic hits are expanded unless expand=false"""
     try:
         sample = find_sample(sample_id)
         if not sample:
             raise HTTPException(status_code=404, detail="Sample not found")
+        if expand and sample.get('taxonomic_data'):
+            sample['taxonomic_data'] = expand_taxonomic_data(sample['taxonomic_data'])
         return json.loads(JSONEncoder().encode(sample))
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/{sample_id}/rollup")
+async def get_sample_rollup(sample_id: str, rank: str = 'genus'):
+    """Sample abundances summed at a taxonomic rank; memoized until the sample changes"""
+    if rank not in ROLLUP_RANKS:
+        raise HTTPException(status_code=400, detail=f"Invalid rank, expected one of: {', '.join(ROLLUP_RANKS)}")
+    try:
+        rollup = get_rank_rollup(sample_id, rank)
+        if rollup is None:
+            raise HTTPException(status_code=404, detail="Sample not found")
+        return rollup
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/{sample_id}/nanoplot-data")
+async def get_sample_nanoplot_data(sample_id: str):
+    """Downsampled NanoPlot chart series per stage, for rendering without the HTML plots"""
+    try:
+        sample = find_sample_nanoplot_data(sample_id)
+        if not sample:
+            raise HTTPException(status_code=404, detail="Sample not found")
+        return {'sample_id': sample_id, **(sample.get('nanoplot_data') or {})}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.post("")
 async def create_new_sample(
     sample_data: SampleCreate, 
@@ -0,0 +1,40 @@
+from fastapi import APIRouter, HTTPException, Depends
+from typing import List
+from eyrie_api.models.taxonomy import TaxonEntry
+from eyrie_api.database.taxonomy import upsert_taxa, get_taxa
+from eyrie_api.routes.auth import require_admin_or_uploader
+
+router = APIRouter(prefix="/api/taxonomy", tags=["taxonomy"])
+
+@router.post("")
+async def upload_taxa(
+    taxa: List[TaxonEntry],
+    current_user: dict = Depends(require_admin_or_uploader)
+):
+    """Insert or refresh shared taxonomy entries (requires admin or uploader role)"""
+    try:
+        count = upsert_taxa(taxon.dict() for taxon in taxa)
+        return {'success': True, 'count': count}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("")
+async def lookup_taxa(tax_ids: str):
+    """Batch lineage lookup for a comma-separated list of tax_ids"""
+    try:
+        ids = [tax_id.strip() for tax_id in tax_ids.split(',') if tax_id.strip()]
+        return get_taxa(ids[:1000])
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/{tax_id}")
+async def get_taxon(tax_id: str):
+    try:
+        taxon = get_taxa([tax_id]).get(tax_id)
+        if not taxon:
+            raise HTTPException(status_code=404, detail="Taxon not found")
+        return taxon
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,14 @@
+import hashlib
+from typing import Any, Dict, Optional
+
+def make_listing_etag(version: Dict[str, Any], skip: int = 0, limit: Optional[int] = None) -> str:
+    """Build a quoted ETag for a samples listing from the collection version and page"""
+    seed = f"{version.get('last_updated')}:{version.get('count')}:{skip}:{limit}"
+    return '"' + hashlib.sha1(seed.encode()).hexdigest() + '"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match request header against an ETag"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in candidates or etag in candidates or f"W/{etag}" in candidates
@@ -0,0 +1,18 @@
+"""Run the database layer against an in-memory mongomock server."""
+
+import mongomock
+import pymongo
+import pytest
+
+# Must happen before eyrie_api.database.connection creates its client
+pymongo.MongoClient = mongomock.MongoClient
+
+from eyrie_api.database.connection import db  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def mongo():
+    """Empty database for every test"""
+    for name in db.list_collection_names():
+        db.drop_collection(name)
+    return db
@@ -0,0 +1,156 @@
+import hashlib
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from eyrie_api.database import artifact_uploads
+from eyrie_api.routes import artifacts
+from eyrie_api.routes.auth import require_admin_or_uploader
+
+CHUNK_SIZE = artifact_uploads.MIN_CHUNK_SIZE
+CONTENT = os.urandom(2 * CHUNK_SIZE + 1000)  # Two full chunks and a short last one
+SHA256 = hashlib.sha256(CONTENT).hexdigest()
+
+
+def chunk(index):
+    return CONTENT[index * CHUNK_SIZE:(index + 1) * CHUNK_SIZE]
+
+
+def checksum(data):
+    return {'X-Chunk-SHA256': hashlib.sha256(data).hexdigest()}
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifact_uploads, 'DATA_DIR', str(tmp_path))
+    app = FastAPI()
+    app.include_router(artifacts.router)
+    app.dependency_overrides[require_admin_or_uploader] = lambda: {'username': 'uploader', 'role': 'uploader'}
+    return TestClient(app)
+
+
+@pytest.fixture
+def upload_id(client):
+    response = client.post('/api/artifacts/uploads', json={
+        'sha256': SHA256, 'size': len(CONTENT), 'suffix': '.HTML', 'chunk_size': CHUNK_SIZE
+    })
+    assert response.status_code == 200
+    assert response.json()['chunks'] == 3
+    return response.json()['upload_id']
+
+
+def put(client, upload_id, index, data, headers=None):
+    return client.put(f'/api/artifacts/uploads/{upload_id}/chunks/{index}', content=data,
+                      headers=checksum(data) if headers is None else headers)
+
+
+def received(client, upload_id):
+    return client.get(f'/api/artifacts/uploads/{upload_id}').json()['received']
+
+
+def test_chunks_assemble_into_the_blob(client, upload_id, tmp_path):
+    for index in (2, 0, 1):  # Any order; each chunk lands at its own offset
+        assert put(client, upload_id, index, chunk(index)).json() == {
+            'upload_id': upload_id, 'index': index, 'received': True
+        }
+
+    response = client.post(f'/api/artifacts/uploads/{upload_id}/complete')
+    assert response.status_code == 200
+    blob = response.json()['blob']
+    assert blob == f'cas/blobs/{SHA256[:2]}/{SHA256}.html'
+    assert (tmp_path / blob).read_bytes() == CONTENT
+
+
+@pytest.mark.parametrize('index, data', [
+    (0, chunk(0)[:-1]),        # Short full chunk
+    (0, chunk(0) + b'x'),      # Longer than the chunk size
+    (2, chunk(2) + b'x'),      # Last chunk longer than the rest of the file
+])
+def test_wrong_length_is_rejected(client, upload_id, index, data):
+    response = put(client, upload_id, index, data)
+
+    assert response.status_code == 400
+    assert 'bytes' in response.json()['detail']
+    assert received(client, upload_id) == []
+
+
+def test_checksum_mismatch_is_not_recorded_and_can_be_resent(client, upload_id):
+    response = put(client, upload_id, 1, chunk(1), headers=checksum(b'other'))
+    assert response.status_code == 422
+    assert received(client, upload_id) == []
+
+    assert put(client, upload_id, 1, chunk(1)).status_code == 200
+    assert received(client, upload_id) == [1]
+
+
+def test_chunk_requests_are_validated(client, upload_id):
+    assert put(client, upload_id, 3, chunk(0)).status_code == 400
+    assert put(client, upload_id, -1, chunk(0)).status_code == 400
+    assert put(client, upload_id, 0, chunk(0), headers={}).status_code == 400
+    assert put(client, 'unknown', 0, chunk(0)).status_code == 404
+
+
+def test_restarting_an_upload_resumes_it(client, upload_id):
+    put(client, upload_id, 0, chunk(0))
+    put(client, upload_id, 2, chunk(2))
+
+    response = client.post('/api/artifacts/uploads', json={
+        'sha256': SHA256, 'size': len(CONTENT), 'suffix': '.html', 'chunk_size': CHUNK_SIZE
+    })
+    assert response.json()['upload_id'] == upload_id
+    assert response.json()['received'] == [0, 2]
+
+    # Completing early reports the gap instead of storing a partial file
+    assert client.post(f'/api/artifacts/uploads/{upload_id}/complete').status_code == 409
+
+    put(client, upload_id, 1, chunk(1))
+    assert client.post(f'/api/artifacts/uploads/{upload_id}/complete').status_code == 200
+
+    response = client.post('/api/artifacts/uploads', json={
+        'sha256': SHA256, 'size': len(CONTENT), 'suffix': '.html', 'chunk_size': CHUNK_SIZE
+    })
+    assert response.json()['complete'] is True
+
+
+def test_corrupt_assembly_restarts_the_upload(client, upload_id):
+    put(client, upload_id, 0, chunk(0))
+    put(client, upload_id, 1, chunk(1))
+    other = bytes(len(chunk(2)))  # Right length, wrong content, matching chunk checksum
+    put(client, upload_id, 2, other)
+
+    response = client.post(f'/api/artifacts/uploads/{upload_id}/complete')
+    assert response.status_code == 409
+    assert 'sha256' in response.json()['detail']
+    assert client.get(f'/api/artifacts/uploads/{upload_id}').status_code == 404
+
+
+def test_second_pusher_of_the_same_content_gets_the_blob(client, upload_id, tmp_path):
+    # Both pushers started the upload; the first one finishes it
+    for index in range(3):
+        put(client, upload_id, index, chunk(index))
+    blob = client.post(f'/api/artifacts/uploads/{upload_id}/complete').json()['blob']
+
+    response = put(client, upload_id, 1, chunk(1))
+    assert response.status_code == 200
+    assert response.json()['complete'] is True
+    assert response.json()['blob'] == blob
+
+    response = client.post(f'/api/artifacts/uploads/{upload_id}/complete')
+    assert response.status_code == 200
+    assert response.json() == {'sha256': SHA256, 'blob': blob, 'complete': True}
+
+
+def test_unknown_upload_cannot_be_completed(client):
+    assert client.post(f'/api/artifacts/uploads/{SHA256}.html/complete').status_code == 404
+
+
+def test_corrupt_resend_keeps_the_accepted_chunk(client, upload_id):
+    for index in range(3):
+        put(client, upload_id, index, chunk(index))
+
+    corrupt = bytes(len(chunk(0)))
+    assert put(client, upload_id, 0, corrupt, headers=checksum(chunk(0))).status_code == 422
+
+    assert client.post(f'/api/artifacts/uploads/{upload_id}/complete').status_code == 200
@@ -0,0 +1,69 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from eyrie_api.database import sample_events
+from eyrie_api.database.sample_events import SampleEventHub
+
+
+def poll_events(monkeypatch, mongo, steps):
+    """Run the polling fallback, applying each step's writes between polls"""
+    monkeypatch.setattr(sample_events, 'SAMPLE_EVENTS_POLL_INTERVAL', 0.01)
+
+    async def run():
+        hub = SampleEventHub()
+        queue = asyncio.Queue()
+        hub._subscribers.add(queue)
+        task = asyncio.create_task(hub._poll())
+        batches = []
+        for step in steps:
+            await asyncio.sleep(0.05)
+            while not queue.empty():
+                queue.get_nowait()
+            step(mongo)
+            await asyncio.sleep(0.05)
+            batches.append([queue.get_nowait() for _ in range(queue.qsize())])
+        task.cancel()
+        return batches
+
+    return asyncio.run(run())
+
+
+def test_poll_reports_samples_sharing_an_updated_date(monkeypatch, mongo):
+    def insert(mongo):
+        now = datetime.now() + timedelta(seconds=1)
+        mongo.samples.insert_many([
+            {'sample_id': sample_id, 'qc': 'pending', 'created_date': now, 'updated_date': now}
+            for sample_id in ('S1', 'S2')
+        ])
+
+    def insert_tied(mongo):
+        # Lands at the updated_date already polled
+        mongo.samples.insert_one({'sample_id': 'S3', 'qc': 'pending', 'created_date': datetime.now(),
+                                  'updated_date': mongo.samples.find_one({'sample_id': 'S1'})['updated_date']})
+
+    batches = poll_events(monkeypatch, mongo, [insert, insert_tied])
+
+    assert sorted(event['sample_id'] for event in batches[0]) == ['S1', 'S2']
+    assert [event['sample_id'] for event in batches[1]] == ['S3']
+
+
+def test_poll_lists_changed_other_fields(monkeypatch, mongo):
+    def insert(mongo):
+        mongo.samples.insert_one({'sample_id': 'S1', 'qc': 'pending', 'taxonomic_data': {'a': 1},
+                                  'created_date': datetime.now(), 'updated_date': datetime.now()})
+
+    def reingest(mongo):
+        mongo.samples.update_one({'sample_id': 'S1'}, {'$set': {
+            'taxonomic_data': {'a': 2}, 'updated_date': datetime.now()
+        }})
+
+    def set_qc(mongo):
+        mongo.samples.update_one({'sample_id': 'S1'}, {'$set': {'qc': 'passed', 'updated_date': datetime.now()}})
+
+    inserted, reingested, qc_set = poll_events(monkeypatch, mongo, [insert, reingest, set_qc])
+
+    assert inserted[0]['operation'] == 'insert'
+    assert reingested[0]['other_fields'] == ['taxonomic_data']
+    assert reingested[0]['fields'] == {'updated_date': reingested[0]['fields']['updated_date']}
+    assert qc_set[0]['other_fields'] == []
+    assert qc_set[0]['fields']['qc'] == 'passed'
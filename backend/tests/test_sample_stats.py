@@ -0,0 +1,73 @@
+from eyrie_api.database.sample_operations import (
+    create_sample, update_sample, update_sample_qc, update_sample_species_flags, upsert_sample
+)
+from eyrie_api.database.sample_stats import (
+    apply_sample_change, find_stats_drift, get_sample_stats, rebuild_sample_stats
+)
+
+
+def sample(sample_id, run='RUN1', **fields):
+    return {'sample_id': sample_id, 'sequencing_run_id': run, 'qc': 'pending', **fields}
+
+
+def stats(mongo, stats_id):
+    return mongo.sample_stats.find_one({'_id': stats_id}, {'_id': 0, 'updated_date': 0, 'sequencing_run_id': 0})
+
+
+def test_create_increments_overall_and_run(mongo):
+    create_sample(sample('S1', spike=True, flagged_contaminants=['E. coli', 'S. aureus']))
+    create_sample(sample('S2', run='RUN2'))
+
+    assert stats(mongo, 'all') == {
+        'samples': 2, 'qc': {'pending': 2}, 'classification': {'unknown': 2},
+        'spike_detected': 1, 'contaminated_samples': 1, 'flagged_contaminants': 2
+    }
+    assert stats(mongo, 'run:RUN1')['samples'] == 1
+    assert stats(mongo, 'run:RUN2')['samples'] == 1
+    assert find_stats_drift() == {}
+
+
+def test_updates_move_the_sample_between_counters(mongo):
+    create_sample(sample('S1', flagged_contaminants=['E. coli']))
+
+    update_sample_qc('S1', 'passed', 'ok')
+    update_sample_species_flags('S1', flagged_contaminants=[], flagged_top_hits=['B. subtilis'])
+    update_sample('S1', {'sequencing_run_id': 'RUN2', 'classification': None})
+
+    overall = stats(mongo, 'all')
+    assert overall['qc'] == {'pending': 0, 'passed': 1}
+    assert overall['contaminated_samples'] == 0
+    assert overall['flagged_contaminants'] == 0
+    assert overall['flagged_top_hits'] == 1
+    assert stats(mongo, 'run:RUN1')['samples'] == 0
+    assert stats(mongo, 'run:RUN2')['samples'] == 1
+    assert [run['sequencing_run_id'] for run in get_sample_stats()['runs']] == ['RUN2']
+    assert find_stats_drift() == {}
+
+
+def test_upsert_counts_a_sample_once(mongo):
+    upsert_sample(sample('S1'))
+    upsert_sample(sample('S1', qc='failed'))
+
+    assert stats(mongo, 'all')['samples'] == 1
+    assert stats(mongo, 'all')['qc'] == {'pending': 0, 'failed': 1}
+    assert find_stats_drift() == {}
+
+
+def test_unchanged_sample_writes_nothing(mongo):
+    apply_sample_change(sample('S1'), sample('S1', comments='only comments changed'))
+
+    assert mongo.sample_stats.count_documents({}) == 0
+
+
+def test_drift_check_finds_direct_writes_and_rebuild_fixes_them(mongo):
+    create_sample(sample('S1'))
+    mongo.samples.insert_one(sample('S2', run='RUN2'))  # bypasses the counters
+
+    drift = find_stats_drift()
+    assert set(drift) == {'all', 'run:RUN2'}
+    assert drift['all']['expected']['samples'] == 2
+    assert drift['all']['stored']['samples'] == 1
+
+    assert rebuild_sample_stats() == 3
+    assert find_stats_drift() == {}
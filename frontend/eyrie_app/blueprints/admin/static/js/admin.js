@@ -10,6 +10,9 @@ document.addEventListener('DOMContentLoaded', function() {
     
     // Load users
     loadUsers();
+
+    // Load per-process pipeline resource usage
+    loadPipelineStats();
 });
 
 async function loadCurrentUser() {
@@ -252,6 +255,67 @@ async function logout() {
     }
 }
 
+async function loadPipelineStats() {
+    const tbody = document.getElementById('pipelineStatsTableBody');
+    try {
+        const response = await fetch(`${window.API_BASE}/pipeline-runs/stats`, {
+            credentials: 'include'
+        });
+        if (!response.ok) {
+            tbody.innerHTML = '<tr><td colspan="8" class="text-center py-4 text-muted">Pipeline statistics unavailable</td></tr>';
+            return;
+        }
+        renderPipelineStatsTable(await response.json());
+    } catch (error) {
+        console.error('Error loading pipeline statistics:', error);
+        tbody.innerHTML = '<tr><td colspan="8" class="text-center py-4 text-muted">Pipeline statistics unavailable</td></tr>';
+    }
+}
+
+function renderPipelineStatsTable(stats) {
+    const tbody = document.getElementById('pipelineStatsTableBody');
+
+    if (stats.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="8" class="text-center py-4 text-muted">No execution traces ingested (popup ingest-trace)</td></tr>';
+        return;
+    }
+
+    const runs = Math.max(...stats.map(row => row.runs));
+    document.getElementById('pipelineRunsCount').textContent = `${runs} pipeline run${runs === 1 ? '' : 's'}`;
+
+    tbody.innerHTML = stats.map(row => `
+        <tr>
+            <td><code>${row.process}</code></td>
+            <td class="text-end">${row.tasks}</td>
+            <td class="text-end">${row.runs}</td>
+            <td class="text-end">${formatSeconds(row.mean_duration)}</td>
+            <td class="text-end">${formatSeconds(row.max_duration)}</td>
+            <td class="text-end">${row.mean_cpu_percent != null ? row.mean_cpu_percent.toFixed(1) + '%' : '-'}</td>
+            <td class="text-end">${formatBytes(row.mean_peak_rss)}</td>
+            <td class="text-end">${formatBytes(row.max_peak_rss)}</td>
+        </tr>
+    `).join('');
+}
+
+function formatSeconds(seconds) {
+    if (seconds == null) return '-';
+    if (seconds < 60) return `${seconds.toFixed(1)}s`;
+    if (seconds < 3600) return `${Math.floor(seconds / 60)}m ${Math.round(seconds % 60)}s`;
+    return `${Math.floor(seconds / 3600)}h ${Math.round((seconds % 3600) / 60)}m`;
+}
+
+function formatBytes(bytes) {
+    if (bytes == null) return '-';
+    const units = ['B', 'KB', 'MB', 'GB', 'TB'];
+    let value = bytes;
+    let unit = 0;
+    while (value >= 1024 && unit < units.length - 1) {
+        value /= 1024;
+        unit++;
+    }
+    return `${value.toFixed(unit === 0 ? 0 : 1)} ${units[unit]}`;
+}
+
 function showMessage(elementId, message, type) {
     const element = document.getElementById(elementId);
     element.innerHTML = `<div class="alert alert-${type} mt-3">${message}</div>`;
@@ -27,6 +27,7 @@ document.addEventListener('DOMContentLoaded', function() {
             if (sample) {
                 renderSampleDetail(sample);
                 setupNavigationLinks(sampleId);
+                subscribeToSampleEvents(sampleId, applySampleEvent);
             }
         });
     } else {
@@ -96,15 +97,24 @@ function renderSampleDetail(sample) {
     
     // Set quality frame to show length vs quality scatter plot
     const qualityFrame = document.getElementById('qualityFrame');
-    if (qualityFrame) {
+    const qualityChart = document.getElementById('qualityChart');
+    const lengthQuality = lengthQualityPoints(
+        sample.nanoplot_data?.processed?.length_quality || sample.nanoplot_data?.unprocessed?.length_quality, 250);
+    if (qualityChart && lengthQuality) {
+        // Draw natively from the stored series instead of loading the NanoPlot HTML
+        qualityFrame.style.display = 'none';
+        qualityChart.style.display = '';
+        renderScatterChart(qualityChart, lengthQuality.length, lengthQuality.quality,
+            { height: 280, xLabel: 'Read length', yLabel: 'Quality' });
+    } else if (qualityFrame) {
         // Use length vs quality scatter plot from nanoplot data (prefer processed, fallback to unprocessed)
         let qualityPlotPath = null;
         if (sample.nanoplot?.processed?.length_quality_scatter) {
             qualityPlotPath = sample.nanoplot.processed.length_quality_scatter;
         } else if (sample.nanoplot?.unprocessed?.length_quality_scatter) {
             qualityPlotPath = sample.nanoplot.unprocessed.length_quality_scatter;
-        } else if (sample.quality_plot) {
-            // Fallback to quality_plot if nanoplot data not available
+        } else if (sample.quality_plot && !sample.fastqc) {
+            // Fallback to the FastQC report if nanoplot data not available (and not drawn natively below)
             qualityPlotPath = sample.quality_plot;
         }
         
@@ -115,6 +125,9 @@ function renderSampleDetail(sample) {
         }
     }
     
+    // Render FastQC charts from the parsed module data
+    renderFastQC(sample.fastqc);
+
     // Render statistics
     renderStatistics(sample.statistics || {});
     
@@ -122,6 +135,80 @@ function renderSampleDetail(sample) {
     renderOverviewClassificationSummary();
 }
 
+/**
+ * Render FastQC module statuses and charts natively (no embedded report)
+ */
+function renderFastQC(fastqc) {
+    const card = document.getElementById('fastqcCard');
+    if (!card) return;
+    if (!fastqc || !fastqc.modules) {
+        card.style.display = 'none';
+        return;
+    }
+    card.style.display = '';
+
+    const statusBadges = { pass: 'bg-success', warn: 'bg-warning text-dark', fail: 'bg-danger' };
+    document.getElementById('fastqcModules').innerHTML = Object.entries(fastqc.modules).map(([module, status]) =>
+        `<span class="badge ${statusBadges[status] || 'bg-secondary'} me-1 mb-1">${module.replace(/_/g, ' ')}</span>`
+    ).join('');
+
+    const quality = fastqc.per_base_sequence_quality;
+    if (quality) {
+        renderLineChart(document.getElementById('fastqcQualityChart'), quality.base, [
+            { label: 'Mean', values: quality.mean, band: { lower: quality.lower_quartile, upper: quality.upper_quartile } },
+            { label: 'Median', values: quality.median }
+        ], { xLabel: 'Position in read (bp)', yLabel: 'Quality' });
+    }
+
+    const gc = fastqc.per_sequence_gc_content;
+    if (gc) {
+        renderBarChart(document.getElementById('fastqcGcChart'), gc.gc_content, gc.count,
+            { xLabel: 'Mean GC content (%)', yLabel: 'Reads', color: '#198754' });
+    }
+}
+
+/**
+ * Patch the overview in place from a live sample event
+ */
+function applySampleEvent(event) {
+    if (!currentSample || event.sample_id !== currentSample.sample_id) return;
+
+    // Pipeline data changed (re-ingest); only then fetch the full document again
+    if (event.other_fields && event.other_fields.length > 0) {
+        loadSample(currentSample.sample_id, true).then(sample => {
+            if (sample) renderSampleDetail(sample);
+        });
+        return;
+    }
+
+    const fields = event.fields || {};
+    Object.assign(currentSample, fields);
+
+    if ('sample_name' in fields) {
+        updateSampleTitle(currentSample);
+        updateElement('infoSampleName', currentSample.sample_name);
+    }
+    if ('lims_id' in fields) updateElement('infoLimsId', currentSample.lims_id);
+    if ('updated_date' in fields) updateElement('infoUpdatedDate', formatDate(currentSample.updated_date));
+
+    if ('qc' in fields) {
+        const qcStatus = document.getElementById('currentQCStatus');
+        if (qcStatus) {
+            qcStatus.innerHTML = `<span class="badge ${getQCBadgeClass(currentSample.qc)}">${currentSample.qc.toUpperCase()}</span>`;
+        }
+    }
+
+    // Don't overwrite comments the user is currently typing
+    const commentsElement = document.getElementById('generalComments');
+    if ('comments' in fields && document.activeElement !== commentsElement) {
+        updateElement('generalComments', currentSample.comments, 'value');
+    }
+
+    if ('flagged_contaminants' in fields || 'flagged_top_hits' in fields || 'spike' in fields) {
+        renderOverviewClassificationSummary();
+    }
+}
+
 /**
  * Helper function to update element content
  */
@@ -350,13 +437,26 @@ function renderOverviewClassificationSummary() {
         if (spikeDiv) {
             const hit = data.hits ? data.hits.find(h => h.species === currentSample.spike) : null;
             const abundance = hit ? hit.abundance.toFixed(2) + '%' : '';
-            spikeDiv.innerHTML = `<span class="badge bg-info me-1 mb-1" title="Abundance: ${abundance}">${currentSample.spike} ${abundance ? '(' + abundance + ')' : ''}</span>`;
+            spikeDiv.innerHTML = `<span class="badge bg-info me-1 mb-1" title="Abundance: ${abundance}">${currentSample.spike} ${abundance ? '(' + abundance + ')' : ''}</span>`
+                + renderSpikeQC(currentSample.spike_qc);
         }
     } else {
         if (spikeList) spikeList.style.display = 'none';
     }
 }
 
+/**
+ * Spike recovery badge (observed vs expected spike abundance)
+ */
+function renderSpikeQC(spikeQC) {
+    if (!spikeQC || spikeQC.observed_expected_ratio === null || spikeQC.observed_expected_ratio === undefined) {
+        return '';
+    }
+    const badgeClass = spikeQC.status === 'ok' ? 'bg-success' : 'bg-danger';
+    const ratio = spikeQC.observed_expected_ratio.toFixed(2);
+    return `<span class="badge ${badgeClass} me-1 mb-1" title="Observed/expected spike abundance">Spike QC: ${spikeQC.status.toUpperCase()} (${ratio}x)</span>`;
+}
+
 /**
  * View switching functionality
  */
@@ -6,6 +6,13 @@
 let flaggedContaminants = new Set();
 let flaggedTopHits = new Set();
 
+// Lineage per tax_id, shared across samples viewed in this page session
+const lineageCache = new Map();
+
+// Rank shown in the abundance table and server-side rollups fetched per rank
+let currentRank = 'species';
+const rollupCache = new Map();
+
 /**
  * Initialize classification view
  */
@@ -14,8 +21,111 @@ function initializeClassificationView(sampleId) {
         if (sample) {
             updateSampleTitle(sample);
             loadClassificationData(sample);
+            subscribeToSampleEvents(sampleId, applyClassificationEvent);
         }
     });
+
+    const rankSelect = document.getElementById('rankSelect');
+    if (rankSelect) {
+        rankSelect.addEventListener('change', () => setAbundanceRank(rankSelect.value));
+    }
+}
+
+/**
+ * Switch the abundance table between species hits and a rolled-up rank
+ */
+function setAbundanceRank(rank) {
+    currentRank = rank;
+    const label = rank.charAt(0).toUpperCase() + rank.slice(1);
+    const header = document.getElementById('rankColumnHeader');
+    if (header) header.textContent = label;
+    const title = document.getElementById('abundanceTableTitle');
+    if (title) title.textContent = `${label} Abundance`;
+    displaySampleAbundanceTable();
+}
+
+/**
+ * Fetch the sample's abundances rolled up to a rank; cached until the sample reloads
+ */
+async function loadRankRollup(rank) {
+    if (rollupCache.has(rank)) return rollupCache.get(rank);
+
+    const response = await fetch(`${window.API_BASE}/samples/${currentSample.sample_id}/rollup?rank=${rank}`);
+    if (!response.ok) throw new Error(`Failed to load ${rank} rollup (${response.status})`);
+    const rollup = await response.json();
+    rollupCache.set(rank, rollup);
+    return rollup;
+}
+
+/**
+ * Display the abundance table at a rank above species
+ */
+async function displayRankRollupTable(tbody) {
+    const rank = currentRank;
+    let rollup;
+    try {
+        rollup = await loadRankRollup(rank);
+    } catch (error) {
+        console.error('Error loading rank rollup:', error);
+        tbody.innerHTML = `<tr><td colspan="5" class="text-center py-4 text-danger">Could not load ${rank} abundances</td></tr>`;
+        return;
+    }
+    // The user switched rank again while this one was loading
+    if (rank !== currentRank) return;
+
+    tbody.innerHTML = rollup.taxa.map((taxon, index) => `
+        <tr class="contamination-row">
+            <td>
+                <div class="d-flex align-items-center">
+                    <small class="text-muted me-2">${index + 1}.</small>
+                    <div>
+                        <div class="fw-semibold">${taxon.name}</div>
+                        <small class="text-muted">${taxon.species_count} species</small>
+                    </div>
+                </div>
+            </td>
+            <td class="text-center">
+                <div class="d-flex align-items-center justify-content-center">
+                    <span class="badge ${getAbundanceBadgeClass(taxon.abundance)} me-2">
+                        ${taxon.abundance.toFixed(2)}%
+                    </span>
+                    <div class="progress flex-grow-1" style="height: 8px;">
+                        <div class="progress-bar" style="width: ${Math.min(taxon.abundance, 100)}%"></div>
+                    </div>
+                </div>
+            </td>
+            <td class="text-center">
+                <span class="fw-semibold text-muted">
+                    ${taxon.estimated_counts ? formatNumber(Math.round(taxon.estimated_counts)) : '--'}
+                </span>
+            </td>
+            <td class="text-center text-muted">--</td>
+            <td class="text-center text-muted">--</td>
+        </tr>
+    `).join('');
+}
+
+/**
+ * Patch flags and summary from a live sample event
+ */
+function applyClassificationEvent(event) {
+    if (!currentSample || event.sample_id !== currentSample.sample_id) return;
+
+    // Taxonomic data changed (re-ingest); only then fetch the full document again
+    if (event.other_fields && event.other_fields.length > 0) {
+        loadSample(currentSample.sample_id, true).then(sample => {
+            if (sample) loadClassificationData(sample);
+        });
+        return;
+    }
+
+    const fields = event.fields || {};
+    Object.assign(currentSample, fields);
+
+    if ('flagged_contaminants' in fields || 'flagged_top_hits' in fields || 'spike' in fields) {
+        displaySampleAbundanceTable();
+        updateSampleClassificationSummary();
+    }
 }
 
 /**
@@ -23,6 +133,9 @@ function initializeClassificationView(sampleId) {
  */
 function loadClassificationData(sample = currentSample) {
     if (!sample) return;
+
+    // Rollups are memoized per sample version on the server; refetch after a reload
+    rollupCache.clear();
     
     // Load Krona plot in classification view
     if (sample.krona_file) {
@@ -43,6 +156,39 @@ function loadClassificationData(sample = currentSample) {
     // Load abundance table and classification summary
     displaySampleAbundanceTable();
     updateSampleClassificationSummary();
+
+    // Fill in lineage from the shared taxonomy registry, then redraw with it
+    const hits = (sample.taxonomic_data && sample.taxonomic_data.hits) || [];
+    loadLineages(hits.map(hit => hit.tax_id)).then(loaded => {
+        if (loaded) displaySampleAbundanceTable();
+    });
+}
+
+/**
+ * Fetch lineages for tax_ids not yet in the cache; resolves true if any were added
+ */
+async function loadLineages(taxIds) {
+    const missing = [...new Set(taxIds.filter(taxId => taxId && !lineageCache.has(taxId)))];
+    if (missing.length === 0) return false;
+
+    try {
+        const response = await fetch(`${window.API_BASE}/taxonomy?tax_ids=${encodeURIComponent(missing.join(','))}`);
+        if (!response.ok) return false;
+        const lineages = await response.json();
+        // Cache misses too, so unknown tax_ids are not requested again
+        missing.forEach(taxId => lineageCache.set(taxId, lineages[taxId] || null));
+        return Object.keys(lineages).length > 0;
+    } catch (error) {
+        console.warn('Could not load taxonomy lineages:', error);
+        return false;
+    }
+}
+
+/**
+ * Lineage of a hit: cached registry entry, falling back to the ranks stored on the hit
+ */
+function getLineage(organism) {
+    return lineageCache.get(organism.tax_id) || organism;
 }
 
 /**
@@ -66,6 +212,12 @@ function displaySampleAbundanceTable() {
         return;
     }
 
+    // Flags apply to species, so other ranks are display-only
+    if (currentRank !== 'species') {
+        displayRankRollupTable(tbody);
+        return;
+    }
+
     // Load saved flags from database
     flaggedContaminants.clear();
     flaggedTopHits.clear();
@@ -89,6 +241,7 @@ function displaySampleAbundanceTable() {
         const row = document.createElement('tr');
         row.className = 'contamination-row';
         row.dataset.species = organism.species;
+        const lineage = getLineage(organism);
         
         // Check if this species is flagged
         const isTopHit = flaggedTopHits.has(organism.species);
@@ -107,7 +260,7 @@ function displaySampleAbundanceTable() {
                     <small class="text-muted me-2">${index + 1}.</small>
                     <div>
                         <div class="fw-semibold">${organism.species}</div>
-                        <small class="text-muted">${organism.genus || 'N/A'} - ${organism.family || 'N/A'}</small>
+                        <small class="text-muted" title="${formatLineage(lineage)}">${lineage.genus || 'N/A'} - ${lineage.family || 'N/A'}</small>
                     </div>
                 </div>
             </td>
@@ -370,6 +523,16 @@ function updateSampleClassificationSummary() {
     }
 }
 
+/**
+ * Full lineage as "superkingdom > phylum > ... > genus"
+ */
+function formatLineage(lineage) {
+    return ['superkingdom', 'phylum', 'class', 'order', 'family', 'genus']
+        .map(rank => lineage[rank])
+        .filter(Boolean)
+        .join(' > ');
+}
+
 /**
  * Calculate Shannon diversity index
  */
@@ -9,12 +9,12 @@ window.API_BASE = window.API_BASE || '/api';
 let currentSample = null;
 
 /**
- * Load sample data from API
+ * Load sample data from API; fresh skips the browser and proxy caches
  */
-async function loadSample(sampleId) {
+async function loadSample(sampleId, fresh = false) {
     try {
         const apiUrl = `${window.API_BASE}/samples/${sampleId}`;
-        const response = await fetch(apiUrl);
+        const response = await fetch(apiUrl, fresh ? { cache: 'no-store', headers: { 'Cache-Control': 'no-cache' } } : {});
         const sample = await response.json();
         
         if (response.ok) {
@@ -30,6 +30,25 @@ async function loadSample(sampleId) {
     }
 }
 
+/**
+ * Subscribe to live sample changes pushed by the backend (Server-Sent Events).
+ * Each event carries the sample_id plus only the fields that changed.
+ */
+function subscribeToSampleEvents(sampleId, onEvent) {
+    if (!window.EventSource || !window.SAMPLE_EVENTS_URL) return null;
+
+    const query = sampleId ? `?sample_id=${encodeURIComponent(sampleId)}` : '';
+    const source = new EventSource(`${window.SAMPLE_EVENTS_URL}${query}`);
+    source.addEventListener('sample', message => {
+        try {
+            onEvent(JSON.parse(message.data));
+        } catch (error) {
+            console.error('Error applying sample event:', error);
+        }
+    });
+    return source;
+}
+
 /**
  * Load current user information
  */
@@ -181,3 +200,15 @@ function getQCBadgeClass(qc) {
         default: return 'bg-secondary';
     }
 }
+
+/**
+ * Length vs quality points for a chart, from the LTTB series at several resolutions.
+ * Picks the most detailed series with at most maxPoints points.
+ */
+function lengthQualityPoints(lengthQuality, maxPoints) {
+    const series = lengthQuality?.series;
+    if (!series) return lengthQuality?.length ? lengthQuality : null;
+    const resolutions = Object.keys(series).map(Number).sort((a, b) => a - b);
+    const resolution = resolutions.filter(r => r <= maxPoints).pop() || resolutions[0];
+    return series[resolution];
+}
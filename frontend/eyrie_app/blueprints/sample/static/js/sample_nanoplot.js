@@ -4,6 +4,7 @@
 
 // Global variables for nanoplot
 let currentPlotType = null;
+let nanoplotDataPromise = null;
 
 /**
  * Initialize nanoplot view
@@ -101,6 +102,74 @@ function loadPlot(processingType, plotType) {
         return;
     }
 
+    // Draw from the stored chart series when available; the HTML plots are the fallback
+    loadNanoplotData().then(data => {
+        if (!renderNanoplotChart(container, data && data[processingType], plotType)) {
+            loadPlotFile(container, processingType, plotType, plotInfo);
+        }
+    });
+}
+
+/**
+ * Fetch the sample's NanoPlot chart series once
+ */
+function loadNanoplotData() {
+    if (!nanoplotDataPromise) {
+        nanoplotDataPromise = fetch(`${window.API_BASE}/samples/${currentSample.sample_id}/nanoplot-data`)
+            .then(response => response.ok ? response.json() : null)
+            .catch(() => null);
+    }
+    return nanoplotDataPromise;
+}
+
+/**
+ * Render a plot type natively from chart series; returns false when the series is missing
+ */
+function renderNanoplotChart(container, data, plotType) {
+    if (!data) return false;
+    const options = { height: 450 };
+
+    switch (plotType) {
+        case 'length-quality-scatter': {
+            const series = lengthQualityPoints(data.length_quality, 1000);
+            if (!series) return false;
+            const histogram = data.length_quality.histogram;
+            container.innerHTML = '';
+            renderScatterChart(container, series.length, series.quality, {
+                ...options, xLabel: 'Read length', yLabel: 'Average read quality', radius: 1.5,
+                density: histogram && { xEdges: histogram.length_edges, yEdges: histogram.quality_edges, counts: histogram.counts }
+            });
+            return true;
+        }
+        case 'non-weighted-histogram':
+        case 'weighted-histogram': {
+            const histogram = data.length_histogram;
+            const values = histogram && (plotType === 'weighted-histogram' ? histogram.bases : histogram.reads);
+            if (!values) return false;
+            container.innerHTML = '';
+            renderBarChart(container, histogram.length, values, {
+                ...options, xLabel: 'Read length',
+                yLabel: plotType === 'weighted-histogram' ? 'Number of bases' : 'Number of reads'
+            });
+            return true;
+        }
+        case 'yield-by-length': {
+            const series = data.yield_by_length;
+            if (!series) return false;
+            container.innerHTML = '';
+            renderLineChart(container, series.length, [{ label: 'Yield', values: series.yield }],
+                { ...options, numericX: true, xLabel: 'Read length', yLabel: 'Cumulative yield for minimal length (bases)' });
+            return true;
+        }
+    }
+    return false;
+}
+
+/**
+ * Load a plot type from its NanoPlot HTML output
+ */
+function loadPlotFile(container, processingType, plotType, plotInfo) {
+
     // Use structured nanoplot data
     let filePath = null;
     
@@ -1,25 +1,38 @@
 document.addEventListener('DOMContentLoaded', function() {
     loadCurrentUser();
-    loadSamples();
+
+    // The first page of rows is rendered server-side; only fetch when it is missing
+    const tbody = document.getElementById('samplesTableBody');
+    if (!tbody.dataset.serverRendered) {
+        loadSamples();
+    }
+    subscribeToSampleUpdates();
 
     // Setup search functionality
     const searchInput = document.getElementById('tableSearch');
     searchInput.addEventListener('input', filterTable);
 });
 
-async function loadSamples() {
+// Retry delay (ms) while samples cannot be loaded, doubled per attempt up to the maximum
+const LOAD_RETRY_DELAY = 2000;
+const MAX_LOAD_RETRY_DELAY = 30000;
+
+async function loadSamples(retryDelay = LOAD_RETRY_DELAY) {
+    let message;
     try {
         const response = await fetch(`${window.API_BASE}/samples`);
         const samples = await response.json();
 
         if (response.ok) {
             renderSamplesTable(samples);
-        } else {
-            showError('Failed to load samples: ' + samples.error);
+            return;
         }
+        message = 'Failed to load samples: ' + samples.error;
     } catch (error) {
-        showError('Network error: ' + error.message);
+        message = 'Network error: ' + error.message;
     }
+    showError(`${message} - retrying in ${Math.round(retryDelay / 1000)}s`);
+    setTimeout(() => loadSamples(Math.min(retryDelay * 2, MAX_LOAD_RETRY_DELAY)), retryDelay);
 }
 
 function renderSamplesTable(samples) {
@@ -30,30 +43,76 @@ function renderSamplesTable(samples) {
         return;
     }
 
-    tbody.innerHTML = samples.map(sample => `
-        <tr>
+    tbody.innerHTML = samples.map(renderSampleRow).join('');
+}
+
+// Cell renderers keyed by sample field, shared by full renders and live patches
+const SAMPLE_CELL_RENDERERS = {
+    sample_name: value => value,
+    sample_id: value => value,
+    sequencing_run_id: value => value,
+    lims_id: value => value,
+    classification: value => `<span class="badge ${value === '16S' ? 'bg-primary' : 'bg-info'}">${value}</span>`,
+    flagged_top_hits: value => renderFlaggedSpecies(value, 'success'),
+    flagged_contaminants: value => renderFlaggedSpecies(value, 'warning'),
+    qc: value => `<span class="badge ${getQCBadgeClass(value)}">${(value || '').toUpperCase()}</span>`,
+    comments: value => value || '-',
+    created_date: value => formatDate(value),
+    updated_date: value => formatDate(value)
+};
+
+function renderSampleRow(sample) {
+    const cells = Object.entries(SAMPLE_CELL_RENDERERS)
+        .map(([field, render]) => `<td data-field="${field}">${render(sample[field])}</td>`)
+        .join('');
+
+    return `
+        <tr data-sample-id="${sample.sample_id}">
             <td>
                 <button class="btn btn-primary btn-sm" onclick="openSample('${sample.sample_id}')">
                     <i class="bi bi-eye"></i>
                 </button>
             </td>
-            <td>${sample.sample_name}</td>
-            <td>${sample.sample_id}</td>
-            <td>${sample.sequencing_run_id}</td>
-            <td>${sample.lims_id}</td>
-            <td>
-                <span class="badge ${sample.classification === '16S' ? 'bg-primary' : 'bg-info'}">${sample.classification}</span>
-            </td>
-            <td>${renderFlaggedSpecies(sample.flagged_top_hits, 'success')}</td>
-            <td>${renderFlaggedSpecies(sample.flagged_contaminants, 'warning')}</td>
-            <td>
-                <span class="badge ${getQCBadgeClass(sample.qc)}">${sample.qc.toUpperCase()}</span>
-            </td>
-            <td>${sample.comments || '-'}</td>
-            <td>${formatDate(sample.created_date)}</td>
-            <td>${formatDate(sample.updated_date)}</td>
+            ${cells}
         </tr>
-    `).join('');
+    `;
+}
+
+function subscribeToSampleUpdates() {
+    // No stream in standalone mode; the table then updates on reload only
+    if (!window.EventSource || !window.SAMPLE_EVENTS_URL) return;
+
+    const source = new EventSource(window.SAMPLE_EVENTS_URL);
+    source.addEventListener('sample', message => {
+        const event = JSON.parse(message.data);
+        const tbody = document.getElementById('samplesTableBody');
+        const row = tbody.querySelector(`tr[data-sample-id="${CSS.escape(event.sample_id)}"]`);
+
+        if (row) {
+            patchSampleRow(row, event.fields || {});
+        } else if (event.operation === 'insert' && isFirstPage()) {
+            // Drop the "No samples found" placeholder before adding the first row
+            if (!tbody.querySelector('tr[data-sample-id]')) {
+                tbody.innerHTML = '';
+            }
+            tbody.insertAdjacentHTML('afterbegin', renderSampleRow(event.fields));
+            filterTable();
+        }
+    });
+}
+
+function patchSampleRow(row, fields) {
+    Object.entries(fields).forEach(([field, value]) => {
+        const cell = row.querySelector(`td[data-field="${field}"]`);
+        if (cell) {
+            cell.innerHTML = SAMPLE_CELL_RENDERERS[field](value);
+        }
+    });
+}
+
+function isFirstPage() {
+    const page = new URLSearchParams(window.location.search).get('page');
+    return !page || page === '1';
 }
 
 function renderFlaggedSpecies(flaggedSpecies, badgeType) {
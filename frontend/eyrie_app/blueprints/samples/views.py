@@ -1,11 +1,56 @@
-from flask import Blueprint, render_template, send_file
+from datetime import datetime
+from flask import Blueprint, render_template, request, make_response
 
-bp = Blueprint('samples', __name__, url_prefix='')
+from ...app import get_samples_listing
+
+bp = Blueprint('samples', __name__, url_prefix='', template_folder='templates')
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+@bp.app_template_filter('format_date')
+def format_date(value):
+    """Format a stored date (datetime or ISO string) for the samples table"""
+    if not value:
+        return '-'
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    return value.strftime('%Y-%m-%d %H:%M')
+
+def render_samples_page():
+    """Render the first paint of the samples table with an ETag for revalidation"""
+    page = max(request.args.get('page', 1, type=int), 1)
+    page_size = min(max(request.args.get('page_size', DEFAULT_PAGE_SIZE, type=int), 1), MAX_PAGE_SIZE)
+
+    if_none_match = next(iter(request.if_none_match), None) if request.if_none_match else None
+    listing = get_samples_listing((page - 1) * page_size, page_size, if_none_match)
+
+    if listing['samples'] is None:
+        response = make_response('', 304)
+    else:
+        # On a load error the page renders without rows, and samples.js retries from the browser
+        response = make_response(render_template(
+            'index.html',
+            samples=listing['samples'],
+            total=listing['total'],
+            page=page,
+            page_size=page_size,
+            page_count=max((listing['total'] + page_size - 1) // page_size, 1),
+            load_error=listing.get('error')
+        ))
+
+    if listing['etag']:
+        response.set_etag(listing['etag'])
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 @bp.route("/")
 def root():
-    return send_file('blueprints/samples/templates/index.html')
+    return render_samples_page()
 
 @bp.route("/samples")
 def samples_page():
-    return send_file('blueprints/samples/templates/index.html')
+    return render_samples_page()
@@ -0,0 +1,273 @@
+"""Reverse proxy forwarding frontend /api requests to the FastAPI backend."""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from flask import Response, jsonify, request, stream_with_context
+from requests.adapters import HTTPAdapter
+
+# Headers that describe a single hop and must not be copied between connections
+HOP_BY_HOP_HEADERS = {
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization',
+    'te', 'trailers', 'transfer-encoding', 'upgrade',
+    'content-encoding', 'content-length'
+}
+
+# Request headers passed on to the backend
+FORWARDED_REQUEST_HEADERS = ['Content-Type', 'Accept', 'If-None-Match', 'Cache-Control']
+
+# API path prefixes whose GET responses may be cached (public, user independent)
+CACHEABLE_PREFIXES = ('samples',)
+
+# API paths streamed through unbuffered (Server-Sent Events)
+STREAMING_PATHS = ('samples/events',)
+
+# Milliseconds browsers wait before reconnecting when all stream slots are taken
+STREAM_RETRY_MS = 15000
+
+WRITE_METHODS = ['POST', 'PUT', 'PATCH', 'DELETE']
+
+
+class ResponseCache:
+    """Small thread-safe LRU cache with a time-to-live for proxied GET responses."""
+
+    def __init__(self, max_entries: int = 256, ttl: float = 5.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Tuple[bytes, int, list]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[bytes, int, list]]:
+        """Return a cached response if present and not expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Tuple[bytes, int, list]):
+        """Store a response, evicting the least recently used entry when full."""
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+class BackendProxy:
+    """Forwards API calls to the backend over a pooled keep-alive HTTP session."""
+
+    def __init__(self, backend_url: str, pool_size: int = 20, timeout: float = 30.0,
+                 cache_ttl: float = 5.0, cache_size: int = 256, max_streams: int = 32):
+        self.backend_url = backend_url.rstrip('/')
+        self.timeout = timeout
+        self.cache = ResponseCache(max_entries=cache_size, ttl=cache_ttl)
+
+        # Each relayed event stream holds a worker thread for as long as the
+        # page stays open, so only this many run at once
+        self.stream_slots = threading.BoundedSemaphore(max_streams)
+
+        # One session shared by all request threads; the adapter keeps up to
+        # pool_size idle connections to the backend open for reuse
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Frontend session id -> backend token and user information
+        self.sessions: Dict[str, Dict[str, Any]] = {}
+
+    def forward(self, path: str, token: Optional[str] = None) -> Response:
+        """Forward the current Flask request to the backend API."""
+        method = request.method
+        if method == 'GET' and path in STREAMING_PATHS:
+            return self.stream(path)
+
+        cacheable = method == 'GET' and path.startswith(CACHEABLE_PREFIXES)
+        cache_key = request.full_path
+
+        # A no-cache request (e.g. a refetch after a live event) skips the cache but refreshes it
+        if cacheable and 'no-cache' not in request.headers.get('Cache-Control', ''):
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                body, status, headers = cached
+                return Response(body, status=status, headers=headers)
+
+        headers = {
+            name: request.headers[name]
+            for name in FORWARDED_REQUEST_HEADERS
+            if name in request.headers
+        }
+        if token:
+            headers['Authorization'] = f"Bearer {token}"
+
+        try:
+            backend_response = self.session.request(
+                method,
+                f"{self.backend_url}/api/{path}",
+                params=request.args,
+                data=request.get_data(),
+                headers=headers,
+                timeout=self.timeout
+            )
+        except requests.exceptions.RequestException as e:
+            return jsonify({'error': f"Backend unavailable: {e}"}), 502
+
+        body = self._translate_error(backend_response)
+        response_headers = [
+            (name, value) for name, value in backend_response.headers.items()
+            if name.lower() not in HOP_BY_HOP_HEADERS
+        ]
+
+        if method in WRITE_METHODS and backend_response.ok:
+            self.cache.clear()
+        elif cacheable and backend_response.status_code == 200:
+            self.cache.set(cache_key, (body, backend_response.status_code, response_headers))
+
+        return Response(body, status=backend_response.status_code, headers=response_headers)
+
+    def stream(self, path: str) -> Response:
+        """Relay a long-lived event stream from the backend without buffering it."""
+        if not self.stream_slots.acquire(blocking=False):
+            # An empty stream that ends at once makes the browser reconnect after the
+            # retry delay, by when another page may have freed a slot
+            return Response(f"retry: {STREAM_RETRY_MS}\n\n", content_type='text/event-stream',
+                            headers={'Cache-Control': 'no-cache'})
+
+        try:
+            backend_response = self.session.get(
+                f"{self.backend_url}/api/{path}",
+                params=request.args,
+                headers={'Accept': 'text/event-stream'},
+                stream=True,
+                timeout=(self.timeout, None)
+            )
+        except requests.exceptions.RequestException as e:
+            self.stream_slots.release()
+            return jsonify({'error': f"Backend unavailable: {e}"}), 502
+
+        def relay():
+            try:
+                for chunk in backend_response.iter_content(chunk_size=None):
+                    yield chunk
+            finally:
+                backend_response.close()
+
+        response = Response(
+            stream_with_context(relay()),
+            status=backend_response.status_code,
+            content_type=backend_response.headers.get('Content-Type', 'text/event-stream'),
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+        # Runs when the server closes the response, even if the relay never started
+        response.call_on_close(backend_response.close)
+        response.call_on_close(self.stream_slots.release)
+        return response
+
+    def health(self):
+        """Report backend health as seen from the frontend."""
+        try:
+            backend_response = self.session.get(f"{self.backend_url}/health", timeout=self.timeout)
+            if backend_response.ok:
+                return jsonify({'status': 'healthy', 'mode': 'proxy'})
+            return jsonify({'status': 'unhealthy', 'error': backend_response.text}), 500
+        except requests.exceptions.RequestException as e:
+            return jsonify({'status': 'unhealthy', 'error': str(e)}), 500
+
+    def _translate_error(self, backend_response: requests.Response) -> bytes:
+        """Expose FastAPI 'detail' errors under the 'error' key the frontend reads."""
+        if backend_response.ok:
+            return backend_response.content
+        try:
+            payload = backend_response.json()
+        except ValueError:
+            return backend_response.content
+        if isinstance(payload, dict) and 'detail' in payload and 'error' not in payload:
+            payload['error'] = payload['detail']
+            return jsonify(payload).get_data()
+        return backend_response.content
+
+
+def register_api_proxy(app, backend_url: str, **proxy_options):
+    """Register /api routes that forward to the backend instead of MongoDB."""
+    proxy = BackendProxy(backend_url, **proxy_options)
+    app.extensions['eyrie_proxy'] = proxy
+
+    def current_session() -> Optional[Dict[str, Any]]:
+        session_id = request.cookies.get("session_id")
+        if not session_id:
+            return None
+        return proxy.sessions.get(session_id)
+
+    @app.route("/api/auth/login", methods=['POST'])
+    def login():
+        try:
+            backend_response = proxy.session.post(
+                f"{proxy.backend_url}/api/auth/login",
+                json=request.get_json(),
+                timeout=proxy.timeout
+            )
+        except requests.exceptions.RequestException as e:
+            return jsonify({'error': f"Backend unavailable: {e}"}), 502
+
+        if backend_response.status_code != 200:
+            return jsonify({'error': 'Invalid credentials'}), 401
+
+        auth_data = backend_response.json()
+        session_id = secrets.token_urlsafe(32)
+        proxy.sessions[session_id] = {
+            'token': auth_data['access_token'],
+            **auth_data['user']
+        }
+
+        response = jsonify({'success': True, 'user': auth_data['user']})
+        response.set_cookie(key="session_id", value=session_id, httponly=True)
+        return response
+
+    @app.route("/api/auth/logout", methods=['POST'])
+    def logout():
+        session_id = request.cookies.get("session_id")
+        proxy.sessions.pop(session_id, None)
+
+        response = jsonify({'success': True})
+        response.set_cookie(key="session_id", value='', expires=0)
+        return response
+
+    @app.route("/api/auth/current-user", methods=['GET'])
+    def current_user():
+        user_session = current_session()
+        if not user_session:
+            return jsonify({'error': 'Authentication required'}), 401
+        return jsonify({
+            'username': user_session['username'],
+            'email': user_session.get('email', ''),
+            'role': user_session['role']
+        })
+
+    @app.route("/api/<path:path>", methods=['GET', 'POST', 'PUT', 'PATCH', 'DELETE'])
+    def api_proxy(path):
+        user_session = current_session()
+        token = user_session['token'] if user_session else None
+        return proxy.forward(path, token)
+
+    @app.route("/health", methods=['GET'])
+    def health_check():
+        return proxy.health()
+
+    return proxy
@@ -0,0 +1,184 @@
+/**
+ * Minimal SVG charts drawn from the compact arrays stored on samples
+ */
+
+const CHART_COLORS = ['#0d6efd', '#198754', '#dc3545', '#fd7e14', '#6f42c1', '#20c997'];
+const CHART_MARGIN = { top: 10, right: 10, bottom: 30, left: 45 };
+const SVG_NS = 'http://www.w3.org/2000/svg';
+
+function svgElement(tag, attributes = {}) {
+    const element = document.createElementNS(SVG_NS, tag);
+    Object.entries(attributes).forEach(([name, value]) => element.setAttribute(name, value));
+    return element;
+}
+
+function chartExtent(values, includeZero = true) {
+    const finite = values.filter(value => value !== null && Number.isFinite(value));
+    let min = finite.length ? Math.min(...finite) : 0;
+    let max = finite.length ? Math.max(...finite) : 1;
+    if (includeZero) min = Math.min(min, 0);
+    if (min === max) max = min + 1;
+    return [min, max];
+}
+
+function formatTick(value) {
+    if (Math.abs(value) >= 1000) return `${+(value / 1000).toFixed(1)}k`;
+    return `${+value.toFixed(1)}`;
+}
+
+/**
+ * Draw axes and return scales for a chart area inside container.
+ * x values are evenly spaced labels, or positioned by value with numericX.
+ * Both scales take the point index: scaleX(i), scaleY(value); scaleXValue maps
+ * an x value directly. xDomain widens the numeric x range (e.g. to histogram edges).
+ */
+function createChartFrame(container, { x, yMin, yMax, numericX = false, xDomain = null, xLabel = '', yLabel = '', height = 220 }) {
+    container.innerHTML = '';
+    const width = container.clientWidth || 400;
+    const svg = svgElement('svg', { width: '100%', height, viewBox: `0 0 ${width} ${height}`, class: 'eyrie-chart' });
+    const plotWidth = width - CHART_MARGIN.left - CHART_MARGIN.right;
+    const plotHeight = height - CHART_MARGIN.top - CHART_MARGIN.bottom;
+
+    const [xMin, xMax] = numericX ? chartExtent([...x, ...(xDomain || [])], false) : [0, Math.max(x.length - 1, 1)];
+    const scaleXValue = value => CHART_MARGIN.left + (value - xMin) / (xMax - xMin) * plotWidth;
+    const scaleX = i => scaleXValue(numericX ? x[i] : i);
+    const scaleY = value => CHART_MARGIN.top + (1 - (value - yMin) / (yMax - yMin)) * plotHeight;
+
+    const axis = { stroke: '#adb5bd', 'stroke-width': 1 };
+    svg.appendChild(svgElement('line', { x1: CHART_MARGIN.left, y1: scaleY(yMin), x2: width - CHART_MARGIN.right, y2: scaleY(yMin), ...axis }));
+    svg.appendChild(svgElement('line', { x1: CHART_MARGIN.left, y1: CHART_MARGIN.top, x2: CHART_MARGIN.left, y2: scaleY(yMin), ...axis }));
+
+    const label = { 'font-size': 10, fill: '#6c757d' };
+    for (let step = 0; step <= 4; step++) {
+        const value = yMin + (yMax - yMin) * step / 4;
+        const text = svgElement('text', { x: CHART_MARGIN.left - 4, y: scaleY(value) + 3, 'text-anchor': 'end', ...label });
+        text.textContent = formatTick(value);
+        svg.appendChild(text);
+    }
+    // Label at most ~8 x positions so long read positions stay legible
+    const every = Math.max(1, Math.ceil(x.length / 8));
+    const xTicks = numericX
+        ? [0, 1, 2, 3, 4].map(step => [CHART_MARGIN.left + plotWidth * step / 4, formatTick(xMin + (xMax - xMin) * step / 4)])
+        : x.map((value, i) => [scaleX(i), value]).filter((_, i) => i % every === 0 || i === x.length - 1);
+    xTicks.forEach(([position, value]) => {
+        const text = svgElement('text', { x: position, y: height - CHART_MARGIN.bottom + 12, 'text-anchor': 'middle', ...label });
+        text.textContent = value;
+        svg.appendChild(text);
+    });
+    if (xLabel) {
+        const text = svgElement('text', { x: CHART_MARGIN.left + plotWidth / 2, y: height - 2, 'text-anchor': 'middle', ...label });
+        text.textContent = xLabel;
+        svg.appendChild(text);
+    }
+    if (yLabel) {
+        const text = svgElement('text', { x: 10, y: CHART_MARGIN.top + plotHeight / 2, 'text-anchor': 'middle',
+            transform: `rotate(-90 10 ${CHART_MARGIN.top + plotHeight / 2})`, ...label });
+        text.textContent = yLabel;
+        svg.appendChild(text);
+    }
+
+    container.appendChild(svg);
+    return { svg, scaleX, scaleY, scaleXValue };
+}
+
+function linePath(values, scaleX, scaleY) {
+    let path = '';
+    values.forEach((value, i) => {
+        if (value === null || !Number.isFinite(value)) return;
+        path += `${path ? 'L' : 'M'}${scaleX(i).toFixed(1)},${scaleY(value).toFixed(1)}`;
+    });
+    return path;
+}
+
+function addLegend(container, series) {
+    const legend = document.createElement('div');
+    legend.className = 'small text-muted mt-1';
+    legend.innerHTML = series.map((s, i) =>
+        `<span class="me-3"><span style="display:inline-block;width:10px;height:10px;background:${s.color || CHART_COLORS[i % CHART_COLORS.length]}"></span> ${s.label}</span>`
+    ).join('');
+    container.appendChild(legend);
+}
+
+/**
+ * Line chart of one or more series over shared x labels.
+ * Series may carry a band: {lower, upper} arrays drawn as a shaded area.
+ */
+function renderLineChart(container, x, series, options = {}) {
+    if (!container || !x || x.length === 0) return;
+    const values = series.flatMap(s => [...s.values, ...(s.band ? [...s.band.lower, ...s.band.upper] : [])]);
+    const [yMin, yMax] = chartExtent(values, options.includeZero !== false);
+    const { svg, scaleX, scaleY } = createChartFrame(container, { x, yMin, yMax, ...options });
+
+    series.forEach((s, i) => {
+        const color = s.color || CHART_COLORS[i % CHART_COLORS.length];
+        if (s.band) {
+            // Shade only positions with both bounds (FastQC leaves positions no read reaches empty)
+            const points = s.band.upper.map((_, j) => j)
+                .filter(j => Number.isFinite(s.band.upper[j]) && Number.isFinite(s.band.lower[j]));
+            const upper = points.map(j => `${scaleX(j).toFixed(1)},${scaleY(s.band.upper[j]).toFixed(1)}`);
+            const lower = points.map(j => `${scaleX(j).toFixed(1)},${scaleY(s.band.lower[j]).toFixed(1)}`).reverse();
+            if (points.length) {
+                svg.appendChild(svgElement('path', { d: `M${[...upper, ...lower].join('L')}Z`, fill: color, 'fill-opacity': 0.15, stroke: 'none' }));
+            }
+        }
+        svg.appendChild(svgElement('path', { d: linePath(s.values, scaleX, scaleY), fill: 'none', stroke: color, 'stroke-width': 1.5 }));
+    });
+
+    if (series.length > 1 || options.legend) addLegend(container, series);
+}
+
+/**
+ * Bar chart of a single series over x labels
+ */
+function renderBarChart(container, x, values, options = {}) {
+    if (!container || !x || x.length === 0) return;
+    const [yMin, yMax] = chartExtent(values);
+    const { svg, scaleX, scaleY } = createChartFrame(container, { x, yMin, yMax, ...options });
+    const step = x.length > 1 ? scaleX(1) - scaleX(0) : 20;
+    const barWidth = Math.max(1, step * 0.8);
+
+    values.forEach((value, i) => {
+        if (!value) return;
+        svg.appendChild(svgElement('rect', {
+            x: scaleX(i) - barWidth / 2, y: scaleY(value), width: barWidth,
+            height: scaleY(yMin) - scaleY(value), fill: options.color || CHART_COLORS[0]
+        }));
+    });
+}
+
+/**
+ * Scatter plot of y against numeric x.
+ * options.density ({xEdges, yEdges, counts} with one counts row per x bin) is
+ * drawn underneath as a heatmap, so all points are represented, not just the drawn ones.
+ */
+function renderScatterChart(container, x, y, options = {}) {
+    if (!container || !x || x.length === 0) return;
+    const density = options.density;
+    const xDomain = density ? [density.xEdges[0], density.xEdges[density.xEdges.length - 1]] : null;
+    const [yMin, yMax] = chartExtent([...y, ...(density ? density.yEdges : [])], options.includeZero === true);
+    const { svg, scaleX, scaleY, scaleXValue } = createChartFrame(container, { x, yMin, yMax, numericX: true, xDomain, ...options });
+    const color = options.color || CHART_COLORS[0];
+
+    if (density) {
+        const maxCount = Math.max(1, ...density.counts.flat());
+        density.counts.forEach((row, i) => row.forEach((count, j) => {
+            if (!count) return;
+            const left = scaleXValue(density.xEdges[i]);
+            const top = scaleY(density.yEdges[j + 1]);
+            svg.appendChild(svgElement('rect', {
+                x: left.toFixed(1), y: top.toFixed(1),
+                width: Math.max(scaleXValue(density.xEdges[i + 1]) - left, 1).toFixed(1),
+                height: Math.max(scaleY(density.yEdges[j]) - top, 1).toFixed(1),
+                fill: color, 'fill-opacity': (0.1 + 0.6 * Math.sqrt(count / maxCount)).toFixed(2)
+            }));
+        }));
+    }
+
+    y.forEach((value, i) => {
+        if (value === null || !Number.isFinite(value)) return;
+        svg.appendChild(svgElement('circle', {
+            cx: scaleX(i).toFixed(1), cy: scaleY(value).toFixed(1), r: options.radius || 2,
+            fill: color, 'fill-opacity': 0.6
+        }));
+    });
+}
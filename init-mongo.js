@@ -82,3 +82,13 @@ db.samples.insertMany([
     spike: null
   }
 ]);
+
+db.samples.createIndex({ sample_id: 1 });
+db.samples.createIndex({ updated_date: -1 });
+db.samples.createIndex({ created_date: -1 });
+db.species_occurrences.createIndex({ tax_id: 1, abundance: -1 });
+db.species_occurrences.createIndex({ species: 1, abundance: -1 });
+db.species_occurrences.createIndex({ sample_id: 1 });
+db.runs.createIndex({ updated_date: -1 });
+db.pipeline_runs.createIndex({ sequencing_run_id: 1, started: -1 });
+db.pipeline_runs.createIndex({ started: -1 });
@@ -0,0 +1,86 @@
+"""Measure cold start of popup subcommands and check what they import.
+
+Runs each command in a fresh interpreter with `python -X importtime` and
+reports the median wall time and import time. Commands that only talk to the
+API or write files must not load the parsing stack; the script exits with
+status 1 if one of them imports a module it should not.
+
+    python benchmarks/cli_startup.py --runs 11
+
+Commands that need pipeline outputs are measured with --help, i.e. up to the
+point where the command starts its work.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+# Modules only needed to parse, validate and format samples
+PARSING_STACK = ('pydantic', 'numpy', 'ijson', 'popup.models', 'popup.parser', 'popup.analysis')
+
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def commands(tmp: Path):
+    """(label, popup arguments, modules the command must not import)"""
+    return [
+        ('--version', ['--version'], PARSING_STACK + ('requests', 'yaml')),
+        ('generate-config', ['generate-config', str(tmp), 'barcode01', '-o', str(tmp / 'config.yaml'),
+                             '--run-id', 'RUN'], PARSING_STACK + ('requests',)),
+        ('test-connection', ['test-connection', '--api', 'http://127.0.0.1:9/api'], PARSING_STACK),
+        ('drain --list', ['drain', '--list'], PARSING_STACK),
+        ('verify-artifacts', ['verify-artifacts', str(tmp)], PARSING_STACK + ('requests',)),
+        ('upload --help', ['upload', '--help'], PARSING_STACK + ('requests', 'yaml')),
+        ('watch --help', ['watch', '--help'], PARSING_STACK + ('requests', 'yaml')),
+    ]
+
+
+def run_once(args, env):
+    """Wall seconds, import seconds and imported modules of one cold run."""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-m', 'popup.cli', *args],
+                            cwd=PACKAGE_DIR, env=env, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True)
+    wall = time.perf_counter() - start
+    import_us, modules = 0, set()
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        modules.add(match.group(4))
+        if len(match.group(3)) == 1:
+            import_us += int(match.group(2))  # Top-level imports include their dependencies
+    return wall, import_us / 1e6, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=11, help='Cold starts per command')
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        env = dict(os.environ, EYRIE_POPUP_CACHE=str(tmp / 'cache'), EYRIE_POPUP_QUEUE=str(tmp / 'queue.sqlite'),
+                   PYTHONPATH=str(PACKAGE_DIR))
+        print(f"{'command':<20}{'wall ms':>10}{'import ms':>12}  unexpected imports")
+        for label, popup_args, forbidden in commands(tmp):
+            runs = [run_once(popup_args, env) for _ in range(args.runs)]
+            modules = runs[-1][2]
+            unexpected = [module for module in forbidden if module in modules]
+            failed |= bool(unexpected)
+            print(f"{label:<20}{statistics.median(r[0] for r in runs) * 1000:>10.0f}"
+                  f"{statistics.median(r[1] for r in runs) * 1000:>12.0f}  {', '.join(unexpected) or '-'}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
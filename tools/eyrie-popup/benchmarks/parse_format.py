@@ -0,0 +1,186 @@
+"""Benchmark the parse -> format pipeline on synthetic species-rich samples.
+
+Generates relative abundance tables with --species taxa per sample, then
+reports per-sample CPU time and memory for parsing (including spike QC) and
+for formatting the upload payload, with hits as dicts and as columns.
+
+    python benchmarks/parse_format.py --species 10000 --samples 5
+
+Timings are medians over the samples, measured without tracing. Memory is
+measured in a second pass under tracemalloc: the peak while running a stage,
+and the memory the parsed sample holds afterwards. The shared lineage registry
+stays warm between samples, as it does in `popup watch` and `analyze-run`.
+
+With --baseline, hits are carried as pydantic TaxonomicAbundance models and
+formatted by attribute, as popup did before TaxonomicHit, for comparison.
+"""
+
+import argparse
+import csv
+import gc
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from popup.models import SampleConfig  # noqa: E402
+from popup.parser import SampleParser  # noqa: E402
+from popup.api.format import FormatHandler  # noqa: E402
+
+COLUMNS = ['tax_id', 'abundance', 'species', 'genus', 'family', 'order', 'class', 'phylum', 'clade',
+           'superkingdom', 'subspecies', 'species subgroup', 'species group', 'estimated counts']
+
+
+def write_sample(path: Path, n_species: int, rng: random.Random):
+    """Write an Emu relative abundance table with n_species taxa drawn from a shared pool."""
+    tax_ids = rng.sample(range(1, n_species * 3), n_species)
+    weights = [rng.paretovariate(1.2) for _ in tax_ids]
+    total = sum(weights)
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f, delimiter='\t')
+        writer.writerow(COLUMNS)
+        for tax_id, weight in zip(tax_ids, weights):
+            genus = f"Genus{tax_id // 7}"
+            writer.writerow([
+                tax_id, weight / total, f"{genus} species{tax_id}", genus, f"Family{tax_id // 50}",
+                f"Order{tax_id // 400}", f"Class{tax_id // 2000}", f"Phylum{tax_id // 8000}", '',
+                'Bacteria', '', '', '', round(weight / total * 100000, 1)
+            ])
+        writer.writerow(['unmapped', 0.01] + [''] * 11 + [1000.0])
+
+
+def sample_config(run_path: Path, sample_id: str) -> SampleConfig:
+    return SampleConfig(
+        sample={'sample_id': sample_id, 'sample_name': sample_id, 'lims_id': sample_id,
+                'sequencing_run_id': run_path.name, 'classification_type': '16S'},
+        base_path=str(run_path.parent),
+        run_directory=run_path.name,
+        results={'rel_abundance_file': f"{sample_id}_rel-abundance.tsv"}
+    )
+
+
+class LegacyFormatHandler(FormatHandler):
+    """Formatting of TaxonomicAbundance model hits by attribute, as before TaxonomicHit."""
+
+    def convert_to_eyrie_format(self, sample_data, config, compact_hits=False, artifact_paths=None):
+        models = sample_data.taxonomic_abundances
+        eyrie_sample = super().convert_to_eyrie_format(sample_data.copy(update={'taxonomic_abundances': []}),
+                                                       config, compact_hits, artifact_paths)
+        contaminants = [taxa for taxa in models if taxa.contamination]
+        if contaminants:
+            eyrie_sample['comments'] = f"Potential contamination detected: {', '.join(t.species for t in contaminants)}"
+
+        spike_scale = sample_data.spike_qc.absolute_scale if sample_data.spike_qc else None
+        ranked_taxa = sorted(models, key=lambda x: x.abundance, reverse=True)
+        taxonomic_summary = {"total_species": len(models), "contaminants_detected": len(contaminants)}
+        if compact_hits and all(taxa.tax_id for taxa in ranked_taxa):
+            taxonomic_summary.update(self._columnar_hits(ranked_taxa, spike_scale))
+        else:
+            taxonomic_summary["hits"] = [
+                {
+                    "tax_id": taxa.tax_id,
+                    "species": taxa.species,
+                    "abundance": round(taxa.abundance * 100, 2),
+                    "genus": taxa.genus,
+                    "family": taxa.family,
+                    "estimated_counts": taxa.estimated_counts,
+                    "absolute_abundance": taxa.abundance * spike_scale if spike_scale else None
+                }
+                for taxa in ranked_taxa
+            ]
+        eyrie_sample['taxonomic_data'] = taxonomic_summary
+        return eyrie_sample
+
+
+def legacy_parse(config: SampleConfig):
+    """Parse a sample, then hold its hits as one validated pydantic model each."""
+    parsed = SampleParser(config).parse_sample()
+    sample_data = parsed.sample_data
+    sample_data.taxonomic_abundances = [hit.to_model() for hit in sample_data.taxonomic_abundances]
+    return parsed
+
+
+def stages(config: SampleConfig, baseline: bool = False):
+    """Pipeline stages as (name, function of the previous stage's result)."""
+    if baseline:
+        formatter = LegacyFormatHandler()
+        parse = legacy_parse
+    else:
+        formatter = FormatHandler()
+        parse = lambda config: SampleParser(config).parse_sample()  # noqa: E731
+    return [
+        ('parse', lambda _: parse(config)),
+        ('format hits', lambda parsed: formatter.convert_to_eyrie_format(parsed.sample_data, config)),
+        ('format columnar', lambda parsed: formatter.convert_to_eyrie_format(parsed.sample_data, config, True)),
+    ]
+
+
+def measure_cpu(configs, baseline=False):
+    times = {}
+    for config in configs:
+        parsed = None
+        for name, stage in stages(config, baseline):
+            gc.collect()
+            start = time.process_time()
+            result = stage(parsed)
+            times.setdefault(name, []).append(time.process_time() - start)
+            if name == 'parse':
+                parsed = result
+    return {name: statistics.median(values) for name, values in times.items()}
+
+
+def measure_memory(configs, baseline=False):
+    peaks, retained = {}, []
+    for config in configs:
+        parsed = None
+        for name, stage in stages(config, baseline):
+            gc.collect()
+            tracemalloc.start()
+            result = stage(parsed)
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            peaks.setdefault(name, []).append(peak)
+            if name == 'parse':
+                parsed = result
+                retained.append(current)
+    return {name: statistics.median(values) for name, values in peaks.items()}, statistics.median(retained)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--species', type=int, default=10000, help='Species per sample')
+    parser.add_argument('--samples', type=int, default=5, help='Samples to measure')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--baseline', action='store_true', help='Carry hits as pydantic models, as before TaxonomicHit')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        run_path = Path(tmp) / 'BENCH_RUN'
+        (run_path / 'results').mkdir(parents=True)
+        configs = []
+        for i in range(args.samples):
+            sample_id = f"barcode{i + 1:02d}"
+            write_sample(run_path / 'results' / f"{sample_id}_rel-abundance.tsv", args.species, rng)
+            configs.append(sample_config(run_path, sample_id))
+
+        # Warm up imports, the spike panel cache and the lineage registry
+        measure_cpu(configs[:1], args.baseline)
+        cpu = measure_cpu(configs, args.baseline)
+        peaks, retained = measure_memory(configs, args.baseline)
+
+    mode = "pydantic model hits (baseline)" if args.baseline else "TaxonomicHit tuples"
+    print(f"{args.samples} samples x {args.species} species, {mode} (median per sample)")
+    print(f"{'stage':<18}{'CPU ms':>10}{'peak MiB':>12}")
+    for name in cpu:
+        print(f"{name:<18}{cpu[name] * 1000:>10.1f}{peaks[name] / 2 ** 20:>12.2f}")
+    print(f"{'parsed sample holds':<28}{retained / 2 ** 20:>12.2f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,8 @@
+"""Run-level analysis across all samples of a sequencing run."""
+
+from .matrix import AbundanceMatrix
+from .contamination import find_run_contaminants
+from .spike import compute_spike_qc
+from .downsample import lttb, summarize_length_quality
+
+__all__ = ['AbundanceMatrix', 'find_run_contaminants', 'compute_spike_qc', 'lttb', 'summarize_length_quality']
@@ -0,0 +1,101 @@
+"""Run-level contamination analysis: barcode cross-talk and negative control sharing."""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from ..config import CROSS_TALK_RATIO, CROSS_TALK_SOURCE_MIN, CONTROL_FOLD
+from ..models import ContaminationSuggestion
+from .matrix import AbundanceMatrix
+
+
+def cross_talk_scores(values: np.ndarray):
+    """
+    Compare every taxon in every sample with its strongest occurrence elsewhere in the run.
+
+    Args:
+        values: Taxa x samples abundance matrix
+
+    Returns:
+        Tuple of (scores, other_max, source) arrays shaped like values: the abundance
+        divided by the highest abundance in any other sample, that highest abundance,
+        and the column index of the sample it occurs in.
+    """
+    n_taxa, n_samples = values.shape
+    if n_samples < 2:
+        empty = np.zeros_like(values)
+        return empty, empty, np.zeros(values.shape, dtype=np.intp)
+
+    rows = np.arange(n_taxa)
+    # Highest and second highest sample per taxon; for the top sample itself the
+    # strongest "other" sample is the runner-up
+    order = np.argsort(values, axis=1)
+    first, second = order[:, -1], order[:, -2]
+    is_first = np.arange(n_samples)[None, :] == first[:, None]
+
+    other_max = np.where(is_first, values[rows, second][:, None], values[rows, first][:, None])
+    source = np.where(is_first, second[:, None], first[:, None])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = np.where(other_max > 0, values / other_max, np.inf)
+    return scores, other_max, source
+
+
+def control_scores(values: np.ndarray, control_columns: np.ndarray) -> np.ndarray:
+    """Abundance of each taxon divided by its highest abundance in any negative control."""
+    if control_columns.size == 0:
+        return np.full(values.shape, np.inf)
+
+    control_max = values[:, control_columns].max(axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(control_max > 0, values / control_max, np.inf)
+
+
+def find_run_contaminants(matrix: AbundanceMatrix,
+                          negative_controls: Sequence[str] = (),
+                          cross_talk_ratio: float = CROSS_TALK_RATIO,
+                          cross_talk_source_min: float = CROSS_TALK_SOURCE_MIN,
+                          control_fold: float = CONTROL_FOLD) -> Dict[str, List[ContaminationSuggestion]]:
+    """
+    Suggest contaminants for every sample of a run in one pass over the abundance matrix.
+
+    A taxon is suggested in a sample when it is a likely cross-talk artefact (a trace
+    of a taxon that is abundant in another barcode) or when it also occurs in a
+    negative control and is not clearly enriched over it.
+
+    Args:
+        matrix: Abundance matrix of the whole run
+        negative_controls: Sample IDs of the run's negative controls
+        cross_talk_ratio: Maximum abundance relative to the strongest other sample
+        cross_talk_source_min: Minimum abundance of the taxon in that other sample
+        control_fold: Enrichment over the negative controls needed to clear a shared taxon
+
+    Returns:
+        Suggestions per sample ID, most abundant first; controls are not flagged
+    """
+    values = matrix.values
+    present = values > 0
+    control_columns = matrix.sample_columns(negative_controls)
+
+    ct_scores, other_max, source = cross_talk_scores(values)
+    cross_talk = present & (other_max >= cross_talk_source_min) & (ct_scores <= cross_talk_ratio)
+
+    nc_scores = control_scores(values, control_columns)
+    shared = present & (nc_scores < control_fold)
+
+    flagged = cross_talk | shared
+    flagged[:, control_columns] = False
+
+    suggestions: Dict[str, List[ContaminationSuggestion]] = {sample_id: [] for sample_id in matrix.sample_ids}
+    taxa_idx, sample_idx = np.nonzero(flagged)
+    for row, col in sorted(zip(taxa_idx, sample_idx), key=lambda rc: -values[rc]):
+        sample_id = matrix.sample_ids[col]
+        suggestions[sample_id].append(ContaminationSuggestion(
+            tax_id=matrix.taxon_keys[row],
+            species=matrix.species[row],
+            abundance=float(values[row, col]),
+            cross_talk_score=float(ct_scores[row, col]) if cross_talk[row, col] else None,
+            cross_talk_source=matrix.sample_ids[source[row, col]] if cross_talk[row, col] else None,
+            control_score=float(nc_scores[row, col]) if shared[row, col] else None
+        ))
+    return suggestions
@@ -0,0 +1,125 @@
+"""Fixed-size summaries of per-read length/quality data for plotting."""
+
+from typing import Any, Dict, Sequence
+
+import numpy as np
+
+# Points per LTTB series; the UI picks the one that fits its width
+DEFAULT_RESOLUTIONS = (250, 1000, 4000)
+
+# Length x quality bins of the density histogram
+LENGTH_BINS = 64
+QUALITY_BINS = 32
+
+
+def to_list(values: np.ndarray, decimals: int = 0) -> list:
+    """JSON-ready list, integers when decimals is 0."""
+    if decimals == 0:
+        return np.rint(values).astype(np.int64).tolist()
+    return np.round(values.astype(np.float64), decimals).tolist()
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Splits the points (sorted by x) into threshold - 2 buckets and keeps from each
+    the point forming the largest triangle with the previously kept point and the
+    mean of the next bucket, so peaks and dips survive. First and last points are
+    always kept.
+
+    Returns:
+        Indices of the kept points, ascending
+    """
+    n = x.size
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # Bucket i spans [starts[i], starts[i + 1]); the last start is the final point
+    every = (n - 2) / (threshold - 2)
+    starts = np.floor(np.arange(threshold - 1) * every).astype(np.intp) + 1
+    # Prefix sums give each bucket's mean in O(1)
+    x_sums = np.concatenate(([0.0], np.cumsum(x, dtype=np.float64)))
+    y_sums = np.concatenate(([0.0], np.cumsum(y, dtype=np.float64)))
+
+    kept = np.empty(threshold, dtype=np.intp)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for bucket in range(threshold - 2):
+        lo, hi = starts[bucket], starts[bucket + 1]
+        if bucket + 2 < threshold - 1:
+            next_lo, next_hi = starts[bucket + 1], starts[bucket + 2]
+            mean_x = (x_sums[next_hi] - x_sums[next_lo]) / (next_hi - next_lo)
+            mean_y = (y_sums[next_hi] - y_sums[next_lo]) / (next_hi - next_lo)
+        else:
+            mean_x, mean_y = x[n - 1], y[n - 1]
+
+        areas = np.abs((x[a] - mean_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (mean_y - y[a]))
+        a = lo + int(np.argmax(areas))
+        kept[bucket + 1] = a
+    return kept
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int, x_decimals: int = 0, y_decimals: int = 2) -> Dict[str, list]:
+    """LTTB-downsampled series of points sorted by x, as {'x': [...], 'y': [...]}."""
+    keep = lttb_indices(x, y, threshold)
+    return {'x': to_list(x[keep], x_decimals), 'y': to_list(y[keep], y_decimals)}
+
+
+def length_quality_histogram(lengths: np.ndarray, qualities: np.ndarray,
+                             length_bins: int = LENGTH_BINS, quality_bins: int = QUALITY_BINS) -> Dict[str, list]:
+    """
+    Read counts on a fixed length x quality grid.
+
+    Length bins are log-spaced since read lengths span orders of magnitude.
+
+    Returns:
+        Dict with length_edges, quality_edges and counts (one row per length bin)
+    """
+    low, high = max(float(lengths.min()), 1.0), max(float(lengths.max()), 2.0)
+    length_edges = np.geomspace(low, high if high > low else low + 1, length_bins + 1)
+    q_low, q_high = np.floor(qualities.min()), np.ceil(qualities.max())
+    quality_edges = np.linspace(q_low, q_high if q_high > q_low else q_low + 1, quality_bins + 1)
+
+    counts, _, _ = np.histogram2d(lengths, qualities, bins=[length_edges, quality_edges])
+    return {
+        'length_edges': to_list(length_edges),
+        'quality_edges': to_list(quality_edges, 2),
+        'counts': counts.astype(np.int64).tolist()
+    }
+
+
+def summarize_length_quality(lengths: Sequence[float], qualities: Sequence[float],
+                             resolutions: Sequence[int] = DEFAULT_RESOLUTIONS) -> Dict[str, Any]:
+    """
+    Plot data for a length vs quality scatter whose size does not grow with the read count.
+
+    Args:
+        lengths: Read length per read
+        qualities: Mean read quality per read
+        resolutions: Point counts of the LTTB series to produce
+
+    Returns:
+        Dict with the read count, a density histogram and one LTTB series per
+        resolution ({'length': [...], 'quality': [...]}, sorted by length)
+    """
+    lengths = np.asarray(lengths, dtype=np.float64)
+    qualities = np.asarray(qualities, dtype=np.float64)
+    valid = np.isfinite(lengths) & np.isfinite(qualities) & (lengths > 0)
+    lengths, qualities = lengths[valid], qualities[valid]
+    if lengths.size == 0:
+        return {'reads': 0}
+
+    order = np.argsort(lengths, kind='stable')
+    lengths, qualities = lengths[order], qualities[order]
+
+    series = {}
+    for resolution in resolutions:
+        points = lttb(lengths, qualities, resolution)
+        series[str(resolution)] = {'length': points['x'], 'quality': points['y']}
+
+    return {
+        'reads': int(lengths.size),
+        'histogram': length_quality_histogram(lengths, qualities),
+        'series': series
+    }
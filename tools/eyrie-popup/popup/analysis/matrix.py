@@ -0,0 +1,64 @@
+"""Dense taxa x samples abundance matrix for run-level analysis."""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from ..models import TaxonomicHit
+
+
+class AbundanceMatrix:
+    """Relative abundances of every taxon in every sample of a sequencing run.
+
+    Rows are taxa (keyed by tax_id, falling back to the species name), columns
+    are samples; a taxon missing from a sample has abundance 0.
+    """
+
+    def __init__(self, taxon_keys: Sequence[str], species: Sequence[str],
+                 sample_ids: Sequence[str], values: np.ndarray):
+        self.taxon_keys = list(taxon_keys)
+        self.species = list(species)
+        self.sample_ids = list(sample_ids)
+        self.values = values
+        self._sample_index = {sample_id: i for i, sample_id in enumerate(self.sample_ids)}
+
+    @classmethod
+    def from_samples(cls, samples: Dict[str, List[TaxonomicHit]]) -> 'AbundanceMatrix':
+        """Build the matrix from parsed taxonomic abundances per sample ID."""
+        taxon_index: Dict[str, int] = {}
+        species: List[str] = []
+        rows: List[int] = []
+        cols: List[int] = []
+        abundances: List[float] = []
+
+        for col, taxa in enumerate(samples.values()):
+            for taxon in taxa:
+                key = taxon.tax_id or taxon.species
+                row = taxon_index.get(key)
+                if row is None:
+                    row = taxon_index[key] = len(species)
+                    species.append(taxon.species)
+                rows.append(row)
+                cols.append(col)
+                abundances.append(taxon.abundance)
+
+        values = np.zeros((len(species), len(samples)), dtype=np.float64)
+        # Accumulate so duplicate rows for a taxon within one sample add up
+        np.add.at(values, (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)), abundances)
+
+        return cls(list(taxon_index), species, list(samples), values)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def sample_column(self, sample_id: str) -> int:
+        """Column index of a sample."""
+        return self._sample_index[sample_id]
+
+    def sample_columns(self, sample_ids: Sequence[str]) -> np.ndarray:
+        """Column indices of the given samples that are present in the matrix."""
+        return np.array(
+            [self._sample_index[sample_id] for sample_id in sample_ids if sample_id in self._sample_index],
+            dtype=np.intp
+        )
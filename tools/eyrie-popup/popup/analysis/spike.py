@@ -0,0 +1,96 @@
+"""Run-wide spike-in QC computed over the abundance matrix."""
+
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from ..config import SPIKE_RATIO_RANGE
+from ..models import SpikeQC
+from ..utils.spike_panels import get_spike_panel
+from .matrix import AbundanceMatrix
+
+
+def spike_rows(matrix: AbundanceMatrix, classification_type: Optional[str] = None) -> np.ndarray:
+    """Boolean mask of the matrix rows that are taxa of a classification type's spike panel."""
+    panel = get_spike_panel(classification_type)
+    return np.fromiter(
+        (panel.match(species, tax_id) is not None for tax_id, species in zip(matrix.taxon_keys, matrix.species)),
+        dtype=bool,
+        count=len(matrix.taxon_keys)
+    )
+
+
+def spike_mask(matrix: AbundanceMatrix,
+               classification_types: Optional[Sequence[Optional[str]]] = None) -> np.ndarray:
+    """Taxa x samples mask of spike taxa, using each sample's classification panel."""
+    n_samples = len(matrix.sample_ids)
+    types = list(classification_types) if classification_types is not None else [None] * n_samples
+    distinct = list(dict.fromkeys(types))
+    panel_masks = np.stack([spike_rows(matrix, t) for t in distinct], axis=1) if distinct else \
+        np.zeros((len(matrix.taxon_keys), 0), dtype=bool)
+    return panel_masks[:, [distinct.index(t) for t in types]]
+
+
+def _per_sample(values: Optional[Sequence[Optional[float]]], n_samples: int) -> np.ndarray:
+    """Per-sample float array with NaN where a value is not known."""
+    if values is None:
+        return np.full(n_samples, np.nan)
+    return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+
+
+def compute_spike_qc(matrix: AbundanceMatrix,
+                     expected_abundance: Optional[Sequence[Optional[float]]] = None,
+                     spike_amount: Optional[Sequence[Optional[float]]] = None,
+                     classification_types: Optional[Sequence[Optional[str]]] = None,
+                     ratio_range=SPIKE_RATIO_RANGE) -> Dict[str, SpikeQC]:
+    """
+    Compute spike recovery for every sample of a run in one pass.
+
+    Args:
+        matrix: Abundance matrix of the run
+        expected_abundance: Expected spike relative abundance per sample column (None if unknown)
+        spike_amount: Amount of spike added per sample column (None if unknown)
+        classification_types: Classification type per sample column, selecting its spike panel
+        ratio_range: Observed/expected ratios accepted as a passing spike-in
+
+    Returns:
+        SpikeQC per sample ID
+    """
+    n_samples = len(matrix.sample_ids)
+    expected = _per_sample(expected_abundance, n_samples)
+    amount = _per_sample(spike_amount, n_samples)
+
+    mask = spike_mask(matrix, classification_types)
+    spike_values = np.where(mask, matrix.values, 0.0)
+
+    observed = spike_values.sum(axis=0)
+    top = spike_values.argmax(axis=0) if spike_values.size else np.zeros(n_samples, dtype=np.intp)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(expected > 0, observed / expected, np.nan)
+        scale = np.where(observed > 0, amount / observed, np.nan)
+
+    low, high = ratio_range
+    status = np.select(
+        [observed <= 0, np.isnan(ratio), ratio < low, ratio > high],
+        ['missing', 'detected', 'low', 'high'],
+        default='ok'
+    )
+
+    def optional(value) -> Optional[float]:
+        return None if np.isnan(value) else float(value)
+
+    results = {}
+    for col, sample_id in enumerate(matrix.sample_ids):
+        found = observed[col] > 0
+        results[sample_id] = SpikeQC(
+            species=matrix.species[top[col]] if found else None,
+            tax_id=matrix.taxon_keys[top[col]] if found else None,
+            abundance=float(observed[col]),
+            expected_abundance=optional(expected[col]),
+            observed_expected_ratio=optional(ratio[col]),
+            spike_amount=optional(amount[col]),
+            absolute_scale=optional(scale[col]),
+            status=str(status[col])
+        )
+    return results
@@ -1,5 +1,6 @@
 """API client modules for communicating with Eyrie database."""
 
 from .client import EyrieAPIClient
+from .ingest_queue import IngestQueue, drain_queue, drain_forever
 
-__all__ = ['EyrieAPIClient']
+__all__ = ['EyrieAPIClient', 'IngestQueue', 'drain_queue', 'drain_forever']
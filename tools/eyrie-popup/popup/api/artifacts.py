@@ -0,0 +1,134 @@
+"""Chunked, resumable artifact uploads to the Eyrie API."""
+
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from requests.adapters import HTTPAdapter
+
+from ..utils.artifacts import file_sha256
+
+DEFAULT_WORKERS = 4
+CHUNK_ATTEMPTS = 5
+RETRY_BACKOFF = 0.5  # Seconds, doubled after every failed attempt
+UPLOAD_RESTARTS = 2  # Times an upload the server no longer knows is started again
+
+
+class UploadGone(Exception):
+    """The server no longer knows an upload, e.g. another client completed the same content."""
+
+
+class ArtifactUploadHandler:
+    """Pushes files into the server's content-addressed store, chunk by chunk."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def push_files(self, base_path: Path, paths: List[str], workers: int = DEFAULT_WORKERS) -> Optional[Dict[str, str]]:
+        """
+        Upload files given relative to base_path concurrently.
+
+        Returns:
+            Relative path -> blob path for every existing file, or None if any
+            of them failed to upload (the sample must not link to it)
+        """
+        # One pooled connection per worker instead of the default pool of 10 shared by all
+        self.client.session.mount(self.client.api_url, HTTPAdapter(pool_connections=1, pool_maxsize=workers))
+
+        files = [path for path in paths if (base_path / path).is_file()]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            blobs = dict(zip(files, executor.map(lambda path: self.push_file(base_path / path), files)))
+        failed = [path for path, blob in blobs.items() if not blob]
+        if failed:
+            print(f"✗ Failed to push {len(failed)}/{len(files)} artifacts: {', '.join(failed)}")
+            return None
+        return blobs
+
+    def push_file(self, file_path: Path) -> Optional[str]:
+        """Upload one file, sending only the chunks the server does not have yet."""
+        try:
+            sha256 = file_sha256(file_path)
+            for _ in range(UPLOAD_RESTARTS + 1):
+                try:
+                    return self._upload(file_path, sha256)
+                except UploadGone:
+                    # Starting again returns the blob if another client stored the same content
+                    continue
+            print(f"✗ Upload of {file_path.name} was discarded by the server {UPLOAD_RESTARTS + 1} times; rerun to resume")
+            return None
+        except Exception as e:
+            print(f"✗ Error uploading {file_path.name}: {e}")
+            return None
+
+    def _upload(self, file_path: Path, sha256: str) -> Optional[str]:
+        """Start or resume an upload and send its missing chunks; returns the blob path."""
+        response = self.client.session.post(
+            f"{self.client.api_url}/artifacts/uploads",
+            json={'sha256': sha256, 'size': file_path.stat().st_size, 'suffix': file_path.suffix}
+        )
+        if response.status_code != 200:
+            print(f"✗ Failed to start upload of {file_path.name}: {response.status_code}")
+            print(f"  Response: {response.text}")
+            return None
+
+        state = response.json()
+        if state.get('complete'):
+            return state['blob']
+
+        received = set(state['received'])
+        with open(file_path, 'rb') as f:
+            for index in range(state['chunks']):
+                if index in received:
+                    continue
+                f.seek(index * state['chunk_size'])
+                result = self._put_chunk(state['upload_id'], index, f.read(state['chunk_size']))
+                if result is None:
+                    print(f"✗ Failed to upload chunk {index} of {file_path.name}; rerun to resume")
+                    return None
+                if result.get('complete'):
+                    return result['blob']
+
+        response = self.client.session.post(f"{self.client.api_url}/artifacts/uploads/{state['upload_id']}/complete")
+        if response.status_code == 404:
+            raise UploadGone(state['upload_id'])
+        if response.status_code != 200:
+            print(f"✗ Failed to complete upload of {file_path.name}: {response.status_code}")
+            print(f"  Response: {response.text}")
+            return None
+        return response.json()['blob']
+
+    def _put_chunk(self, upload_id: str, index: int, data: bytes) -> Optional[Dict[str, Any]]:
+        """
+        PUT a chunk with its checksum, retrying with backoff on errors.
+
+        Returns:
+            The server's response, with 'complete' and 'blob' if the content is
+            already stored, or None on failure
+
+        Raises:
+            UploadGone: the server no longer knows the upload
+        """
+        headers = {'X-Chunk-SHA256': hashlib.sha256(data).hexdigest(), 'Content-Type': 'application/octet-stream'}
+        for attempt in range(CHUNK_ATTEMPTS):
+            try:
+                response = self.client.session.put(
+                    f"{self.client.api_url}/artifacts/uploads/{upload_id}/chunks/{index}",
+                    data=data,
+                    headers=headers
+                )
+                if response.status_code == 200:
+                    return response.json()
+                if response.status_code == 404:
+                    raise UploadGone(upload_id)
+                # Client errors other than a corrupted chunk will not go away by retrying
+                if 400 <= response.status_code < 500 and response.status_code != 422:
+                    print(f"  Chunk {index}: {response.status_code} {response.text}")
+                    return None
+            except UploadGone:
+                raise
+            except Exception as e:
+                print(f"  Chunk {index}: {e}")
+            time.sleep(RETRY_BACKOFF * 2 ** attempt)
+        return None
@@ -0,0 +1,208 @@
+"""Asyncio API client for Eyrie database, for embedding popup in async services."""
+
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from ..models import ParsedSample, SampleConfig
+from .format import FormatHandler
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_TIMEOUT = 60.0
+
+
+class AsyncEyrieAPIClient:
+    """
+    Async counterpart of EyrieAPIClient built on httpx.
+
+    All requests share one connection pool (HTTP/1.1 keep-alive, or HTTP/2
+    multiplexing with http2=True, which needs the h2 package), and a semaphore
+    bounds how many are in flight, so many uploads can share one event loop.
+
+        async with AsyncEyrieAPIClient(api_url, username, password) as client:
+            results = await client.upload_samples(samples)
+    """
+
+    def __init__(self, api_url: str, username: Optional[str] = None, password: Optional[str] = None,
+                 max_concurrency: int = DEFAULT_CONCURRENCY, http2: bool = False,
+                 timeout: float = DEFAULT_TIMEOUT):
+        self.api_url = api_url.rstrip('/')
+        self.username = username
+        self.password = password
+        self.session = httpx.AsyncClient(
+            http2=http2,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+        )
+        self.format_handler = FormatHandler()
+        self.max_concurrency = max_concurrency
+        # Created on first use, inside the event loop that runs the client
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._auth_lock: Optional[asyncio.Lock] = None
+        self._authenticated = False
+
+    async def __aenter__(self) -> 'AsyncEyrieAPIClient':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the connection pool."""
+        await self.session.aclose()
+
+    @property
+    def _limit(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        async with self._limit:
+            return await self.session.request(method, f"{self.api_url}{path}", **kwargs)
+
+    async def authenticate(self) -> bool:
+        """Authenticate with the Eyrie API (once, however many tasks ask)."""
+        if not self.username or not self.password:
+            return True  # No authentication required
+
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            if self._authenticated:
+                return True
+            try:
+                response = await self._request('POST', '/auth/login',
+                                               json={"username": self.username, "password": self.password})
+            except httpx.HTTPError as e:
+                print(f"✗ Authentication error: {e}")
+                return False
+
+            if response.status_code != 200:
+                print(f"✗ Authentication failed: {response.status_code}")
+                return False
+            token = response.json().get("access_token")
+            if not token:
+                print("✗ Authentication failed: No token received")
+                return False
+
+            self.session.headers["Authorization"] = f"Bearer {token}"
+            self._authenticated = True
+            print("✓ Authenticated with Eyrie API")
+            return True
+
+    async def test_connection(self) -> bool:
+        """Test connection to Eyrie API."""
+        # Health endpoint is at base URL without /api prefix
+        base_url = self.api_url[:-len('/api')] if self.api_url.endswith('/api') else self.api_url
+        try:
+            async with self._limit:
+                response = await self.session.get(f"{base_url}/health")
+        except httpx.HTTPError as e:
+            print(f"✗ Cannot connect to Eyrie API: {e}")
+            return False
+        if response.status_code == 200:
+            print("✓ Connection to Eyrie API successful")
+            return True
+        print(f"✗ Eyrie API health check failed: {response.status_code}")
+        return False
+
+    async def upload_sample(self, parsed_sample: ParsedSample, config: SampleConfig, compact_hits: bool = False,
+                            artifact_paths: Optional[Dict[str, str]] = None) -> bool:
+        """Upload a single sample to Eyrie."""
+        results = await self.upload_samples([(parsed_sample, config)], compact_hits,
+                                            [artifact_paths] if artifact_paths else None)
+        return results[0]
+
+    async def upload_samples(self, samples: Iterable[Tuple[ParsedSample, SampleConfig]], compact_hits: bool = False,
+                             artifact_paths: Optional[List[Optional[Dict[str, str]]]] = None) -> List[bool]:
+        """
+        Upload many samples concurrently.
+
+        The taxonomy of all samples goes up in one request before the samples,
+        which are then sent at most max_concurrency at a time.
+
+        Args:
+            samples: (parsed sample, config) pairs
+            artifact_paths: Blob paths per sample, as for upload_sample
+
+        Returns:
+            Whether each sample was uploaded, in order
+        """
+        samples = list(samples)
+        if not samples:
+            return []
+        if not await self.authenticate():
+            return [False] * len(samples)
+
+        payloads = []
+        taxonomy = {}
+        for (parsed_sample, config), paths in zip(samples, artifact_paths or [None] * len(samples)):
+            sample_data = parsed_sample.sample_data
+            payloads.append(self.format_handler.convert_to_eyrie_format(sample_data, config, compact_hits, paths))
+            for entry in self.format_handler.taxonomy_entries(sample_data):
+                taxonomy[entry['tax_id']] = entry
+
+        # Columnar hits only carry tax_ids, so their taxonomy must be stored first
+        if not await self.upload_taxonomy(list(taxonomy.values()), f"{len(samples)} samples") and compact_hits:
+            return [False] * len(samples)
+
+        return await self.send_samples(payloads)
+
+    async def send_samples(self, eyrie_samples: List[Dict[str, Any]]) -> List[bool]:
+        """Create or update samples already converted to Eyrie format, concurrently."""
+        return list(await asyncio.gather(*(self.send_sample(sample) for sample in eyrie_samples)))
+
+    async def send_sample(self, eyrie_sample: Dict[str, Any]) -> bool:
+        """Create or update one sample already converted to Eyrie format."""
+        sample_id = eyrie_sample['sample_id']
+        try:
+            existing = await self._request('GET', f"/samples/{sample_id}")
+            if existing.status_code == 200:
+                response = await self._request('PUT', f"/samples/{sample_id}", json=eyrie_sample)
+                action = "Updated"
+            else:
+                response = await self._request('POST', "/samples", json=eyrie_sample)
+                action = "Created"
+        except httpx.HTTPError as e:
+            print(f"✗ Error uploading sample {sample_id}: {e}")
+            return False
+
+        if response.status_code in [200, 201]:
+            print(f"✓ {action} sample: {sample_id}")
+            return True
+        print(f"✗ Failed to upload sample {sample_id}: {response.status_code}")
+        print(f"  Response: {response.text}")
+        return False
+
+    async def upload_taxonomy(self, entries: List[Dict[str, Any]], label: str) -> bool:
+        """Upload name and lineage of taxa to the shared taxonomy collection."""
+        if not entries:
+            return True
+        try:
+            response = await self._request('POST', "/taxonomy", json=entries)
+        except httpx.HTTPError as e:
+            print(f"✗ Error uploading taxonomy for {label}: {e}")
+            return False
+        if response.status_code != 200:
+            print(f"✗ Failed to upload taxonomy for {label}: {response.status_code}")
+            print(f"  Response: {response.text}")
+            return False
+        return True
+
+    async def update_sample_fields(self, sample_id: str, fields: Dict[str, Any]) -> bool:
+        """Partially update an existing sample."""
+        if not await self.authenticate():
+            return False
+        try:
+            response = await self._request('PATCH', f"/samples/{sample_id}", json=fields)
+        except httpx.HTTPError as e:
+            print(f"✗ Error updating sample {sample_id}: {e}")
+            return False
+        if response.status_code == 200:
+            print(f"✓ Updated {', '.join(fields)} on sample: {sample_id}")
+            return True
+        print(f"✗ Failed to update sample {sample_id}: {response.status_code}")
+        print(f"  Response: {response.text}")
+        return False
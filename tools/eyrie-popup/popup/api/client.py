@@ -1,11 +1,16 @@
 """Main API client for Eyrie database."""
 
 import requests
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from ..models import ParsedSample, SampleConfig
-from .upload import UploadHandler
-from .format import FormatHandler
+from .artifacts import ArtifactUploadHandler, DEFAULT_WORKERS
+from .ingest_queue import IngestQueue, drain_queue, DEFAULT_BATCH_SIZE
+
+if TYPE_CHECKING:
+    from ..models import ParsedSample, SampleConfig, RunData, PipelineRun
+    from .upload import UploadHandler
+    from .format import FormatHandler
 
 
 class EyrieAPIClient:
@@ -18,9 +23,24 @@ class EyrieAPIClient:
         self.session = requests.Session()
         self._authenticated = False
         
-        # Initialize handlers
-        self.upload_handler = UploadHandler(self)
-        self.format_handler = FormatHandler()
+        # Initialize handlers; sample upload and formatting (pydantic, numpy) load on first use
+        self._upload_handler: Optional['UploadHandler'] = None
+        self._format_handler: Optional['FormatHandler'] = None
+        self.artifact_handler = ArtifactUploadHandler(self)
+
+    @property
+    def upload_handler(self) -> 'UploadHandler':
+        if self._upload_handler is None:
+            from .upload import UploadHandler
+            self._upload_handler = UploadHandler(self)
+        return self._upload_handler
+
+    @property
+    def format_handler(self) -> 'FormatHandler':
+        if self._format_handler is None:
+            from .format import FormatHandler
+            self._format_handler = FormatHandler()
+        return self._format_handler
 
     def authenticate(self) -> bool:
         """Authenticate with the Eyrie API."""
@@ -56,13 +76,70 @@ class EyrieAPIClient:
             print(f"✗ Authentication error: {e}")
             return False
 
-    def upload_sample(self, parsed_sample: ParsedSample, config: SampleConfig) -> bool:
+    def upload_sample(self, parsed_sample: 'ParsedSample', config: 'SampleConfig', compact_hits: bool = False,
+                      artifact_paths: Optional[Dict[str, str]] = None) -> bool:
         """Upload a single sample to Eyrie."""
         if not self._authenticated and (self.username and self.password):
             if not self.authenticate():
                 return False
 
-        return self.upload_handler.upload_sample(parsed_sample.sample_data, config)
+        return self.upload_handler.upload_sample(parsed_sample.sample_data, config, compact_hits, artifact_paths)
+
+    def queue_sample(self, queue: IngestQueue, parsed_sample: 'ParsedSample', config: 'SampleConfig',
+                     compact_hits: bool = False, artifact_paths: Optional[Dict[str, str]] = None,
+                     manifest: Optional[Dict[str, Any]] = None):
+        """Format a sample and add it to the durable upload queue; see drain_queue."""
+        sample_data = parsed_sample.sample_data
+        payload = {
+            'sample': self.format_handler.convert_to_eyrie_format(sample_data, config, compact_hits, artifact_paths),
+            'taxonomy': self.format_handler.taxonomy_entries(sample_data),
+            'compact_hits': compact_hits
+        }
+        queue.put(self.api_url, sample_data.sample_info.sample_id, payload, manifest)
+
+    def drain_queue(self, queue: IngestQueue, batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, int]:
+        """Upload this API's queued samples; returns counts of 'uploaded' and 'failed'."""
+        return drain_queue(self, queue, batch_size)
+
+    def add_flagged_contaminants(self, sample_id: str, species: List[str]) -> bool:
+        """Add species to a sample's flagged contaminants, keeping existing flags."""
+        if not self._authenticated and (self.username and self.password):
+            if not self.authenticate():
+                return False
+
+        return self.upload_handler.add_flagged_contaminants(sample_id, species)
+
+    def update_sample_fields(self, sample_id: str, fields: Dict[str, Any]) -> bool:
+        """Partially update an existing sample."""
+        if not self._authenticated and (self.username and self.password):
+            if not self.authenticate():
+                return False
+
+        return self.upload_handler.update_sample_fields(sample_id, fields)
+
+    def upload_run(self, run_data: 'RunData') -> bool:
+        """Upload a run's combined matrices as one run document."""
+        if not self._authenticated and (self.username and self.password):
+            if not self.authenticate():
+                return False
+
+        return self.upload_handler.upload_run(run_data)
+
+    def upload_pipeline_run(self, pipeline_run: 'PipelineRun') -> bool:
+        """Upload a parsed Nextflow execution trace."""
+        if not self._authenticated and (self.username and self.password):
+            if not self.authenticate():
+                return False
+
+        return self.upload_handler.upload_pipeline_run(pipeline_run)
+
+    def push_artifacts(self, base_path: Path, paths: List[str], workers: int = DEFAULT_WORKERS) -> Optional[Dict[str, str]]:
+        """Upload files to the server's artifact store; returns relative path -> blob path, or None on failure."""
+        if not self._authenticated and (self.username and self.password):
+            if not self.authenticate():
+                return None
+
+        return self.artifact_handler.push_files(base_path, paths, workers)
 
     def _convert_to_eyrie_format(self, sample_data, config):
         """Convert sample data to Eyrie database format."""
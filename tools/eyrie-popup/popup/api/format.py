@@ -1,16 +1,36 @@
 """Data formatting for Eyrie API."""
 
-from typing import Dict, Any
+import base64
+from operator import attrgetter
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-from ..models import SampleData, SampleConfig
+import numpy as np
+
+from ..models import SampleData, SampleConfig, TaxonomicHit
+
+# taxonomic_data.encoding value for hits stored as parallel arrays
+COLUMNAR_ENCODING = "columnar-v1"
+
+
+def encode_float32(values) -> str:
+    """Pack values as base64 little-endian float32."""
+    return base64.b64encode(np.asarray(values, dtype='<f4').tobytes()).decode('ascii')
 
 
 class FormatHandler:
     """Handles data format conversion for Eyrie API."""
 
-    def convert_to_eyrie_format(self, sample_data: SampleData, config: SampleConfig) -> Dict[str, Any]:
-        """Convert sample data to Eyrie database format."""
+    def convert_to_eyrie_format(self, sample_data: SampleData, config: SampleConfig,
+                                compact_hits: bool = False,
+                                artifact_paths: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Convert sample data to Eyrie database format.
+
+        With compact_hits, taxonomic hits are stored as a tax_id list plus float32
+        columns; names and lineage go to the shared taxonomy collection instead.
+        artifact_paths maps run-relative file paths to content-addressed blobs
+        that should be linked instead of the run directory copies.
+        """
         # Determine QC status based on contamination
         qc_status = "unprocessed"
         comments = []
@@ -46,43 +66,47 @@ class FormatHandler:
                 "read_length_n50": stats.read_length_n50
             }
 
+        # Spike-normalized absolute abundance per unit of relative abundance
+        spike_scale = sample_data.spike_qc.absolute_scale if sample_data.spike_qc else None
+
         # Prepare taxonomic data as additional metadata
+        ranked_taxa = sorted(sample_data.taxonomic_abundances, key=attrgetter('abundance'), reverse=True)
         taxonomic_summary = {
             "total_species": len(sample_data.taxonomic_abundances),
             "contaminants_detected": len(contaminants),
-            "hits": [
+        }
+        if compact_hits and all(taxa.tax_id for taxa in ranked_taxa):
+            taxonomic_summary.update(self._columnar_hits(ranked_taxa, spike_scale))
+        else:
+            taxonomic_summary["hits"] = [
                 {
-                    "species": taxa.species,
-                    "abundance": round(taxa.abundance * 100, 2),  # Convert to percentage
-                    "genus": taxa.genus,
-                    "family": taxa.family,
-                    "estimated_counts": taxa.estimated_counts
+                    "tax_id": lineage.tax_id,
+                    "species": lineage.species,
+                    "abundance": round(abundance * 100, 2),  # Convert to percentage
+                    "genus": lineage.genus,
+                    "family": lineage.family,
+                    "estimated_counts": estimated_counts,
+                    "absolute_abundance": abundance * spike_scale if spike_scale else None
                 }
-                for taxa in sorted(
-                    sample_data.taxonomic_abundances, 
-                    key=lambda x: x.abundance, 
-                    reverse=True
-                )
+                for lineage, abundance, estimated_counts, _ in ranked_taxa
             ]
-        }
 
         # Determine run directory - use config run_directory or fallback to sequencing_run_id
         run_dir = config.run_directory or sample_data.sample_info.sequencing_run_id
 
+        def data_path(file_path: str) -> str:
+            return (artifact_paths or {}).get(file_path) or f"{run_dir}/{file_path}"
+
         # Structured nanoplot files
         nanoplot_data = None
         if sample_data.nanoplot:
-            nanoplot_dict = sample_data.nanoplot.dict()
             # Prepend run_dir to all file paths in the structured nanoplot data
-            if nanoplot_dict.get('unprocessed'):
-                for field, file_path in nanoplot_dict['unprocessed'].items():
-                    if file_path:
-                        nanoplot_dict['unprocessed'][field] = f"{run_dir}/{file_path}"
-            if nanoplot_dict.get('processed'):
-                for field, file_path in nanoplot_dict['processed'].items():
-                    if file_path:
-                        nanoplot_dict['processed'][field] = f"{run_dir}/{file_path}"
-            nanoplot_data = nanoplot_dict
+            nanoplot_data = {
+                stage: {field: data_path(file_path) if file_path else file_path
+                        for field, file_path in file_set.dict().items()} if file_set else None
+                for stage, file_set in (('unprocessed', sample_data.nanoplot.unprocessed),
+                                        ('processed', sample_data.nanoplot.processed))
+            }
 
         return {
             "sample_name": sample_data.sample_info.sample_name,
@@ -94,12 +118,35 @@ class FormatHandler:
             "comments": "; ".join(comments) if comments else "",
             "created_date": datetime.now().isoformat(),
             "updated_date": datetime.now().isoformat(),
-            "krona_file": f"{run_dir}/{sample_data.krona_file}" if sample_data.krona_file else None,
-            "quality_plot": f"{run_dir}/{sample_data.fastqc_file}" if sample_data.fastqc_file else None,
+            "krona_file": data_path(sample_data.krona_file) if sample_data.krona_file else None,
+            "quality_plot": data_path(sample_data.fastqc_file) if sample_data.fastqc_file else None,
             "statistics": statistics,
             "taxonomic_data": taxonomic_summary,
             "nano_stats_processed": sample_data.nano_stats_processed.dict() if sample_data.nano_stats_processed else None,
             "nano_stats_unprocessed": sample_data.nano_stats_unprocessed.dict() if sample_data.nano_stats_unprocessed else None,
             "nanoplot": nanoplot_data,
-            "spike": sample_data.spike if hasattr(sample_data, 'spike') else None
+            "spike": sample_data.spike if hasattr(sample_data, 'spike') else None,
+            "spike_qc": sample_data.spike_qc.dict() if sample_data.spike_qc else None,
+            "multiqc": sample_data.multiqc,
+            "fastqc": sample_data.fastqc,
+            "nanoplot_data": sample_data.nanoplot_data
         }
+
+    def _columnar_hits(self, taxa: List[TaxonomicHit], spike_scale) -> Dict[str, Any]:
+        """Encode hits as parallel arrays: tax_ids plus base64 float32 columns."""
+        abundance = np.array([t.abundance for t in taxa], dtype=np.float64)
+        columns = {
+            "encoding": COLUMNAR_ENCODING,
+            "tax_ids": [t.tax_id for t in taxa],
+            "abundance": encode_float32(abundance * 100),  # Percentage, as in hits
+            "estimated_counts": encode_float32([t.estimated_counts for t in taxa]),
+        }
+        if spike_scale:
+            columns["absolute_abundance"] = encode_float32(abundance * spike_scale)
+        return columns
+
+    def taxonomy_entries(self, sample_data: SampleData) -> List[Dict[str, Any]]:
+        """Shared taxonomy entries (name and lineage per tax_id) for a sample's taxa."""
+        # Taken from the hits, which keep their lineage after the registry's LRU evicts it
+        lineages = {taxa.tax_id: taxa.lineage for taxa in sample_data.taxonomic_abundances if taxa.tax_id}
+        return [lineage.entry() for lineage in lineages.values() if lineage.species]
@@ -0,0 +1,207 @@
+"""Durable on-disk queue of formatted sample uploads, drained with retry."""
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from ..config import CACHE_DIR, RETRY_BACKOFF, MAX_RETRY_BACKOFF, DEFAULT_BATCH_SIZE
+from ..utils.ingest_manifest import IngestManifest
+
+# Queue database; override with the EYRIE_POPUP_QUEUE env var
+QUEUE_FILE = os.getenv('EYRIE_POPUP_QUEUE', str(Path(CACHE_DIR) / "ingest-queue.sqlite"))
+
+# A claimed upload is retried by another drainer if not finished within this many seconds
+LEASE_SECONDS = 600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploads (
+    id INTEGER PRIMARY KEY,
+    api_url TEXT NOT NULL,
+    sample_id TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1,
+    payload TEXT NOT NULL,
+    manifest TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL DEFAULT 0,
+    claimed_until REAL NOT NULL DEFAULT 0,
+    last_error TEXT,
+    queued_date REAL NOT NULL,
+    UNIQUE (api_url, sample_id)
+)
+"""
+
+
+class QueuedUpload(NamedTuple):
+    """One claimed upload."""
+    id: int
+    version: int
+    sample_id: str
+    payload: Dict[str, Any]
+    manifest: Optional[Dict[str, Any]]
+    attempts: int
+
+
+class IngestQueue:
+    """
+    SQLite queue of sample payloads awaiting upload, one entry per sample and API.
+
+    Queueing a sample again replaces its waiting payload. Drainers claim entries
+    with a lease and delete them only after a successful upload, so entries of a
+    crashed drainer are picked up again once their lease expires.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or QUEUE_FILE)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._transaction() as conn:
+            conn.execute(_SCHEMA)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # A connection per call keeps the queue usable from worker threads
+        with closing(sqlite3.connect(self.path, timeout=30, isolation_level=None)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def put(self, api_url: str, sample_id: str, payload: Dict[str, Any],
+            manifest: Optional[Dict[str, Any]] = None):
+        """
+        Queue a sample's upload, replacing any earlier payload still waiting.
+
+        Args:
+            payload: {'sample': Eyrie sample document, 'taxonomy': entries, 'compact_hits': bool}
+            manifest: {'snapshot', 'options'} to record as ingested once the upload succeeds
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO uploads (api_url, sample_id, payload, manifest, queued_date)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (api_url, sample_id) DO UPDATE SET
+                    version = version + 1, payload = excluded.payload, manifest = excluded.manifest,
+                    attempts = 0, next_attempt = 0, last_error = NULL, queued_date = excluded.queued_date
+                """,
+                (api_url, sample_id, json.dumps(payload), json.dumps(manifest) if manifest else None, time.time())
+            )
+
+    def claim(self, api_url: str, limit: int = DEFAULT_BATCH_SIZE) -> List[QueuedUpload]:
+        """Lease up to limit uploads that are due, oldest first."""
+        now = time.time()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, version, sample_id, payload, manifest, attempts FROM uploads
+                WHERE api_url = ? AND next_attempt <= ? AND claimed_until <= ?
+                ORDER BY queued_date LIMIT ?
+                """,
+                (api_url, now, now, limit)
+            ).fetchall()
+            conn.executemany("UPDATE uploads SET claimed_until = ? WHERE id = ?",
+                             [(now + LEASE_SECONDS, row[0]) for row in rows])
+        return [
+            QueuedUpload(row_id, version, sample_id, json.loads(payload), json.loads(manifest) if manifest else None, attempts)
+            for row_id, version, sample_id, payload, manifest, attempts in rows
+        ]
+
+    def done(self, upload: QueuedUpload):
+        """Remove an uploaded entry, unless it was re-queued with a newer payload meanwhile."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM uploads WHERE id = ? AND version = ?", (upload.id, upload.version))
+            conn.execute("UPDATE uploads SET claimed_until = 0 WHERE id = ?", (upload.id,))
+
+    def failed(self, upload: QueuedUpload, error: str):
+        """Release a failed entry for a later retry with exponential backoff."""
+        delay = min(RETRY_BACKOFF * 2 ** upload.attempts, MAX_RETRY_BACKOFF)
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                UPDATE uploads SET attempts = attempts + 1, next_attempt = ?, claimed_until = 0, last_error = ?
+                WHERE id = ? AND version = ?
+                """,
+                (time.time() + delay, error, upload.id, upload.version)
+            )
+            conn.execute("UPDATE uploads SET claimed_until = 0 WHERE id = ?", (upload.id,))
+
+    def entries(self, api_url: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Waiting uploads without their payloads, oldest first."""
+        query = "SELECT api_url, sample_id, attempts, next_attempt, last_error, queued_date FROM uploads"
+        params: tuple = ()
+        if api_url:
+            query += " WHERE api_url = ?"
+            params = (api_url,)
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            rows = conn.execute(query + " ORDER BY queued_date", params).fetchall()
+        keys = ('api_url', 'sample_id', 'attempts', 'next_attempt', 'last_error', 'queued_date')
+        return [dict(zip(keys, row)) for row in rows]
+
+    def __len__(self) -> int:
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            return conn.execute("SELECT COUNT(*) FROM uploads").fetchone()[0]
+
+
+def drain_queue(client, queue: IngestQueue, batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, int]:
+    """
+    Upload the client's due queue entries in batches until none are left.
+
+    Each batch sends the taxonomy of all its samples in one request, then the
+    samples over the client's pooled session. The ingest manifest of each sample
+    is recorded once its upload succeeds.
+
+    Returns:
+        Counts of 'uploaded' and 'failed' entries
+    """
+    counts = {'uploaded': 0, 'failed': 0}
+    if not client.authenticate():
+        return counts
+
+    while True:
+        batch = queue.claim(client.api_url, batch_size)
+        if not batch:
+            return counts
+
+        taxonomy = {}
+        for upload in batch:
+            for entry in upload.payload.get('taxonomy') or []:
+                taxonomy[entry['tax_id']] = entry
+        taxonomy_stored = client.upload_handler.upload_taxonomy(list(taxonomy.values()), f"{len(batch)} queued samples")
+
+        for upload in batch:
+            if upload.payload.get('compact_hits') and not taxonomy_stored:
+                queue.failed(upload, "taxonomy upload failed")
+                counts['failed'] += 1
+            elif client.upload_handler.send_sample(upload.payload['sample']):
+                queue.done(upload)
+                if upload.manifest:
+                    IngestManifest(client.api_url, upload.sample_id).record(
+                        upload.manifest['snapshot'], upload.manifest['options']
+                    )
+                counts['uploaded'] += 1
+            else:
+                queue.failed(upload, "sample upload failed")
+                counts['failed'] += 1
+
+
+def drain_forever(client, queue: IngestQueue, interval: float = RETRY_BACKOFF,
+                  batch_size: int = DEFAULT_BATCH_SIZE, stop=None):
+    """Drain the queue whenever the API is reachable, checking every interval seconds until stopped."""
+    while not (stop and stop.is_set()):
+        if queue.entries(client.api_url) and client.test_connection():
+            counts = drain_queue(client, queue, batch_size)
+            if counts['uploaded'] or counts['failed']:
+                print(f"📤 Drained queue: {counts['uploaded']} uploaded, {counts['failed']} failed, "
+                      f"{len(queue.entries(client.api_url))} waiting")
+        if stop:
+            stop.wait(interval)
+        else:
+            time.sleep(interval)
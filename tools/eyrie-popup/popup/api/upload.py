@@ -1,8 +1,8 @@
 """Upload handling for Eyrie API."""
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
-from ..models import SampleData, SampleConfig
+from ..models import SampleData, SampleConfig, RunData, PipelineRun
 
 
 class UploadHandler:
@@ -11,22 +11,41 @@ class UploadHandler:
     def __init__(self, client):
         self.client = client
 
-    def upload_sample(self, sample_data: SampleData, config: SampleConfig) -> bool:
+    def upload_sample(self, sample_data: SampleData, config: SampleConfig, compact_hits: bool = False,
+                      artifact_paths: Optional[Dict[str, str]] = None) -> bool:
         """Upload a single sample to Eyrie."""
         try:
             # Prepare sample data for Eyrie API
-            eyrie_sample = self.client.format_handler.convert_to_eyrie_format(sample_data, config)
+            eyrie_sample = self.client.format_handler.convert_to_eyrie_format(
+                sample_data, config, compact_hits, artifact_paths
+            )
 
+            # Keep the shared lineage registry current; columnar hits only carry
+            # tax_ids, so for them the taxonomy must be stored first
+            taxonomy = self.client.format_handler.taxonomy_entries(sample_data)
+            if not self.upload_taxonomy(taxonomy, sample_data.sample_info.sample_id) and compact_hits:
+                return False
+
+            return self.send_sample(eyrie_sample)
+
+        except Exception as e:
+            print(f"✗ Error uploading sample {sample_data.sample_info.sample_id}: {e}")
+            return False
+
+    def send_sample(self, eyrie_sample: Dict[str, Any]) -> bool:
+        """Create or update a sample already converted to Eyrie format."""
+        sample_id = eyrie_sample['sample_id']
+        try:
             # Debug: Print spike field to verify it's being included
             print(f"DEBUG: Uploading spike field: {eyrie_sample.get('spike', 'NOT_FOUND')}")
 
             # Check if sample already exists
-            existing_sample = self._get_sample(sample_data.sample_info.sample_id)
+            existing_sample = self._get_sample(sample_id)
 
             if existing_sample:
                 # Update existing sample
                 response = self.client.session.put(
-                    f"{self.client.api_url}/samples/{sample_data.sample_info.sample_id}",
+                    f"{self.client.api_url}/samples/{sample_id}",
                     json=eyrie_sample
                 )
                 action = "Updated"
@@ -39,15 +58,110 @@ class UploadHandler:
                 action = "Created"
 
             if response.status_code in [200, 201]:
-                print(f"✓ {action} sample: {sample_data.sample_info.sample_id}")
+                print(f"✓ {action} sample: {sample_id}")
                 return True
             else:
-                print(f"✗ Failed to upload sample {sample_data.sample_info.sample_id}: {response.status_code}")
+                print(f"✗ Failed to upload sample {sample_id}: {response.status_code}")
                 print(f"  Response: {response.text}")
                 return False
 
         except Exception as e:
-            print(f"✗ Error uploading sample {sample_data.sample_info.sample_id}: {e}")
+            print(f"✗ Error uploading sample {sample_id}: {e}")
+            return False
+
+    def add_flagged_contaminants(self, sample_id: str, species: List[str]) -> bool:
+        """Merge suggested contaminants into an existing sample's flagged contaminants."""
+        existing_sample = self._get_sample(sample_id)
+        if not existing_sample:
+            print(f"✗ Sample {sample_id} not found in Eyrie; upload it before flagging contaminants")
+            return False
+
+        flagged = list(existing_sample.get('flagged_contaminants') or [])
+        flagged += [name for name in species if name not in flagged]
+
+        try:
+            response = self.client.session.put(
+                f"{self.client.api_url}/samples/{sample_id}/species-flags",
+                json={"flagged_contaminants": flagged}
+            )
+            if response.status_code == 200:
+                print(f"✓ Flagged {len(flagged)} contaminant(s) on sample: {sample_id}")
+                return True
+            print(f"✗ Failed to flag contaminants on {sample_id}: {response.status_code}")
+            print(f"  Response: {response.text}")
+            return False
+        except Exception as e:
+            print(f"✗ Error flagging contaminants on {sample_id}: {e}")
+            return False
+
+    def upload_taxonomy(self, entries: List[Dict[str, Any]], label: str) -> bool:
+        """Upload name and lineage of taxa to the shared taxonomy collection."""
+        if not entries:
+            return True
+
+        try:
+            response = self.client.session.post(f"{self.client.api_url}/taxonomy", json=entries)
+        except Exception as e:
+            print(f"✗ Error uploading taxonomy for {label}: {e}")
+            return False
+        if response.status_code != 200:
+            print(f"✗ Failed to upload taxonomy for {label}: {response.status_code}")
+            print(f"  Response: {response.text}")
+            return False
+        return True
+
+    def update_sample_fields(self, sample_id: str, fields: Dict[str, Any]) -> bool:
+        """Partially update an existing sample."""
+        try:
+            response = self.client.session.patch(
+                f"{self.client.api_url}/samples/{sample_id}",
+                json=fields
+            )
+            if response.status_code == 200:
+                print(f"✓ Updated {', '.join(fields)} on sample: {sample_id}")
+                return True
+            print(f"✗ Failed to update sample {sample_id}: {response.status_code}")
+            print(f"  Response: {response.text}")
+            return False
+        except Exception as e:
+            print(f"✗ Error updating sample {sample_id}: {e}")
+            return False
+
+    def upload_run(self, run_data: RunData) -> bool:
+        """Create or replace the run-level document holding the run's combined matrices."""
+        run_id = run_data.sequencing_run_id
+        try:
+            response = self.client.session.put(
+                f"{self.client.api_url}/runs/{run_id}",
+                json=run_data.dict()
+            )
+            if response.status_code == 200:
+                action = "Created" if response.json().get('created') else "Updated"
+                print(f"✓ {action} run: {run_id} ({len(run_data.samples)} samples, ranks: {', '.join(run_data.matrices)})")
+                return True
+            print(f"✗ Failed to upload run {run_id}: {response.status_code}")
+            print(f"  Response: {response.text}")
+            return False
+        except Exception as e:
+            print(f"✗ Error uploading run {run_id}: {e}")
+            return False
+
+    def upload_pipeline_run(self, pipeline_run: PipelineRun) -> bool:
+        """Create or replace a pipeline run with its execution trace tasks."""
+        run_id = pipeline_run.pipeline_run_id
+        try:
+            response = self.client.session.put(
+                f"{self.client.api_url}/pipeline-runs/{run_id}",
+                json=pipeline_run.dict()
+            )
+            if response.status_code == 200:
+                print(f"✓ Uploaded pipeline run: {run_id} ({len(pipeline_run.tasks)} tasks)")
+                return True
+            print(f"✗ Failed to upload pipeline run {run_id}: {response.status_code}")
+            print(f"  Response: {response.text}")
+            return False
+        except Exception as e:
+            print(f"✗ Error uploading pipeline run {run_id}: {e}")
             return False
 
     def _get_sample(self, sample_id: str) -> Optional[Dict[str, Any]]:
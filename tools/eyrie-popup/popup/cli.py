@@ -1,14 +1,16 @@
 """Command line interface for Eyrie POPUP (Pipeline Output Processor and UPloader)."""
 
-import os
-import yaml
+import threading
 import click
 from pathlib import Path
-from typing import Optional
-
-from .models import SampleConfig
-from .parser import SampleParser
-from .api import EyrieAPIClient
+from typing import Optional, Tuple
+
+# Commands import what they need when they run: popup is started once per sample,
+# and loading the parsers, pydantic, numpy and requests up front dominates start-up
+from .config import (
+    CROSS_TALK_RATIO, CROSS_TALK_SOURCE_MIN, CONTROL_FOLD, DEFAULT_MARKERS, DEFAULT_SAMPLE_ID_TEMPLATE,
+    DEFAULT_BATCH_SIZE, RETRY_BACKOFF
+)
 from .__version__ import __version__
 
 
@@ -25,13 +27,32 @@ def cli():
 @click.option('--username', envvar='EYRIE_USER', help='Username for authentication (or set EYRIE_USER env var)')
 @click.option('--password', envvar='EYRIE_PASSWORD', help='Password for authentication (or set EYRIE_PASSWORD env var)')
 @click.option('--dry-run', is_flag=True, help='Parse data but do not upload to database')
+@click.option('--compact-hits', is_flag=True, help='Store taxonomic hits as columnar arrays with lineage in the shared taxonomy collection')
+@click.option('--artifact-store', type=click.Path(file_okay=False, path_type=Path), help='Data directory served by Eyrie; copy reports and plots into its content-addressed store and link those')
+@click.option('--push-artifacts', is_flag=True, help='Upload reports and plots to the Eyrie API (chunked, resumable) instead of relying on a shared data directory')
+@click.option('--workers', default=4, show_default=True, help='Concurrent artifact uploads with --push-artifacts')
+@click.option('--force', is_flag=True, help='Parse and upload even if no input file changed since the last successful upload')
+@click.option('--queue', 'use_queue', is_flag=True, help='Write the formatted sample to the local ingest queue and upload from there, so it is kept if Eyrie is unreachable')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
-def upload(sample_cnf: Path, api: str, username: Optional[str], password: Optional[str], dry_run: bool, verbose: bool):
+def upload(sample_cnf: Path, api: str, username: Optional[str], password: Optional[str], dry_run: bool,
+           compact_hits: bool, artifact_store: Optional[Path], push_artifacts: bool, workers: int,
+           force: bool, use_queue: bool, verbose: bool):
     """Parse analysis results from YAML configuration and upload to Eyrie."""
+    import yaml
+    from .models import SampleConfig
+    from .parser import SampleParser
+    from .api import EyrieAPIClient, IngestQueue
+    from .utils.artifacts import ArtifactStore, sample_artifact_files, STORE_DIR
+    from .utils.ingest_manifest import IngestManifest, sample_input_files
 
     click.echo(f"🔬 Eyrie POPUP - Pipeline Output Processor & UPloader")
     click.echo(f"📁 Config file: {sample_cnf}")
 
+    if artifact_store and push_artifacts:
+        raise click.UsageError("Use either --artifact-store or --push-artifacts")
+    if use_queue and push_artifacts:
+        raise click.UsageError("--push-artifacts needs the API while parsing; use --artifact-store with --queue")
+
     try:
         # Load configuration
         with open(sample_cnf, 'r') as f:
@@ -44,6 +65,21 @@ def upload(sample_cnf: Path, api: str, username: Optional[str], password: Option
             click.echo(f"📂 Base path: {config.base_path}")
             click.echo(f"🔗 API URL: {api}")
 
+        # Skip samples whose input files are unchanged since their last successful upload
+        manifest = IngestManifest(api, config.sample.sample_id)
+        snapshot = manifest.snapshot(sample_input_files(config, sample_cnf))
+        upload_options = {
+            'compact_hits': compact_hits,
+            'artifact_store': str(artifact_store.resolve()) if artifact_store else None,
+            'push_artifacts': push_artifacts
+        }
+        changed = manifest.changed_files(snapshot, upload_options)
+        if not changed and not force:
+            click.echo(f"✓ {config.sample.sample_id} unchanged since last upload - skipping (use --force to re-upload)")
+            return
+        if verbose:
+            click.echo(f"📝 {len(changed)} changed input files")
+
         # Parse the sample
         click.echo("\n🔍 Parsing analysis files...")
         parser = SampleParser(config)
@@ -56,6 +92,10 @@ def upload(sample_cnf: Path, api: str, username: Optional[str], password: Option
         if sample_data.fastqc_file:
             click.echo(f"  ✓ FastQC: {sample_data.fastqc_file}")
 
+        if sample_data.fastqc:
+            failed = [name for name, status in sample_data.fastqc['modules'].items() if status == 'fail']
+            click.echo(f"  ✓ FastQC data: {len(sample_data.fastqc['modules'])} modules, {len(failed)} failed")
+
         if sample_data.krona_file:
             click.echo(f"  ✓ Krona: {sample_data.krona_file}")
 
@@ -75,17 +115,11 @@ def upload(sample_cnf: Path, api: str, username: Optional[str], password: Option
                 click.echo(f"  ⚠️  Potential contaminants: {contaminants}")
             
             # Display spike species detection
-            if hasattr(sample_data, 'spike') and sample_data.spike:
-                # Find abundance for the spike species
-                spike_abundance = None
-                for taxa in sample_data.taxonomic_abundances:
-                    if taxa.species == sample_data.spike:
-                        spike_abundance = taxa.abundance
-                        break
-                if spike_abundance is not None:
-                    click.echo(f"  🎯 Spike species detected: {sample_data.spike} ({spike_abundance:.2%})")
-                else:
-                    click.echo(f"  🎯 Spike species detected: {sample_data.spike}")
+            spike_qc = sample_data.spike_qc
+            if spike_qc and spike_qc.species:
+                click.echo(f"  🎯 Spike species detected: {spike_qc.species} ({spike_qc.abundance:.2%})")
+                if spike_qc.observed_expected_ratio is not None:
+                    click.echo(f"     Spike QC: {spike_qc.status} (observed/expected {spike_qc.observed_expected_ratio:.2f})")
             else:
                 click.echo(f"  ❌ No spike species detected")
 
@@ -95,6 +129,24 @@ def upload(sample_cnf: Path, api: str, username: Optional[str], password: Option
         else:
             click.echo(f"  ✗ No structured nanoplot data found")
 
+        if sample_data.nanoplot_data:
+            click.echo(f"  ✓ NanoPlot chart data: {', '.join(sample_data.nanoplot_data)}")
+
+        # Copy linked files into the content-addressed store (identical files are stored once)
+        artifact_paths = None
+        if push_artifacts and dry_run:
+            click.echo(f"  ✓ Would push {len(sample_artifact_files(sample_data))} artifacts to {api}")
+        elif artifact_store:
+            artifact_files = sample_artifact_files(sample_data)
+            if dry_run:
+                click.echo(f"  ✓ Would store {len(artifact_files)} artifacts in {artifact_store / STORE_DIR}")
+            else:
+                store = ArtifactStore(artifact_store)
+                artifact_paths = store.store_files(parser.seqrun_path, artifact_files)
+                run_dir = config.run_directory or config.sample.sequencing_run_id
+                store.write_manifest(config.sample.sample_id, run_dir, artifact_paths)
+                click.echo(f"  ✓ Stored {len(artifact_paths)} artifacts in {artifact_store / STORE_DIR}")
+
         if dry_run:
             click.echo("\n🏃 Dry run mode - skipping database upload")
             
@@ -106,19 +158,49 @@ def upload(sample_cnf: Path, api: str, username: Optional[str], password: Option
                 click.echo(f"📋 Sample data spike attr: {getattr(sample_data, 'spike', 'NO_SPIKE_ATTR')}")
             return
 
+        api_client = EyrieAPIClient(api, username, password)
+
+        if use_queue:
+            ingest_queue = IngestQueue()
+            api_client.queue_sample(ingest_queue, parsed_sample, config, compact_hits, artifact_paths,
+                                    manifest={'snapshot': snapshot, 'options': upload_options})
+            click.echo(f"\n📥 Queued sample in {ingest_queue.path}")
+            if not api_client.test_connection():
+                click.echo(f"⏳ {len(ingest_queue.entries(api_client.api_url))} queued uploads wait for `popup drain`")
+                return
+            counts = api_client.drain_queue(ingest_queue)
+            click.echo(f"✅ Drained queue: {counts['uploaded']} uploaded, {counts['failed']} failed, "
+                       f"{len(ingest_queue.entries(api_client.api_url))} waiting")
+            return
+
         # Upload to Eyrie
         click.echo("\n📤 Uploading to Eyrie database...")
 
-        api_client = EyrieAPIClient(api, username, password)
-
         # Test connection
         if not api_client.test_connection():
-            click.echo("❌ Cannot connect to Eyrie API")
+            if push_artifacts:
+                click.echo("❌ Cannot connect to Eyrie API - artifacts cannot be pushed; rerun once it is reachable")
+                return
+            # Keep the parsed sample in the durable queue instead of dropping it
+            ingest_queue = IngestQueue()
+            api_client.queue_sample(ingest_queue, parsed_sample, config, compact_hits, artifact_paths,
+                                    manifest={'snapshot': snapshot, 'options': upload_options})
+            click.echo(f"⏳ Cannot connect to Eyrie API - queued sample in {ingest_queue.path}; "
+                       f"upload it with `popup drain --api {api}`")
             return
 
+        if push_artifacts:
+            artifact_files = sample_artifact_files(sample_data)
+            artifact_paths = api_client.push_artifacts(parser.seqrun_path, artifact_files, workers)
+            if artifact_paths is None:
+                click.echo("❌ Failed to push artifacts - not uploading the sample; rerun to resume")
+                return
+            click.echo(f"✓ Pushed {len(artifact_paths)} artifacts")
+
         # Upload the sample
-        if api_client.upload_sample(parsed_sample, config):
+        if api_client.upload_sample(parsed_sample, config, compact_hits, artifact_paths):
             click.echo("✅ Successfully uploaded sample to Eyrie!")
+            manifest.record(snapshot, upload_options)
         else:
             click.echo("❌ Failed to upload sample")
 
@@ -144,6 +226,8 @@ def generate_config(trana_output_dirpath: Path, sample_id: str, output: Optional
                    sample_name: Optional[str], lims_id: Optional[str], 
                    run_id: Optional[str], run_dir: Optional[str], classification: str):
     """Generate a YAML configuration file for a single sample."""
+    import yaml
+    from .utils.sample_config import default_sample_config
 
     click.echo(f"🔍 Generating config for sample: {sample_id}")
     click.echo(f"📁 TRANA output path: {trana_output_dirpath}")
@@ -171,66 +255,8 @@ def generate_config(trana_output_dirpath: Path, sample_id: str, output: Optional
             run_dir = run_id
 
     # Create configuration
-    config = {
-        "sample": {
-            "sample_id": sample_id,
-            "sample_name": sample_name,
-            "lims_id": lims_id,
-            "barcode": sample_id if sample_id.startswith("barcode") else None,
-            "sequencing_run_id": run_id,
-            "classification_type": classification
-        },
-        "base_path": str(trana_output_dirpath.parent),
-        "run_directory": run_dir,
-        "fastqc": {
-            "enabled": True,
-            "directory": "fastqc",
-            "file": f"{sample_id}_fastqc.html"
-        },
-        "krona": {
-            "enabled": True,
-            "directory": "krona", 
-            "file": f"{sample_id}_krona.html"
-        },
-        "multiqc": {
-            "enabled": True,
-            "directory": "multiqc",
-            "report_file": "multiqc_report.html"
-        },
-        "nanoplot": {
-            "unprocessed": {
-                "enabled": True,
-                "directory": "nanoplot_unprocessed",
-                "stats_file": f"{sample_id}_nanoplot_unprocessed_NanoStats.txt",
-                "html_files": [
-                    f"{sample_id}_nanoplot_unprocessed_NanoPlot-report.html",
-                    f"{sample_id}_nanoplot_unprocessed_LengthvsQualityScatterPlot_dot.html",
-                    f"{sample_id}_nanoplot_unprocessed_LengthvsQualityScatterPlot_kde.html",
-                    f"{sample_id}_nanoplot_unprocessed_Non_weightedHistogramReadlength.html",
-                    f"{sample_id}_nanoplot_unprocessed_WeightedHistogramReadlength.html",
-                    f"{sample_id}_nanoplot_unprocessed_Yield_By_Length.html"
-                ]
-            },
-            "processed": {
-                "enabled": True,
-                "directory": "nanoplot_processed",
-                "stats_file": f"{sample_id}_nanoplot_processed_NanoStats.txt",
-                "html_files": [
-                    f"{sample_id}_nanoplot_processed_NanoPlot-report.html",
-                    f"{sample_id}_nanoplot_processed_LengthvsQualityScatterPlot_dot.html",
-                    f"{sample_id}_nanoplot_processed_LengthvsQualityScatterPlot_kde.html",
-                    f"{sample_id}_nanoplot_processed_Non_weightedHistogramReadlength.html",
-                    f"{sample_id}_nanoplot_processed_WeightedHistogramReadlength.html",
-                    f"{sample_id}_nanoplot_processed_Yield_By_Length.html"
-                ]
-            }
-        },
-        "results": {
-            "enabled": True,
-            "directory": "results",
-            "rel_abundance_file": f"{sample_id}_filtered.fastq_rel-abundance.tsv"
-        }
-    }
+    config = default_sample_config(trana_output_dirpath, sample_id, sample_name, lims_id,
+                                   run_id, run_dir, classification)
 
     # Write configuration file
     if not output:
@@ -243,12 +269,406 @@ def generate_config(trana_output_dirpath: Path, sample_id: str, output: Optional
     click.echo(f"\n🚀 Run with: popup upload --sample {output} --api <api_url> --username <user> --password <pass>")
 
 
+@cli.command()
+@click.option('-s', '--sample', 'sample_cnfs', required=True, multiple=True, type=click.Path(exists=True, path_type=Path), help='YAML configuration file for a sample of the run (repeat for every sample)')
+@click.option('--negative-control', 'negative_controls', multiple=True, help='Sample ID of a negative control (repeatable)')
+@click.option('--cross-talk-ratio', default=CROSS_TALK_RATIO, show_default=True, help='Flag taxa at or below this fraction of their abundance in another sample')
+@click.option('--cross-talk-source-min', default=CROSS_TALK_SOURCE_MIN, show_default=True, help='Minimum abundance in the other sample for cross-talk')
+@click.option('--control-fold', default=CONTROL_FOLD, show_default=True, help='Enrichment over negative controls needed to clear a shared taxon')
+@click.option('--spike-expected', type=float, help='Expected spike relative abundance (0-1) for samples without a spike section in their config')
+@click.option('--spike-amount', type=float, help='Spike amount added for samples without a spike section in their config')
+@click.option('--api', default='http://localhost:8000/api', help='Eyrie API base URL')
+@click.option('--username', envvar='EYRIE_USER', help='Username for authentication (or set EYRIE_USER env var)')
+@click.option('--password', envvar='EYRIE_PASSWORD', help='Password for authentication (or set EYRIE_PASSWORD env var)')
+@click.option('--dry-run', is_flag=True, help='Report suggested contaminants without flagging them in Eyrie')
+@click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
+def analyze_run(sample_cnfs: Tuple[Path, ...], negative_controls: Tuple[str, ...], cross_talk_ratio: float,
+                cross_talk_source_min: float, control_fold: float, spike_expected: Optional[float],
+                spike_amount: Optional[float], api: str, username: Optional[str],
+                password: Optional[str], dry_run: bool, verbose: bool):
+    """Suggest contaminants and compute spike QC across all samples of a run."""
+    import yaml
+    from .models import SampleConfig
+    from .parser import SampleParser
+    from .api import EyrieAPIClient
+    from .analysis import AbundanceMatrix, find_run_contaminants, compute_spike_qc
+
+    click.echo(f"🔬 Eyrie POPUP - Run contamination and spike analysis")
+
+    try:
+        samples = {}
+        run_ids = set()
+        expected_abundances = []
+        spike_amounts = []
+        classification_types = []
+        for sample_cnf in sample_cnfs:
+            with open(sample_cnf, 'r') as f:
+                config = SampleConfig(**yaml.safe_load(f))
+            samples[config.sample.sample_id] = SampleParser(config).parse_taxonomic_abundances()
+            run_ids.add(config.sample.sequencing_run_id)
+            expected_abundances.append(config.spike.expected_abundance if config.spike else spike_expected)
+            spike_amounts.append(config.spike.amount if config.spike else spike_amount)
+            classification_types.append(config.sample.classification_type)
+
+        if len(run_ids) > 1:
+            click.echo(f"⚠️  Samples span several sequencing runs: {', '.join(sorted(run_ids))}")
+
+        missing_controls = set(negative_controls) - set(samples)
+        if missing_controls:
+            click.echo(f"⚠️  Negative controls not among the samples: {', '.join(sorted(missing_controls))}")
+
+        matrix = AbundanceMatrix.from_samples(samples)
+        click.echo(f"📊 Abundance matrix: {matrix.shape[0]} taxa x {matrix.shape[1]} samples")
+
+        suggestions = find_run_contaminants(
+            matrix,
+            negative_controls=negative_controls,
+            cross_talk_ratio=cross_talk_ratio,
+            cross_talk_source_min=cross_talk_source_min,
+            control_fold=control_fold
+        )
+
+        for sample_id, sample_suggestions in suggestions.items():
+            if not sample_suggestions:
+                if verbose:
+                    click.echo(f"  ✓ {sample_id}: no suggested contaminants")
+                continue
+            click.echo(f"  ⚠️  {sample_id}: {len(sample_suggestions)} suggested contaminant(s)")
+            for suggestion in sample_suggestions:
+                reasons = []
+                if suggestion.cross_talk_source:
+                    reasons.append(f"cross-talk from {suggestion.cross_talk_source} ({suggestion.cross_talk_score:.3f})")
+                if suggestion.control_score is not None:
+                    reasons.append(f"shared with negative control ({suggestion.control_score:.1f}x)")
+                click.echo(f"      {suggestion.species} ({suggestion.abundance:.2%}): {'; '.join(reasons)}")
+
+        spike_qc = compute_spike_qc(matrix, expected_abundances, spike_amounts, classification_types)
+        click.echo("\n🎯 Spike QC")
+        for sample_id, qc in spike_qc.items():
+            ratio = f", observed/expected {qc.observed_expected_ratio:.2f}" if qc.observed_expected_ratio is not None else ""
+            click.echo(f"  {sample_id}: {qc.status} - {qc.species or 'no spike'} ({qc.abundance:.2%}{ratio})")
+
+        if dry_run:
+            click.echo("\n🏃 Dry run mode - not updating samples in Eyrie")
+            return
+
+        api_client = EyrieAPIClient(api, username, password)
+        if not api_client.test_connection():
+            click.echo("❌ Cannot connect to Eyrie API")
+            return
+
+        for sample_id, sample_suggestions in suggestions.items():
+            if sample_suggestions:
+                api_client.add_flagged_contaminants(sample_id, [s.species for s in sample_suggestions])
+            qc = spike_qc[sample_id]
+            api_client.update_sample_fields(sample_id, {'spike': qc.species, 'spike_qc': qc.dict()})
+
+    except Exception as e:
+        click.echo(f"❌ Error: {e}")
+        if verbose:
+            import traceback
+            traceback.print_exc()
+
+
+@cli.command()
+@click.argument('trana_output_dirpath', type=click.Path(exists=True, path_type=Path))
+@click.option('--run-id', required=True, help='Sequencing run identifier')
+@click.option('-s', '--sample', 'sample_cnfs', multiple=True, type=click.Path(exists=True, path_type=Path), help='Sample YAML configuration mapping a barcode column to its sample ID (repeatable)')
+@click.option('--classification', type=click.Choice(['16S', 'ITS']), help='Classification type of the run')
+@click.option('--api', default='http://localhost:8000/api', help='Eyrie API base URL')
+@click.option('--username', envvar='EYRIE_USER', help='Username for authentication (or set EYRIE_USER env var)')
+@click.option('--password', envvar='EYRIE_PASSWORD', help='Password for authentication (or set EYRIE_PASSWORD env var)')
+@click.option('--dry-run', is_flag=True, help='Parse the matrices but do not upload them')
+@click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
+def ingest_run(trana_output_dirpath: Path, run_id: str, sample_cnfs: Tuple[Path, ...], classification: Optional[str],
+               api: str, username: Optional[str], password: Optional[str], dry_run: bool, verbose: bool):
+    """Upload a run's emu-combined matrices (all samples, every rank) as one run document."""
+    import yaml
+    from .models import SampleConfig
+    from .parser import RunMatrixParser, find_emu_combined_dir
+    from .api import EyrieAPIClient
+
+    click.echo(f"🔬 Eyrie POPUP - Run matrix ingest: {run_id}")
+
+    try:
+        emu_combined_path = find_emu_combined_dir(trana_output_dirpath)
+        if not emu_combined_path:
+            click.echo(f"❌ No emu-combined results found under {trana_output_dirpath}")
+            return
+
+        # Matrix columns are named after the read files, i.e. the barcodes
+        sample_ids = {}
+        for sample_cnf in sample_cnfs:
+            with open(sample_cnf, 'r') as f:
+                config = SampleConfig(**yaml.safe_load(f))
+            sample_ids[config.sample.barcode or config.sample.sample_id] = config.sample.sample_id
+            classification = classification or config.sample.classification_type
+
+        run_data = RunMatrixParser(emu_combined_path, sample_ids).parse(run_id, classification)
+        if not run_data.matrices:
+            click.echo(f"❌ No emu-combined matrices found in {emu_combined_path}")
+            return
+
+        click.echo(f"📊 {len(run_data.samples)} samples: {', '.join(run_data.samples)}")
+        for rank, matrix in run_data.matrices.items():
+            n_taxa = len(next(iter(matrix.taxa.values()), []))
+            counts = "with counts" if matrix.counts is not None else "no counts"
+            click.echo(f"  {rank}: {n_taxa} taxa ({counts})")
+            if verbose:
+                for name in matrix.taxa.get(rank, [])[:10]:
+                    click.echo(f"      {name}")
+
+        if dry_run:
+            click.echo("\n🏃 Dry run mode - not uploading to database")
+            return
+
+        api_client = EyrieAPIClient(api, username, password)
+        if not api_client.test_connection():
+            click.echo("❌ Cannot connect to Eyrie API")
+            return
+
+        if api_client.upload_run(run_data):
+            click.echo(f"✅ Successfully ingested run: {run_id}")
+        else:
+            click.echo(f"❌ Failed to ingest run: {run_id}")
+
+    except Exception as e:
+        click.echo(f"❌ Error: {e}")
+        if verbose:
+            import traceback
+            traceback.print_exc()
+
+
+@cli.command()
+@click.option('-s', '--sample', 'sample_cnfs', required=True, multiple=True, type=click.Path(exists=True, path_type=Path), help='YAML configuration file for a sample of the run (repeat for every sample)')
+@click.option('--api', default='http://localhost:8000/api', help='Eyrie API base URL')
+@click.option('--username', envvar='EYRIE_USER', help='Username for authentication (or set EYRIE_USER env var)')
+@click.option('--password', envvar='EYRIE_PASSWORD', help='Password for authentication (or set EYRIE_PASSWORD env var)')
+@click.option('--dry-run', is_flag=True, help='Parse the MultiQC data but do not update samples')
+@click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
+def ingest_multiqc(sample_cnfs: Tuple[Path, ...], api: str, username: Optional[str],
+                   password: Optional[str], dry_run: bool, verbose: bool):
+    """Add each sample's metrics from the run's multiqc_data.json to its Eyrie sample."""
+    import yaml
+    from .models import SampleConfig
+    from .parser import SampleParser
+    from .api import EyrieAPIClient
+
+    click.echo(f"🔬 Eyrie POPUP - MultiQC metrics ingest")
+
+    try:
+        # The run-wide file is parsed once; every later sample reuses the cached parse
+        sample_metrics = {}
+        for sample_cnf in sample_cnfs:
+            with open(sample_cnf, 'r') as f:
+                config = SampleConfig(**yaml.safe_load(f))
+            metrics = SampleParser(config).parse_multiqc_metrics()
+            sample_id = config.sample.sample_id
+            if not metrics:
+                click.echo(f"  - {sample_id}: no MultiQC metrics found")
+                continue
+            click.echo(f"  ✓ {sample_id}: {', '.join(f'{module} ({len(rows)})' for module, rows in metrics.items())}")
+            if verbose:
+                for module, rows in metrics.items():
+                    for mq_name, values in rows.items():
+                        click.echo(f"      {module}/{mq_name}: {len(values)} metrics")
+            sample_metrics[sample_id] = metrics
+
+        if dry_run or not sample_metrics:
+            click.echo("\n🏃 Dry run mode - not updating samples in Eyrie" if dry_run else "Nothing to upload")
+            return
+
+        api_client = EyrieAPIClient(api, username, password)
+        if not api_client.test_connection():
+            click.echo("❌ Cannot connect to Eyrie API")
+            return
+
+        updated = sum(api_client.update_sample_fields(sample_id, {'multiqc': metrics})
+                      for sample_id, metrics in sample_metrics.items())
+        click.echo(f"✅ Updated MultiQC metrics on {updated}/{len(sample_metrics)} samples")
+
+    except Exception as e:
+        click.echo(f"❌ Error: {e}")
+        if verbose:
+            import traceback
+            traceback.print_exc()
+
+
+@cli.command()
+@click.argument('trana_output_dirpath', type=click.Path(exists=True, path_type=Path))
+@click.option('--run-id', required=True, help='Sequencing run identifier')
+@click.option('--api', default='http://localhost:8000/api', help='Eyrie API base URL')
+@click.option('--username', envvar='EYRIE_USER', help='Username for authentication (or set EYRIE_USER env var)')
+@click.option('--password', envvar='EYRIE_PASSWORD', help='Password for authentication (or set EYRIE_PASSWORD env var)')
+@click.option('--dry-run', is_flag=True, help='Parse the traces but do not upload them')
+@click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
+def ingest_trace(trana_output_dirpath: Path, run_id: str, api: str, username: Optional[str],
+                 password: Optional[str], dry_run: bool, verbose: bool):
+    """Upload the run's Nextflow execution traces for pipeline performance tracking."""
+    from .parser import find_trace_files, parse_trace
+    from .api import EyrieAPIClient
+
+    click.echo(f"🔬 Eyrie POPUP - Pipeline trace ingest: {run_id}")
+
+    try:
+        trace_files = find_trace_files(trana_output_dirpath)
+        if not trace_files:
+            click.echo(f"❌ No execution traces found under {trana_output_dirpath}")
+            return
+
+        pipeline_runs = []
+        for trace_file in trace_files:
+            pipeline_run = parse_trace(trace_file, run_id)
+            if pipeline_run is None:
+                click.echo(f"  - {trace_file.name}: no tasks, skipped")
+                continue
+            completed = sum(1 for task in pipeline_run.tasks if task.status == 'COMPLETED')
+            click.echo(f"  ✓ {trace_file.name}: {len(pipeline_run.tasks)} tasks ({completed} completed)")
+            if verbose:
+                for task in pipeline_run.tasks:
+                    click.echo(f"      {task.name}: {task.status}, {task.duration}s, peak_rss {task.peak_rss} B")
+            pipeline_runs.append(pipeline_run)
+
+        if dry_run or not pipeline_runs:
+            click.echo("\n🏃 Dry run mode - not uploading to database" if dry_run else "Nothing to upload")
+            return
+
+        api_client = EyrieAPIClient(api, username, password)
+        if not api_client.test_connection():
+            click.echo("❌ Cannot connect to Eyrie API")
+            return
+
+        uploaded = sum(api_client.upload_pipeline_run(pipeline_run) for pipeline_run in pipeline_runs)
+        click.echo(f"✅ Uploaded {uploaded}/{len(pipeline_runs)} pipeline runs")
+
+    except Exception as e:
+        click.echo(f"❌ Error: {e}")
+        if verbose:
+            import traceback
+            traceback.print_exc()
+
+
+@cli.command()
+@click.argument('base_path', type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option('--marker', 'markers', multiple=True, default=DEFAULT_MARKERS, show_default=True, help='Glob, relative to a run directory, whose presence marks the run complete (repeatable)')
+@click.option('--settle', default=60.0, show_default=True, help='Seconds a run must be quiet before it is ingested')
+@click.option('--workers', default=2, show_default=True, help='Samples ingested concurrently')
+@click.option('--queue-size', default=16, show_default=True, help='Samples waiting for a worker before discovery pauses')
+@click.option('--poll', 'polling', is_flag=True, help='Poll for changes instead of using inotify')
+@click.option('--poll-interval', default=30.0, show_default=True, help='Seconds between scans when polling')
+@click.option('--classification', type=click.Choice(['16S', 'ITS']), default='16S', help='Classification type for samples without a config file')
+@click.option('--sample-id', 'sample_id_template', default=DEFAULT_SAMPLE_ID_TEMPLATE, show_default=True, help='Sample ID for samples without a config file ({run} and {sample} are replaced)')
+@click.option('--once', is_flag=True, help='Ingest the runs that are complete now and exit')
+@click.option('--api', default='http://localhost:8000/api', help='Eyrie API base URL')
+@click.option('--username', envvar='EYRIE_USER', help='Username for authentication (or set EYRIE_USER env var)')
+@click.option('--password', envvar='EYRIE_PASSWORD', help='Password for authentication (or set EYRIE_PASSWORD env var)')
+@click.option('--compact-hits', is_flag=True, help='Store taxonomic hits as columnar arrays with lineage in the shared taxonomy collection')
+@click.option('--push-artifacts', is_flag=True, help='Upload reports and plots to the Eyrie API instead of relying on a shared data directory')
+@click.option('--queue', 'use_queue', is_flag=True, help='Queue parsed samples locally and upload them in the background, riding out Eyrie outages')
+def watch(base_path: Path, markers: Tuple[str, ...], settle: float, workers: int, queue_size: int, polling: bool,
+          poll_interval: float, classification: str, sample_id_template: str, once: bool, api: str,
+          username: Optional[str], password: Optional[str], compact_hits: bool, push_artifacts: bool,
+          use_queue: bool):
+    """Ingest every run directory under BASE_PATH as soon as the pipeline completes it."""
+    from .api import EyrieAPIClient, IngestQueue, drain_forever
+    from .watch import RunWatcher, SampleIngester
+
+    click.echo(f"👀 Eyrie POPUP - Watching {base_path} for completed runs ({', '.join(markers)})")
+
+    if use_queue and push_artifacts:
+        raise click.UsageError("--push-artifacts cannot be combined with --queue")
+
+    api_client = EyrieAPIClient(api, username, password)
+    ingest_queue = IngestQueue() if use_queue else None
+    if ingest_queue is None and not api_client.test_connection():
+        click.echo("❌ Cannot connect to Eyrie API")
+        return
+
+    ingester = SampleIngester(api, username, password, compact_hits, push_artifacts, queue=ingest_queue)
+    watcher = RunWatcher(base_path, ingester.ingest, markers, settle, workers, queue_size,
+                         poll_interval, polling, classification, sample_id_template)
+
+    if ingest_queue is None:
+        watcher.run(once=once)
+        return
+
+    # Drain in the background while watching; with --once, drain what can be sent and exit
+    stop = threading.Event()
+    drainer = threading.Thread(target=drain_forever, args=(api_client, ingest_queue, poll_interval),
+                               kwargs={'stop': stop}, daemon=True)
+    drainer.start()
+    try:
+        watcher.run(once=once)
+    finally:
+        stop.set()
+        drainer.join()
+    if once and api_client.test_connection():
+        counts = api_client.drain_queue(ingest_queue)
+        click.echo(f"✅ Drained queue: {counts['uploaded']} uploaded, {counts['failed']} failed")
+
+
+@cli.command()
+@click.option('--api', default='http://localhost:8000/api', help='Eyrie API base URL')
+@click.option('--username', envvar='EYRIE_USER', help='Username for authentication (or set EYRIE_USER env var)')
+@click.option('--password', envvar='EYRIE_PASSWORD', help='Password for authentication (or set EYRIE_PASSWORD env var)')
+@click.option('--batch-size', default=DEFAULT_BATCH_SIZE, show_default=True, help='Queued samples claimed and uploaded together')
+@click.option('--follow', is_flag=True, help='Keep running and drain whenever Eyrie is reachable')
+@click.option('--interval', default=float(RETRY_BACKOFF), show_default=True, help='Seconds between attempts with --follow')
+@click.option('--list', 'list_only', is_flag=True, help='List the queued uploads without sending them')
+def drain(api: str, username: Optional[str], password: Optional[str], batch_size: int,
+          follow: bool, interval: float, list_only: bool):
+    """Upload the samples waiting in the local ingest queue."""
+    from .api import EyrieAPIClient, IngestQueue, drain_forever
+
+    ingest_queue = IngestQueue()
+    api_client = EyrieAPIClient(api, username, password)
+    entries = ingest_queue.entries(None if list_only else api_client.api_url)
+    click.echo(f"📥 {len(entries)} queued uploads in {ingest_queue.path}")
+
+    if list_only:
+        for entry in entries:
+            status = f"{entry['attempts']} failed attempts ({entry['last_error']})" if entry['attempts'] else "waiting"
+            click.echo(f"  {entry['sample_id']} -> {entry['api_url']}: {status}")
+        return
+
+    if follow:
+        try:
+            drain_forever(api_client, ingest_queue, interval, batch_size)
+        except KeyboardInterrupt:
+            click.echo("\n🛑 Stopped")
+        return
+
+    if not api_client.test_connection():
+        click.echo("❌ Cannot connect to Eyrie API")
+        return
+    counts = api_client.drain_queue(ingest_queue, batch_size)
+    click.echo(f"✅ {counts['uploaded']} uploaded, {counts['failed']} failed, "
+               f"{len(ingest_queue.entries(api_client.api_url))} waiting")
+
+
+@cli.command()
+@click.argument('data_dir', type=click.Path(exists=True, file_okay=False, path_type=Path))
+def verify_artifacts(data_dir: Path):
+    """Check that every blob in DATA_DIR's content-addressed store still matches its hash."""
+    from .utils.artifacts import ArtifactStore
+
+    store = ArtifactStore(data_dir)
+    total = sum(1 for _ in store.blobs())
+    corrupt = store.verify()
+    for blob in corrupt:
+        click.echo(f"❌ {blob.relative_to(data_dir)}: content does not match its hash")
+    if corrupt:
+        raise SystemExit(1)
+    click.echo(f"✅ {total} artifacts verified")
+
+
 @cli.command()
 @click.option('--api', default='http://localhost:8000/api', help='Eyrie API base URL')
 @click.option('--username', envvar='EYRIE_USER', help='Username for authentication (or set EYRIE_USER env var)')
 @click.option('--password', envvar='EYRIE_PASSWORD', help='Password for authentication (or set EYRIE_PASSWORD env var)')
 def test_connection(api: str, username: Optional[str], password: Optional[str]):
     """Test connection to Eyrie API."""
+    from .api import EyrieAPIClient
 
     click.echo(f"🔗 Testing connection to: {api}")
 
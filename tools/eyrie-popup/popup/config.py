@@ -1,10 +1,36 @@
-"""Configuration for spike species detection."""
-
-# List of possible spike hit species names
-# These species will be automatically flagged as spike controls during processing
-SPIKE = [
-    "Agrobacterium tumefaciens",
-    "Agrobacterium fabrum",
-    "Salinibacter ruber",
-    "Bacillus subtilis"
-]
+"""Configuration and defaults for Eyrie POPUP.
+
+Kept free of third-party imports, so the CLI can read defaults without loading the parsers.
+"""
+
+import os
+from pathlib import Path
+
+# Spike panels per classification type; override with the EYRIE_SPIKE_PANELS env var
+SPIKE_PANELS_FILE = Path(__file__).parent / "spike_panels.yaml"
+
+# Directory for compiled caches (spike panels)
+CACHE_DIR = os.getenv('EYRIE_POPUP_CACHE', str(Path.home() / ".cache" / "eyrie-popup"))
+
+# Observed/expected spike abundance ratios considered a passing spike-in
+SPIKE_RATIO_RANGE = (0.5, 2.0)
+
+# Run contamination thresholds (relative abundances are fractions, 0-1)
+CROSS_TALK_RATIO = 0.01  # Flag when a taxon is at most 1% of its level in another sample
+CROSS_TALK_SOURCE_MIN = 0.05  # ...and that other sample carries it at 5% or more
+CONTROL_FOLD = 10.0  # Flag taxa shared with a negative control unless 10x more abundant
+
+# Watch mode: a run is complete once one of these exists (globs relative to the run directory).
+# Nextflow writes pipeline_info/execution_trace_*.txt from the start of a run, so by
+# default the watcher waits for MultiQC, TRANA's last step.
+DEFAULT_MARKERS = ('multiqc/multiqc_report.html',)
+
+# Watch mode: sample IDs for samples without a config file in the run directory
+DEFAULT_SAMPLE_ID_TEMPLATE = '{run}_{sample}'
+
+# Ingest queue: retry delay (seconds) after a failed upload doubles per attempt, up to the maximum
+RETRY_BACKOFF = 30
+MAX_RETRY_BACKOFF = 3600
+
+# Ingest queue: uploads claimed and sent together
+DEFAULT_BATCH_SIZE = 20
@@ -1,23 +1,30 @@
-"""Pydantic models for Eyrie POPUP."""
+"""Pydantic models (and lightweight parse-time records) for Eyrie POPUP."""
 
 # Configuration models
 from .config import (
     SampleInfo, FastQCConfig, KronaConfig, MultiQCConfig,
-    NanoPlotStageConfig, NanoPlotConfig, ResultsConfig, SampleConfig
+    NanoPlotStageConfig, NanoPlotConfig, ResultsConfig, SpikeConfig, SampleConfig
 )
 
 # Data models
-from .data import NanoStats, TaxonomicAbundance, SampleData
+from .data import (
+    NanoStats, TaxonomicAbundance, TaxonomicHit, SampleData, RunMatrix, RunData, PipelineTask, PipelineRun
+)
 
 # Parsing models
 from .parsing import NanoPlotFileSet, StructuredNanoPlot, ParsedSample
 
+# Analysis models
+from .analysis import ContaminationSuggestion, SpikeQC
+
 __all__ = [
     # Config models
     'SampleInfo', 'FastQCConfig', 'KronaConfig', 'MultiQCConfig',
-    'NanoPlotStageConfig', 'NanoPlotConfig', 'ResultsConfig', 'SampleConfig',
+    'NanoPlotStageConfig', 'NanoPlotConfig', 'ResultsConfig', 'SpikeConfig', 'SampleConfig',
     # Data models
-    'NanoStats', 'TaxonomicAbundance', 'SampleData',
+    'NanoStats', 'TaxonomicAbundance', 'TaxonomicHit', 'SampleData', 'RunMatrix', 'RunData', 'PipelineTask', 'PipelineRun',
     # Parsing models
-    'NanoPlotFileSet', 'StructuredNanoPlot', 'ParsedSample'
+    'NanoPlotFileSet', 'StructuredNanoPlot', 'ParsedSample',
+    # Analysis models
+    'ContaminationSuggestion', 'SpikeQC'
 ]
@@ -0,0 +1,26 @@
+"""Models for run-level analysis results."""
+
+from typing import Optional
+from pydantic import BaseModel
+
+
+class ContaminationSuggestion(BaseModel):
+    """A taxon suggested as a contaminant in one sample of a run."""
+    tax_id: str
+    species: str
+    abundance: float
+    cross_talk_score: Optional[float] = None  # Abundance relative to the strongest other sample
+    cross_talk_source: Optional[str] = None  # Sample the taxon most likely bled over from
+    control_score: Optional[float] = None  # Abundance relative to the negative controls
+
+
+class SpikeQC(BaseModel):
+    """Spike-in recovery for one sample."""
+    species: Optional[str] = None  # Most abundant spike species
+    tax_id: Optional[str] = None
+    abundance: float = 0.0  # Combined relative abundance of all spike taxa
+    expected_abundance: Optional[float] = None
+    observed_expected_ratio: Optional[float] = None
+    spike_amount: Optional[float] = None  # Spike added to the sample (e.g. cells or copies)
+    absolute_scale: Optional[float] = None  # Absolute amount per unit of relative abundance
+    status: str = "missing"  # missing, detected (no expectation), low, high or ok
@@ -19,6 +19,7 @@ class FastQCConfig(BaseModel):
     enabled: bool = True
     directory: str = "fastqc"
     file: str  # Direct file name instead of pattern
+    data_file: Optional[str] = None  # FastQC zip with fastqc_data.txt, defaults to file with .zip
 
 
 class KronaConfig(BaseModel):
@@ -33,6 +34,7 @@ class MultiQCConfig(BaseModel):
     enabled: bool = True
     directory: str = "multiqc"
     report_file: str = "multiqc_report.html"
+    data_file: str = "multiqc_data/multiqc_data.json"  # Run-wide metrics, relative to directory
 
 
 class NanoPlotStageConfig(BaseModel):
@@ -41,6 +43,7 @@ class NanoPlotStageConfig(BaseModel):
     directory: str
     stats_file: str  # Direct file name instead of pattern
     html_files: List[str] = []
+    raw_file: Optional[str] = None  # NanoPlot --raw per-read data (NanoPlot-data.tsv.gz), preferred over the plots
 
 
 class NanoPlotConfig(BaseModel):
@@ -54,6 +57,15 @@ class ResultsConfig(BaseModel):
     enabled: bool = True
     directory: str = "results"
     rel_abundance_file: str  # Direct file name instead of pattern
+    read_assignment_file: Optional[str] = None  # Read assignment table with tax_id columns
+    translated_file: Optional[str] = None  # translate_taxids output naming those columns
+    translated_directory: str = "translate_taxids"
+
+
+class SpikeConfig(BaseModel):
+    """Spike-in added to the sample, used for spike QC and absolute abundances."""
+    expected_abundance: Optional[float] = None  # Expected relative abundance (0-1)
+    amount: Optional[float] = None  # Amount of spike added (e.g. cells or copies)
 
 
 class SampleConfig(BaseModel):
@@ -66,3 +78,4 @@ class SampleConfig(BaseModel):
     multiqc: Optional[MultiQCConfig] = None
     nanoplot: Optional[NanoPlotConfig] = None
     results: Optional[ResultsConfig] = None
+    spike: Optional[SpikeConfig] = None
@@ -1,9 +1,11 @@
 """Data models for parsed sample information."""
 
-from typing import List, Optional, Dict
+from typing import Any, List, NamedTuple, Optional, Dict
 from pydantic import BaseModel, Field
 
+from ..utils.lineage import Lineage
 from .config import SampleInfo
+from .analysis import SpikeQC
 
 
 class NanoStats(BaseModel):
@@ -34,6 +36,61 @@ class TaxonomicAbundance(BaseModel):
     contamination: bool = False  # Will be added during parsing
 
 
+class TaxonomicHit(NamedTuple):
+    """
+    Taxonomic abundance as carried from parsing to upload.
+
+    A plain tuple around the shared, interned lineage, with the same attributes
+    as TaxonomicAbundance, so a 10k-species sample does not build and validate
+    10k pydantic models. Use to_model() where a validated model is needed.
+    """
+    lineage: Lineage
+    abundance: float
+    estimated_counts: float
+    contamination: bool = False
+
+    @property
+    def tax_id(self) -> str:
+        return self.lineage.tax_id
+
+    @property
+    def species(self) -> str:
+        return self.lineage.species
+
+    @property
+    def genus(self) -> str:
+        return self.lineage.genus
+
+    @property
+    def family(self) -> str:
+        return self.lineage.family
+
+    @property
+    def order(self) -> str:
+        return self.lineage.order
+
+    @property
+    def class_name(self) -> str:
+        return self.lineage.class_name
+
+    @property
+    def phylum(self) -> str:
+        return self.lineage.phylum
+
+    @property
+    def superkingdom(self) -> str:
+        return self.lineage.superkingdom
+
+    def to_model(self) -> TaxonomicAbundance:
+        """Validated pydantic model of this hit."""
+        return TaxonomicAbundance(
+            tax_id=self.tax_id, abundance=self.abundance, species=self.species, genus=self.genus,
+            family=self.family, order=self.order, phylum=self.phylum, superkingdom=self.superkingdom,
+            estimated_counts=self.estimated_counts, contamination=self.contamination,
+            **{'class': self.class_name}
+        )
+
+
 class SampleData(BaseModel):
     """Complete data for a single sample."""
     sample_info: SampleInfo
@@ -44,6 +101,53 @@ class SampleData(BaseModel):
     nanoplot_processed: Optional[Dict[str, str]] = None
     nano_stats_unprocessed: Optional[NanoStats] = None
     nano_stats_processed: Optional[NanoStats] = None
-    taxonomic_abundances: List[TaxonomicAbundance] = []
+    # List of TaxonomicHit; typed Any so pydantic passes the list through instead of rebuilding every hit
+    taxonomic_abundances: Any = []
     nanoplot: Optional['StructuredNanoPlot'] = None
     spike: Optional[str] = None
+    spike_qc: Optional[SpikeQC] = None
+    multiqc: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None  # Module -> MultiQC sample -> metrics
+    fastqc: Optional[Dict[str, Any]] = None  # FastQC module statuses and tables as column arrays
+    nanoplot_data: Optional[Dict[str, Dict[str, Any]]] = None  # Stage -> downsampled NanoPlot chart series
+
+
+class RunMatrix(BaseModel):
+    """Taxa x samples matrix of a run at one rank, stored column-wise."""
+    taxa: Dict[str, List[str]]  # Lineage column name -> value per taxon row
+    abundance: List[List[float]]  # One column per sample, relative abundance in percent
+    counts: Optional[List[List[float]]] = None  # One column per sample, estimated read counts
+
+
+class RunData(BaseModel):
+    """Combined taxonomic matrices of all samples in a sequencing run."""
+    sequencing_run_id: str
+    classification_type: Optional[str] = None
+    samples: List[str]  # Sample IDs in matrix column order
+    matrices: Dict[str, RunMatrix] = {}  # Rank -> matrix
+
+
+class PipelineTask(BaseModel):
+    """One task of a Nextflow execution trace, with units normalized."""
+    task_id: str
+    name: str
+    process: str  # Process name without the task tag
+    tag: Optional[str] = None
+    status: str
+    exit: Optional[int] = None
+    submit: Optional[str] = None
+    duration: Optional[float] = None  # Seconds
+    realtime: Optional[float] = None  # Seconds
+    cpu_percent: Optional[float] = None
+    peak_rss: Optional[int] = None  # Bytes
+    peak_vmem: Optional[int] = None  # Bytes
+    rchar: Optional[int] = None  # Bytes
+    wchar: Optional[int] = None  # Bytes
+
+
+class PipelineRun(BaseModel):
+    """One execution of the pipeline, parsed from its execution trace."""
+    pipeline_run_id: str
+    sequencing_run_id: str
+    trace_file: str
+    started: Optional[str] = None  # Earliest task submission
+    tasks: List[PipelineTask] = []
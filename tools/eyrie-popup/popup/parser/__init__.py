@@ -1,5 +1,12 @@
 """Parser modules for extracting data from analysis files."""
 
 from .base import SampleParser
+from .run_matrix import RunMatrixParser, find_emu_combined_dir
+from .trace import find_trace_files, parse_trace
+from .multiqc import load_multiqc_data, sample_multiqc_metrics
+from .fastqc import FastQCParser
+from .nanoplot_data import NanoPlotDataParser
 
-__all__ = ['SampleParser']
+__all__ = ['SampleParser', 'RunMatrixParser', 'find_emu_combined_dir', 'find_trace_files', 'parse_trace',
+           'load_multiqc_data', 'sample_multiqc_metrics', 'FastQCParser',
+           'NanoPlotDataParser']
@@ -1,12 +1,17 @@
 """Main sample parser orchestration."""
 
 from pathlib import Path
+from typing import List
 
-from ..models import SampleConfig, SampleData, ParsedSample
-from ..utils import get_detected_spike, find_file
+from ..models import SampleConfig, SampleData, ParsedSample, TaxonomicHit
+from ..utils import find_file
+from ..analysis import AbundanceMatrix, compute_spike_qc
 from .nanoplot import NanoPlotParser
+from .nanoplot_data import NanoPlotDataParser
 from .nanostats import NanoStatsParser
 from .taxonomic import TaxonomicParser
+from .multiqc import load_multiqc_data, sample_multiqc_metrics
+from .fastqc import FastQCParser
 
 
 class SampleParser:
@@ -24,6 +29,24 @@ class SampleParser:
         sample_data = self._parse_sample_data()
         return ParsedSample(sample_data=sample_data)
 
+    def parse_taxonomic_abundances(self) -> List[TaxonomicHit]:
+        """Parse only the taxonomic abundances, as needed for run-level analysis."""
+        if not (self.config.results and self.config.results.enabled):
+            return []
+        taxonomic_parser = TaxonomicParser(self.seqrun_path)
+        taxonomic_parser.load_translated_names(self.config.results)
+        return taxonomic_parser.parse_rel_abundance(self.config.results)
+
+    def parse_multiqc_metrics(self):
+        """This sample's metrics from the run-wide MultiQC data (parsed once per run and cached)."""
+        if not (self.config.multiqc and self.config.multiqc.enabled):
+            return None
+        data_file = self.seqrun_path / self.config.multiqc.directory / self.config.multiqc.data_file
+        if not data_file.exists():
+            return None
+        sample = self.config.sample
+        return sample_multiqc_metrics(load_multiqc_data(data_file), [sample.barcode, sample.sample_id])
+
     def _parse_sample_data(self) -> SampleData:
         """Parse data for the sample."""
         sample_data = SampleData(sample_info=self.config.sample)
@@ -35,6 +58,7 @@ class SampleParser:
                 self.config.fastqc.directory,
                 self.config.fastqc.file
             )
+            sample_data.fastqc = FastQCParser(self.seqrun_path).parse_fastqc(self.config.fastqc)
 
         # Parse Krona
         if self.config.krona and self.config.krona.enabled:
@@ -51,6 +75,7 @@ class SampleParser:
                 self.config.multiqc.directory,
                 self.config.multiqc.report_file
             )
+            sample_data.multiqc = self.parse_multiqc_metrics()
 
         # Parse NanoPlot data
         if self.config.nanoplot:
@@ -81,14 +106,28 @@ class SampleParser:
             # Create structured nanoplot data
             sample_data.nanoplot = nanoplot_parser.create_structured_nanoplot(self.config.nanoplot)
 
+            # Chart series for native rendering, instead of loading the HTML plots
+            nanoplot_data_parser = NanoPlotDataParser(self.seqrun_path)
+            nanoplot_data = {
+                stage: nanoplot_data_parser.parse_stage(getattr(self.config.nanoplot, stage))
+                for stage in ('unprocessed', 'processed')
+            }
+            sample_data.nanoplot_data = {stage: data for stage, data in nanoplot_data.items() if data} or None
+
         # Parse taxonomic abundances
         if self.config.results and self.config.results.enabled:
-            taxonomic_parser = TaxonomicParser(self.seqrun_path)
-            sample_data.taxonomic_abundances = taxonomic_parser.parse_rel_abundance(self.config.results)
-
-            # Detect spike species after parsing taxonomic data
-            spike = get_detected_spike(sample_data.taxonomic_abundances)
-            if spike:
-                sample_data.spike = spike
+            sample_data.taxonomic_abundances = self.parse_taxonomic_abundances()
+
+            # Spike QC after parsing taxonomic data
+            sample_id = self.config.sample.sample_id
+            spike_config = self.config.spike
+            matrix = AbundanceMatrix.from_samples({sample_id: sample_data.taxonomic_abundances})
+            sample_data.spike_qc = compute_spike_qc(
+                matrix,
+                expected_abundance=[spike_config.expected_abundance] if spike_config else None,
+                spike_amount=[spike_config.amount] if spike_config else None,
+                classification_types=[self.config.sample.classification_type]
+            )[sample_id]
+            sample_data.spike = sample_data.spike_qc.species
 
         return sample_data
@@ -0,0 +1,126 @@
+"""FastQC metrics parsing straight from the FastQC zip archive."""
+
+import io
+import math
+import re
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DATA_MEMBER = 'fastqc_data.txt'
+
+# Rows kept from the (unbounded) overrepresented sequences table
+MAX_OVERREPRESENTED = 20
+
+# Modules that are a list of text rows rather than numeric columns
+TEXT_MODULES = {'overrepresented_sequences'}
+
+
+def _key(name: str) -> str:
+    """'Per base sequence quality' -> 'per_base_sequence_quality'."""
+    return re.sub(r'[^0-9a-z]+', '_', name.lower()).strip('_')
+
+
+def _number(value: str):
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    # FastQC writes NaN for positions no read reaches
+    if not math.isfinite(number):
+        return None
+    # Whole numbers as ints keep the stored arrays short ("12.0" -> 12)
+    return int(number) if number.is_integer() else number
+
+
+def _columns(header: List[str], rows: List[List[str]]) -> Dict[str, list]:
+    """Module table as columns: the first (position/label) kept as text, the rest numeric."""
+    columns: Dict[str, list] = {_key(name): [] for name in header}
+    names = list(columns)
+    for row in rows:
+        for i, name in enumerate(names):
+            value = row[i] if i < len(row) else ''
+            columns[name].append(value if i == 0 else _number(value))
+    return columns
+
+
+class FastQCParser:
+    """Parser for fastqc_data.txt inside a sample's FastQC zip."""
+
+    def __init__(self, seqrun_path: Path):
+        self.seqrun_path = seqrun_path
+
+    def parse_fastqc(self, fastqc_config) -> Optional[Dict[str, Any]]:
+        """Parse the zip next to the configured FastQC report (or the configured data_file)."""
+        if not fastqc_config:
+            return None
+
+        filename = fastqc_config.data_file or re.sub(r'\.html$', '.zip', fastqc_config.file)
+        zip_file = self.seqrun_path / fastqc_config.directory / filename
+        if not zip_file.exists() or not zipfile.is_zipfile(zip_file):
+            return None
+
+        try:
+            return self.parse_zip(zip_file)
+        except (OSError, zipfile.BadZipFile, KeyError, ValueError) as e:
+            print(f"Warning: could not parse FastQC data in {zip_file}: {e}")
+            return None
+
+    def parse_zip(self, zip_file: Path) -> Optional[Dict[str, Any]]:
+        """Stream fastqc_data.txt out of the archive without extracting it."""
+        with zipfile.ZipFile(zip_file) as archive:
+            member = next((name for name in archive.namelist() if name.endswith(f'/{DATA_MEMBER}') or name == DATA_MEMBER), None)
+            if member is None:
+                return None
+            with archive.open(member) as raw:
+                return self.parse_data(io.TextIOWrapper(raw, encoding='utf-8'))
+
+    def parse_data(self, lines) -> Dict[str, Any]:
+        """
+        Turn the FastQC modules into compact columns.
+
+        Returns:
+            Dict with the FastQC version, pass/warn/fail status per module, basic
+            statistics, and per module its table as one list per column
+        """
+        result: Dict[str, Any] = {'modules': {}}
+        module = None
+        header: List[str] = []
+        rows: List[List[str]] = []
+        extra: Dict[str, Any] = {}
+
+        for line in lines:
+            line = line.rstrip('\n')
+            if line.startswith('##FastQC'):
+                result['version'] = line.split('\t')[-1]
+            elif line.startswith('>>END_MODULE'):
+                if module:
+                    result.update(self._module_data(module, header, rows, extra))
+                module, header, rows, extra = None, [], [], {}
+            elif line.startswith('>>'):
+                name, _, status = line[2:].partition('\t')
+                module = _key(name)
+                result['modules'][module] = status
+            elif line.startswith('#'):
+                fields = line[1:].split('\t')
+                # Single "#Name<TAB>value" lines annotate a module, e.g. Total Deduplicated Percentage
+                if len(fields) == 2 and _number(fields[1]) is not None and not header:
+                    extra[_key(fields[0])] = _number(fields[1])
+                else:
+                    header = fields
+            elif module and line:
+                rows.append(line.split('\t'))
+
+        return result
+
+    def _module_data(self, module: str, header: List[str], rows: List[List[str]],
+                     extra: Dict[str, Any]) -> Dict[str, Any]:
+        if module == 'basic_statistics':
+            return {module: {_key(row[0]): _number(row[1]) if _number(row[1]) is not None else row[1]
+                             for row in rows if len(row) >= 2}}
+        if module in TEXT_MODULES:
+            keys = [_key(name) for name in header]
+            return {module: [dict(zip(keys, row)) for row in rows[:MAX_OVERREPRESENTED]]}
+        if not header:
+            return {}
+        return {module: {**extra, **_columns(header, rows)}}
@@ -0,0 +1,165 @@
+"""MultiQC data parsing, cached per run and fanned out to samples."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import ijson
+
+from ..config import CACHE_DIR
+
+# Bump when the cached layout changes
+MULTIQC_CACHE_VERSION = 1
+
+# Parsed runs kept in CACHE_DIR; the least recently used are deleted beyond this
+MULTIQC_CACHE_ENTRIES = 32
+
+# Parsed runs kept in memory; a worker only needs the runs it is ingesting
+MULTIQC_MEMORY_ENTRIES = 4
+
+# Section of multiqc_data.json holding every module's per-sample metrics
+RAW_DATA_PREFIX = 'report_saved_raw_data'
+
+# Sections derived from the others (and rescaled for display), not stored per sample
+SKIPPED_SECTIONS = {'multiqc_general_stats'}
+
+# Parsed multiqc_data.json per path, with the (mtime, size) it was parsed at, least recently used first
+_parsed: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Dict[str, Any]]]]" = OrderedDict()
+_parsed_lock = threading.Lock()
+
+
+def _field_name(key: str) -> str:
+    """Make a metric name safe to use as a MongoDB field name."""
+    return key.replace('.', '_').replace('$', '_')
+
+
+def _clean(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    return {_field_name(key): value for key, value in metrics.items()}
+
+
+def read_multiqc_data(data_file: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Stream the per-sample metrics out of multiqc_data.json.
+
+    Only the saved raw data section is materialized, one module at a time;
+    the much larger plot data is skipped by the incremental parser.
+
+    Returns:
+        Module section (e.g. multiqc_fastqc) -> MultiQC sample name -> metrics
+    """
+    sections = {}
+    with open(data_file, 'rb') as f:
+        for section, samples in ijson.kvitems(f, RAW_DATA_PREFIX, use_float=True):
+            if section in SKIPPED_SECTIONS or not isinstance(samples, dict):
+                continue
+            sections[section] = {name: _clean(metrics) for name, metrics in samples.items() if isinstance(metrics, dict)}
+    return sections
+
+
+def prune_multiqc_cache(keep: Path, max_entries: int = MULTIQC_CACHE_ENTRIES) -> int:
+    """Delete the least recently used MultiQC cache files beyond max_entries; returns the number deleted."""
+    cache_files = []
+    for cache_file in Path(CACHE_DIR).glob('multiqc-v*.json'):
+        try:
+            cache_files.append((cache_file.stat().st_mtime, cache_file))
+        except OSError:
+            continue
+    cache_files.sort(reverse=True)
+
+    deleted = 0
+    for _, cache_file in cache_files[max_entries:]:
+        if cache_file == keep:
+            continue
+        try:
+            cache_file.unlink()
+            deleted += 1
+        except OSError:
+            pass
+    return deleted
+
+
+def _write_cache_file(cache_file: Path, sections: Dict[str, Dict[str, Any]]):
+    """Write a cache file atomically, so concurrent readers never see a partial one."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(sections, f)
+        os.replace(tmp_path, cache_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_multiqc_data(data_file: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Parsed multiqc_data.json, reused while the file's mtime and size are unchanged.
+
+    Within a process the MULTIQC_MEMORY_ENTRIES most recently used parses are
+    kept in memory, so every sample of a run shares one; across processes a JSON cache in CACHE_DIR is keyed by path,
+    mtime and size, and keeps the MULTIQC_CACHE_ENTRIES most recently used runs.
+    """
+    path = str(data_file.resolve())
+    stat = data_file.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    with _parsed_lock:
+        cached = _parsed.get(path)
+        if cached and cached[0] == version:
+            _parsed.move_to_end(path)
+            return cached[1]
+
+    key = hashlib.sha256(f"{path}:{version[0]}:{version[1]}".encode()).hexdigest()[:16]
+    cache_file = Path(CACHE_DIR) / f"multiqc-v{MULTIQC_CACHE_VERSION}-{key}.json"
+    try:
+        with open(cache_file, 'r') as f:
+            sections = json.load(f)
+    except (OSError, ValueError):
+        sections = read_multiqc_data(data_file)
+        try:
+            _write_cache_file(cache_file, sections)
+            prune_multiqc_cache(cache_file, MULTIQC_CACHE_ENTRIES)
+        except OSError as e:
+            print(f"Warning: could not cache MultiQC data in {cache_file}: {e}")
+    else:
+        try:
+            os.utime(cache_file)  # Mark as recently used for pruning
+        except OSError:
+            pass
+
+    with _parsed_lock:
+        _parsed[path] = (version, sections)
+        _parsed.move_to_end(path)
+        while len(_parsed) > MULTIQC_MEMORY_ENTRIES:
+            _parsed.popitem(last=False)
+    return sections
+
+
+def sample_multiqc_metrics(sections: Dict[str, Dict[str, Any]],
+                           sample_names: Iterable[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Metrics of one sample from the run-wide MultiQC data.
+
+    MultiQC names samples after the input files, so a sample's rows are the
+    ones named exactly like its barcode/ID or prefixed with it (e.g.
+    barcode01_nanoplot_processed); the MultiQC sample names are kept as keys.
+
+    Returns:
+        Module (without the multiqc_ prefix) -> MultiQC sample name -> metrics, or None
+    """
+    names = [name for name in dict.fromkeys(sample_names) if name]
+    metrics = {}
+    for section, samples in sections.items():
+        module = section[len('multiqc_'):] if section.startswith('multiqc_') else section
+        rows = {
+            mq_name: values for mq_name, values in samples.items()
+            if any(mq_name == name or mq_name.startswith(f"{name}_") for name in names)
+        }
+        if rows:
+            metrics[module] = rows
+    return metrics or None
@@ -0,0 +1,200 @@
+"""Compact NanoPlot chart data extracted from the plotly HTML outputs."""
+
+import base64
+import gzip
+import json
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..analysis.downsample import lttb, summarize_length_quality, to_list
+
+# Points kept on the yield by length curve
+YIELD_POINTS = 500
+
+# Columns of NanoPlot's --raw/--store per-read data
+RAW_LENGTH_COLUMN = 'lengths'
+RAW_QUALITY_COLUMN = 'quals'
+
+# Per-read rows parsed per numpy call, bounding the memory held by raw lines
+RAW_CHUNK_ROWS = 200_000
+
+# Plotly calls in NanoPlot HTML: Plotly.newPlot("<div id>", [traces], layout, config)
+PLOTLY_CALL = 'Plotly.newPlot('
+
+
+def read_plotly_traces(html_file: Path) -> List[Dict[str, Any]]:
+    """Traces of the first plotly figure in a NanoPlot HTML file."""
+    with open(html_file, 'r', encoding='utf-8') as f:
+        html = f.read()
+    start = html.find(PLOTLY_CALL)
+    if start < 0:
+        return []
+    start = html.find('[', start + len(PLOTLY_CALL))
+    traces, _ = json.JSONDecoder().raw_decode(html, start)
+    return traces
+
+
+def trace_array(value) -> np.ndarray:
+    """Trace values as an array; newer plotly stores them as {dtype, bdata} base64 buffers."""
+    if isinstance(value, dict) and 'bdata' in value:
+        return np.frombuffer(base64.b64decode(value['bdata']), dtype=value['dtype'])
+    return np.asarray(value if value is not None else [], dtype=np.float64)
+
+
+def _parse_raw_rows(lines: List[str], columns: Tuple[int, int]) -> np.ndarray:
+    """(rows, 2) array of the given columns; a chunk with malformed rows is parsed row by row, skipping them."""
+    try:
+        return np.loadtxt(lines, delimiter='\t', usecols=columns, ndmin=2, dtype=np.float64)
+    except ValueError:
+        pass
+
+    values = []
+    for line in lines:
+        fields = line.rstrip('\n').split('\t')
+        try:
+            values.append((float(fields[columns[0]]), float(fields[columns[1]])))
+        except (IndexError, ValueError):
+            continue
+    return np.array(values, dtype=np.float64).reshape(-1, 2)
+
+
+def read_raw_length_quality(raw_file: Path):
+    """Per-read (length, quality) arrays from NanoPlot's NanoPlot-data.tsv(.gz), parsed in chunks by numpy."""
+    opener = gzip.open if raw_file.suffix == '.gz' else open
+    chunks = []
+    with opener(raw_file, 'rt') as f:
+        header = f.readline().rstrip('\n').split('\t')
+        if RAW_LENGTH_COLUMN not in header or RAW_QUALITY_COLUMN not in header:
+            return np.empty(0), np.empty(0)
+        columns = (header.index(RAW_LENGTH_COLUMN), header.index(RAW_QUALITY_COLUMN))
+        while True:
+            lines = list(islice(f, RAW_CHUNK_ROWS))
+            if not lines:
+                break
+            chunks.append(_parse_raw_rows(lines, columns))
+
+    values = np.concatenate(chunks) if chunks else np.empty((0, 2))
+    return np.ascontiguousarray(values[:, 0]), np.ascontiguousarray(values[:, 1])
+
+
+class NanoPlotDataParser:
+    """Extract histogram, yield and length vs quality series from a NanoPlot stage."""
+
+    # File name suffix -> series it holds
+    FILES = {
+        'length_quality': ('LengthvsQualityScatterPlot_dot.html', 'LengthvsQualityScatterPlot_kde.html'),
+        'histogram_reads': ('Non_weightedHistogramReadlength.html',),
+        'histogram_bases': ('_WeightedHistogramReadlength.html',),
+        'yield_by_length': ('Yield_By_Length.html',),
+    }
+
+    def __init__(self, seqrun_path: Path):
+        self.seqrun_path = seqrun_path
+
+    def _find(self, stage_config, series: str) -> Optional[Path]:
+        for suffix in self.FILES[series]:
+            for html_file in stage_config.html_files:
+                file_path = self.seqrun_path / stage_config.directory / html_file
+                if html_file.endswith(suffix) and 'LogTransformed' not in html_file and file_path.exists():
+                    return file_path
+        return None
+
+    def _traces(self, stage_config, series: str) -> List[Dict[str, Any]]:
+        file_path = self._find(stage_config, series)
+        if not file_path:
+            return []
+        try:
+            return read_plotly_traces(file_path)
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not read plot data from {file_path}: {e}")
+            return []
+
+    def parse_stage(self, stage_config) -> Optional[Dict[str, Any]]:
+        """
+        Chart data for one stage (processed/unprocessed).
+
+        Per-read length and quality come from NanoPlot's raw data file when
+        configured, otherwise from the scatter plot. They are summarized as a
+        density histogram plus LTTB series of fixed size. Histograms and the
+        yield curve are taken from their own plots, or recomputed from the reads
+        when those are missing.
+        """
+        if not stage_config or not stage_config.enabled:
+            return None
+
+        lengths, qualities = self.read_length_quality(stage_config)
+        data: Dict[str, Any] = {}
+        if lengths.size:
+            data['reads'] = int(lengths.size)
+            data['length_quality'] = summarize_length_quality(lengths, qualities)
+
+        histogram = self.length_histogram(stage_config, lengths)
+        if histogram:
+            data['length_histogram'] = histogram
+
+        yield_curve = self.yield_by_length(stage_config, lengths)
+        if yield_curve:
+            data['yield_by_length'] = yield_curve
+
+        return data or None
+
+    def read_length_quality(self, stage_config):
+        """Per-read (length, quality) arrays from the raw data file or the length vs quality scatter plot."""
+        if stage_config.raw_file:
+            raw_file = self.seqrun_path / stage_config.directory / stage_config.raw_file
+            if raw_file.exists():
+                try:
+                    return read_raw_length_quality(raw_file)
+                except (OSError, EOFError, ValueError) as e:
+                    print(f"Warning: could not read per-read data from {raw_file}: {e}")
+
+        for trace in self._traces(stage_config, 'length_quality'):
+            if trace.get('mode') == 'markers' and 'x' in trace and 'y' in trace:
+                return trace_array(trace['x']), trace_array(trace['y'])
+        return np.empty(0), np.empty(0)
+
+    def length_histogram(self, stage_config, lengths: np.ndarray) -> Optional[Dict[str, list]]:
+        """Read count and base count per read length bin."""
+        bars = {}
+        for series in ('histogram_reads', 'histogram_bases'):
+            bar = next((trace for trace in self._traces(stage_config, series) if trace.get('type') == 'bar'), None)
+            if bar:
+                bars[series] = (trace_array(bar.get('x')), trace_array(bar.get('y')))
+
+        if bars:
+            bins = next(iter(bars.values()))[0]
+            histogram = {'length': to_list(bins, 0)}
+            for series, key in (('histogram_reads', 'reads'), ('histogram_bases', 'bases')):
+                if series in bars and bars[series][1].size == bins.size:
+                    histogram[key] = to_list(bars[series][1], 0)
+            return histogram
+
+        if not lengths.size:
+            return None
+        reads, edges = np.histogram(lengths, bins=10)
+        bases, _ = np.histogram(lengths, bins=edges, weights=lengths)
+        return {
+            'length': to_list((edges[:-1] + edges[1:]) / 2, 0),
+            'reads': reads.tolist(),
+            'bases': to_list(bases, 0)
+        }
+
+    def yield_by_length(self, stage_config, lengths: np.ndarray) -> Optional[Dict[str, list]]:
+        """Cumulative yield in bases of reads at least as long as each length."""
+        trace = next((trace for trace in self._traces(stage_config, 'yield_by_length') if 'x' in trace and 'y' in trace), None)
+        if trace:
+            x = trace_array(trace['x']).astype(np.float64)
+            # NanoPlot plots the yield in Gb
+            y = trace_array(trace['y']) * 1e9
+        elif lengths.size:
+            x = np.sort(lengths.astype(np.float64))[::-1]
+            y = np.cumsum(x)
+        else:
+            return None
+
+        order = np.argsort(x, kind='stable')
+        curve = lttb(x[order], y[order], YIELD_POINTS, y_decimals=0)
+        return {'length': curve['x'], 'yield': curve['y']}
@@ -0,0 +1,125 @@
+"""Run-level parsing of the emu-combined taxa x samples matrices."""
+
+import csv
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..models import RunData, RunMatrix
+
+EMU_COMBINED_DIRECTORY = 'emu-combined'
+ABUNDANCE_DIRECTORY = 'collected_reports_dir'
+COUNTS_DIRECTORY = 'collected_reports_counts_dir'
+MATRIX_PREFIX = 'emu-combined-'
+
+# Header columns describing the taxon rather than a sample
+LINEAGE_COLUMNS = {'tax_id', 'species', 'genus', 'family', 'order', 'class', 'phylum',
+                   'superkingdom', 'subspecies', 'species subgroup', 'species group', 'clade'}
+
+# Read file suffixes stripped from sample column headers
+SAMPLE_SUFFIXES = ('.fastq.gz', '.fq.gz', '.fastq', '.fq', '_filtered')
+
+
+def sample_column_name(header: str) -> str:
+    """Sample name of a matrix column, e.g. barcode01 for barcode01_filtered.fastq."""
+    for suffix in SAMPLE_SUFFIXES:
+        if header.endswith(suffix):
+            header = header[:-len(suffix)]
+    return header
+
+
+def find_emu_combined_dir(path: Path) -> Optional[Path]:
+    """Locate the emu-combined directory from a run, results or emu-combined directory."""
+    for candidate in (path / 'results' / EMU_COMBINED_DIRECTORY, path / EMU_COMBINED_DIRECTORY, path):
+        if (candidate / ABUNDANCE_DIRECTORY).is_dir():
+            return candidate
+    return None
+
+
+def read_combined_matrix(matrix_file: Path) -> Tuple[Dict[str, List[str]], List[str], List[List[float]]]:
+    """
+    Stream a combined matrix TSV into columns without building per-row records.
+
+    Returns:
+        Tuple of (lineage columns by name, sample names, one value column per sample)
+    """
+    with open(matrix_file, 'r') as f:
+        reader = csv.reader(f, delimiter='\t')
+        header = next(reader, [])
+        n_lineage = 0
+        while n_lineage < len(header) and header[n_lineage] in LINEAGE_COLUMNS:
+            n_lineage += 1
+
+        lineage_names = header[:n_lineage]
+        taxa: Dict[str, List[str]] = {name: [] for name in lineage_names}
+        lineage_columns = [taxa[name] for name in lineage_names]
+        value_columns: List[List[float]] = [[] for _ in header[n_lineage:]]
+
+        for row in reader:
+            if not row:
+                continue
+            for column, value in zip(lineage_columns, row):
+                column.append(value)
+            for column, value in zip(value_columns, row[n_lineage:]):
+                column.append(float(value) if value else 0.0)
+
+    return taxa, [sample_column_name(name) for name in header[n_lineage:]], value_columns
+
+
+class RunMatrixParser:
+    """Parser for the emu-combined matrices holding every sample of a run."""
+
+    def __init__(self, emu_combined_path: Path, sample_ids: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            emu_combined_path: The run's emu-combined directory
+            sample_ids: Matrix column name (e.g. barcode) -> Eyrie sample ID;
+                unmapped columns keep their column name
+        """
+        self.emu_combined_path = emu_combined_path
+        self.sample_ids = sample_ids or {}
+
+    def matrix_files(self) -> Dict[str, Tuple[Path, Optional[Path]]]:
+        """Abundance and (if present) counts matrix file per rank."""
+        files = {}
+        for abundance_file in sorted((self.emu_combined_path / ABUNDANCE_DIRECTORY).glob(f'{MATRIX_PREFIX}*.tsv')):
+            rank = abundance_file.stem[len(MATRIX_PREFIX):]
+            counts_file = self.emu_combined_path / COUNTS_DIRECTORY / f'{MATRIX_PREFIX}{rank}-counts.tsv'
+            files[rank] = (abundance_file, counts_file if counts_file.exists() else None)
+        return files
+
+    def parse(self, sequencing_run_id: str, classification_type: Optional[str] = None) -> RunData:
+        """Parse all ranks into one run document; matrix columns follow a single sample order."""
+        samples: List[str] = []
+        matrices = {}
+
+        for rank, (abundance_file, counts_file) in self.matrix_files().items():
+            taxa, names, abundance = read_combined_matrix(abundance_file)
+            columns = dict(zip(names, abundance))
+            missing = [0.0] * len(next(iter(taxa.values()), []))
+            if not samples:
+                samples = names
+            elif set(names) != set(samples):
+                print(f"Warning: {abundance_file.name} has different samples than the other matrices")
+
+            counts = None
+            if counts_file:
+                count_taxa, count_names, count_values = read_combined_matrix(counts_file)
+                if count_taxa == taxa:
+                    count_columns = dict(zip(count_names, count_values))
+                    counts = [count_columns.get(name, missing) for name in samples]
+                else:
+                    print(f"Warning: {counts_file.name} rows do not match {abundance_file.name}, skipping counts")
+
+            matrices[rank] = RunMatrix(
+                taxa=taxa,
+                # Relative abundances are fractions in the TSV; Eyrie stores percent
+                abundance=[[round(value * 100, 4) for value in columns.get(name, missing)] for name in samples],
+                counts=counts
+            )
+
+        return RunData(
+            sequencing_run_id=sequencing_run_id,
+            classification_type=classification_type,
+            samples=[self.sample_ids.get(name, name) for name in samples],
+            matrices=matrices
+        )
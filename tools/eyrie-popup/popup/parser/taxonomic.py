@@ -4,7 +4,8 @@ import csv
 from pathlib import Path
 from typing import List
 
-from ..models import TaxonomicAbundance
+from ..models import TaxonomicHit
+from ..utils.lineage import lineage_registry
 
 
 class TaxonomicParser:
@@ -13,7 +14,7 @@ class TaxonomicParser:
     def __init__(self, seqrun_path: Path):
         self.seqrun_path = seqrun_path
 
-    def parse_rel_abundance(self, results_config) -> List[TaxonomicAbundance]:
+    def parse_rel_abundance(self, results_config) -> List[TaxonomicHit]:
         """Parse relative abundance TSV file."""
         if not results_config:
             return []
@@ -40,22 +41,32 @@ class TaxonomicParser:
                     if 'contamination' in row:
                         contamination = row['contamination'].lower() in ['true', '1', 'yes', 'contamination']
 
-                    abundance_data = TaxonomicAbundance(
-                        tax_id=row.get('tax_id', ''),
-                        abundance=float(row.get('abundance', 0)),
-                        species=species,
-                        genus=row.get('genus', ''),
-                        family=row.get('family', ''),
-                        order=row.get('order', ''),
-                        **{'class': row.get('class', '')},  # Using dict unpacking for 'class'
-                        phylum=row.get('phylum', ''),
-                        superkingdom=row.get('superkingdom', ''),
-                        estimated_counts=float(row.get('estimated counts', 0)),
-                        contamination=contamination
-                    )
-                    abundances.append(abundance_data)
+                    # Lineage strings are shared with every other row of the same tax_id
+                    abundances.append(TaxonomicHit(
+                        lineage_registry.from_row(row),
+                        float(row.get('abundance', 0)),
+                        float(row.get('estimated counts', 0)),
+                        contamination
+                    ))
 
         except Exception as e:
             print(f"Error parsing abundance file {abundance_file}: {e}")
 
         return abundances
+
+    def load_translated_names(self, results_config) -> int:
+        """Register tax_id names from the translate_taxids output, if configured."""
+        if not results_config or not results_config.read_assignment_file or not results_config.translated_file:
+            return 0
+
+        assignment_file = self.seqrun_path / results_config.directory / results_config.read_assignment_file
+        translated_file = (self.seqrun_path / results_config.directory /
+                           results_config.translated_directory / results_config.translated_file)
+        if not assignment_file.exists() or not translated_file.exists():
+            return 0
+
+        try:
+            return lineage_registry.load_translated_names(assignment_file, translated_file)
+        except Exception as e:
+            print(f"Error reading translated tax_ids {translated_file}: {e}")
+            return 0
@@ -0,0 +1,63 @@
+"""Nextflow execution trace parsing."""
+
+import csv
+import re
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from ..models import PipelineRun, PipelineTask
+from ..utils.units import parse_duration, parse_memory, parse_percent
+
+PIPELINE_INFO_DIRECTORY = 'pipeline_info'
+TRACE_PATTERN = 'execution_trace_*.txt'
+
+# 'GMS_TRANA:TRANA:FASTQC (barcode01)' -> process and tag
+_TASK_NAME = re.compile(r'^(?P<process>[^\s(]+)(?:\s+\((?P<tag>.*)\))?$')
+
+MEMORY_FIELDS = ['peak_rss', 'peak_vmem', 'rchar', 'wchar']
+
+
+def find_trace_files(path: Path) -> List[Path]:
+    """Execution traces in a run directory's pipeline_info (or the given directory itself)."""
+    directory = path / PIPELINE_INFO_DIRECTORY if (path / PIPELINE_INFO_DIRECTORY).is_dir() else path
+    return sorted(directory.glob(TRACE_PATTERN))
+
+
+def iter_trace_tasks(trace_file: Path) -> Iterator[PipelineTask]:
+    """Stream the tasks of an execution trace one row at a time."""
+    with open(trace_file, 'r') as f:
+        for row in csv.DictReader(f, delimiter='\t'):
+            name = row.get('name', '')
+            match = _TASK_NAME.match(name)
+            exit_code = row.get('exit', '-')
+            yield PipelineTask(
+                task_id=row.get('task_id', ''),
+                name=name,
+                process=match.group('process') if match else name,
+                tag=match.group('tag') if match else None,
+                status=row.get('status', ''),
+                exit=int(exit_code) if exit_code.lstrip('-').isdigit() else None,
+                submit=row.get('submit') if row.get('submit') not in (None, '', '-') else None,
+                duration=parse_duration(row.get('duration', '')),
+                realtime=parse_duration(row.get('realtime', '')),
+                cpu_percent=parse_percent(row.get('%cpu', '')),
+                **{field: parse_memory(row.get(field, '')) for field in MEMORY_FIELDS}
+            )
+
+
+def parse_trace(trace_file: Path, sequencing_run_id: str) -> Optional[PipelineRun]:
+    """Parse one execution trace; returns None for traces without tasks."""
+    tasks = list(iter_trace_tasks(trace_file))
+    if not tasks:
+        return None
+
+    # execution_trace_2025-09-30_09-46-56.txt -> 2025-09-30_09-46-56
+    timestamp = trace_file.stem[len('execution_trace_'):]
+    submitted = [task.submit for task in tasks if task.submit]
+    return PipelineRun(
+        pipeline_run_id=f"{sequencing_run_id}_{timestamp}",
+        sequencing_run_id=sequencing_run_id,
+        trace_file=trace_file.name,
+        started=min(submitted) if submitted else None,
+        tasks=tasks
+    )
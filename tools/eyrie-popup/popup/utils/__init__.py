@@ -1,6 +1,12 @@
 """Utility functions for eyrie-popup."""
 
-from .spike_detection import is_spike, get_detected_spike
+from .spike_panels import SpikePanel, load_spike_panels, get_spike_panel
+from .lineage import Lineage, LineageRegistry, lineage_registry
 from .file_helpers import find_file
+from .artifacts import ArtifactStore, sample_artifact_files
+from .ingest_manifest import IngestManifest, sample_input_files
+from .sample_config import default_sample_config
 
-__all__ = ['is_spike', 'get_detected_spike', 'find_file']
+__all__ = ['SpikePanel', 'load_spike_panels', 'get_spike_panel',
+           'Lineage', 'LineageRegistry', 'lineage_registry', 'find_file', 'ArtifactStore', 'sample_artifact_files',
+           'IngestManifest', 'sample_input_files', 'default_sample_config']
@@ -0,0 +1,113 @@
+"""Content-addressed store for pipeline output files."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+# Store location relative to the data directory served at /data
+STORE_DIR = 'cas'
+BLOBS_DIR = f'{STORE_DIR}/blobs'
+MANIFESTS_DIR = f'{STORE_DIR}/manifests'
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(file_path: Path) -> str:
+    """Hex sha256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def blob_name(digest: str, suffix: str = '') -> str:
+    """Blob path relative to the data directory; the suffix keeps the content type servable."""
+    return f"{BLOBS_DIR}/{digest[:2]}/{digest}{suffix.lower()}"
+
+
+def blob_digest(blob: Path) -> str:
+    """Digest a blob is named after (its file name up to the first dot)."""
+    return blob.name.split('.', 1)[0]
+
+
+def sample_artifact_files(sample_data) -> List[str]:
+    """Run-relative paths of the files a sample links to (reports and plots)."""
+    files = [sample_data.fastqc_file, sample_data.krona_file, sample_data.multiqc_file]
+    if sample_data.nanoplot:
+        for file_set in (sample_data.nanoplot.unprocessed, sample_data.nanoplot.processed):
+            if file_set:
+                files.extend(file_set.dict().values())
+    return list(dict.fromkeys(path for path in files if path))
+
+
+class ArtifactStore:
+    """sha256-named blobs plus a path manifest per sample, under <data_dir>/cas."""
+
+    def __init__(self, data_dir: Path):
+        self.data_dir = Path(data_dir)
+
+    def put(self, file_path: Path) -> str:
+        """
+        Add a file to the store unless identical content is already there.
+
+        Returns:
+            Blob path relative to the data directory
+        """
+        digest = file_sha256(file_path)
+        name = blob_name(digest, file_path.suffix)
+        blob = self.data_dir / name
+        if blob.exists():
+            return name
+
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        # Copy next to the blob and rename, so readers never see a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=blob.parent, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as tmp, open(file_path, 'rb') as src:
+                shutil.copyfileobj(src, tmp, CHUNK_SIZE)
+            os.chmod(tmp_name, 0o444)
+            os.replace(tmp_name, blob)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return name
+
+    def store_files(self, base_path: Path, paths: List[str]) -> Dict[str, str]:
+        """Store files given relative to base_path; returns relative path -> blob path."""
+        return {path: self.put(base_path / path) for path in paths if (base_path / path).is_file()}
+
+    def write_manifest(self, sample_id: str, run_dir: str, blobs: Dict[str, str]) -> Path:
+        """Record which blob backs each of a sample's original file paths."""
+        manifest = self.data_dir / MANIFESTS_DIR / f"{sample_id}.json"
+        manifest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = manifest.with_suffix('.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump({
+                'sample_id': sample_id,
+                'files': {f"{run_dir}/{path}": blob for path, blob in sorted(blobs.items())}
+            }, f, indent=2)
+        os.replace(tmp, manifest)
+        return manifest
+
+    def read_manifest(self, sample_id: str) -> Optional[Dict[str, str]]:
+        """A sample's original path -> blob path mapping, if it has been stored."""
+        manifest = self.data_dir / MANIFESTS_DIR / f"{sample_id}.json"
+        if not manifest.exists():
+            return None
+        with open(manifest, 'r') as f:
+            return json.load(f).get('files', {})
+
+    def blobs(self) -> Iterator[Path]:
+        """All blobs in the store."""
+        blobs_dir = self.data_dir / BLOBS_DIR
+        if blobs_dir.exists():
+            yield from (blob for blob in sorted(blobs_dir.glob('*/*')) if not blob.name.startswith('.'))
+
+    def verify(self) -> List[Path]:
+        """Re-hash every blob; returns those whose content no longer matches their name."""
+        return [blob for blob in self.blobs() if file_sha256(blob) != blob_digest(blob)]
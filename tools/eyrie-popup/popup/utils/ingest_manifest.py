@@ -0,0 +1,132 @@
+"""Per-sample manifest of ingested input files, to skip re-ingesting unchanged samples."""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..config import CACHE_DIR, SPIKE_PANELS_FILE
+from ..__version__ import __version__
+from .artifacts import file_sha256
+
+# Manifests live under EYRIE_POPUP_MANIFESTS, or the popup cache directory
+MANIFEST_DIR = os.getenv('EYRIE_POPUP_MANIFESTS', str(Path(CACHE_DIR) / "ingest"))
+
+# Bump when the manifest layout changes
+MANIFEST_VERSION = 1
+
+
+def sample_input_files(config, config_file: Optional[Path] = None) -> List[Path]:
+    """Every file that parsing a sample reads, whether or not it exists yet."""
+    seqrun_path = Path(config.base_path) / (config.run_directory or config.sample.sequencing_run_id)
+    files = [Path(os.getenv('EYRIE_SPIKE_PANELS') or SPIKE_PANELS_FILE)]
+    if config_file:
+        files.append(Path(config_file))
+
+    if config.fastqc and config.fastqc.enabled:
+        data_file = config.fastqc.data_file or str(Path(config.fastqc.file).with_suffix('.zip'))
+        files += [seqrun_path / config.fastqc.directory / name for name in (config.fastqc.file, data_file)]
+    if config.krona and config.krona.enabled:
+        files.append(seqrun_path / config.krona.directory / config.krona.file)
+    if config.multiqc and config.multiqc.enabled:
+        files += [seqrun_path / config.multiqc.directory / name
+                  for name in (config.multiqc.report_file, config.multiqc.data_file)]
+    if config.nanoplot:
+        for stage in (config.nanoplot.unprocessed, config.nanoplot.processed):
+            if stage and stage.enabled:
+                names = [stage.stats_file, *stage.html_files] + ([stage.raw_file] if stage.raw_file else [])
+                files += [seqrun_path / stage.directory / name for name in names]
+    if config.results and config.results.enabled:
+        results = config.results
+        files.append(seqrun_path / results.directory / results.rel_abundance_file)
+        if results.read_assignment_file:
+            files.append(seqrun_path / results.directory / results.read_assignment_file)
+        if results.translated_file:
+            files.append(seqrun_path / results.translated_directory / results.translated_file)
+
+    return list(dict.fromkeys(files))
+
+
+class IngestManifest:
+    """
+    Input files (path, size, mtime, sha256) of a sample's last successful ingest.
+
+    Unchanged size and mtime reuse the recorded hash, so checking a sample
+    costs one stat per file; only files whose stat changed are re-hashed,
+    and a file that was merely touched still counts as unchanged.
+    """
+
+    def __init__(self, api_url: str, sample_id: str, manifest_dir: Optional[Path] = None):
+        # One manifest per sample and target API, so ingesting into another instance is not skipped
+        api_key = hashlib.sha256(api_url.rstrip('/').encode()).hexdigest()[:12]
+        self.path = Path(manifest_dir or MANIFEST_DIR) / api_key / f"{sample_id}.json"
+        self._recorded = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return manifest if manifest.get('version') == MANIFEST_VERSION else {}
+
+    def snapshot(self, files: List[Path]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Current state of each file, hashing only those whose size or mtime changed."""
+        recorded = self._recorded.get('files', {})
+        entries = {}
+        for file_path in files:
+            key = str(Path(file_path).resolve())
+            try:
+                stat = os.stat(key)
+            except FileNotFoundError:
+                entries[key] = None
+                continue
+            previous = recorded.get(key)
+            if previous and previous['size'] == stat.st_size and previous['mtime_ns'] == stat.st_mtime_ns:
+                sha256 = previous['sha256']
+            else:
+                sha256 = file_sha256(Path(key))
+            entries[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256}
+        return entries
+
+    def changed_files(self, snapshot: Dict[str, Optional[Dict[str, Any]]], options: Dict[str, Any]) -> List[str]:
+        """
+        Files that differ from the last successful ingest.
+
+        Returns:
+            Changed paths; every path if there is no manifest or the upload options
+            or popup version differ, and an empty list if the sample is unchanged
+        """
+        if not self._recorded or self._recorded.get('options') != options \
+                or self._recorded.get('popup_version') != __version__:
+            return list(snapshot)
+
+        recorded = self._recorded.get('files', {})
+        changed = [
+            path for path, entry in snapshot.items()
+            if (entry and entry['sha256']) != ((recorded.get(path) or {}).get('sha256'))
+        ]
+        # Files no longer read by the config (e.g. a disabled section)
+        return changed + [path for path in recorded if path not in snapshot]
+
+    def record(self, snapshot: Dict[str, Optional[Dict[str, Any]]], options: Dict[str, Any]):
+        """Save the snapshot after a successful ingest (written atomically)."""
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'popup_version': __version__,
+            'options': options,
+            'files': snapshot
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(manifest, f, indent=1)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._recorded = manifest
+
@@ -0,0 +1,115 @@
+"""Shared taxonomy lineage registry keyed by tax_id."""
+
+import csv
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+# Ranks above species kept per tax_id, in TSV column order
+LINEAGE_RANKS = ('genus', 'family', 'order', 'class', 'phylum', 'superkingdom')
+
+
+class Lineage(NamedTuple):
+    """Immutable, interned lineage of one taxon."""
+    tax_id: str
+    species: str
+    genus: str = ''
+    family: str = ''
+    order: str = ''
+    class_name: str = ''
+    phylum: str = ''
+    superkingdom: str = ''
+
+    def ranks(self) -> Dict[str, str]:
+        """Non-empty lineage ranks, keyed by TSV column name."""
+        values = (self.genus, self.family, self.order, self.class_name, self.phylum, self.superkingdom)
+        return {rank: value for rank, value in zip(LINEAGE_RANKS, values) if value}
+
+    def entry(self) -> Dict[str, object]:
+        """Taxonomy entry (tax_id, species, lineage) for upload to Eyrie."""
+        return {'tax_id': self.tax_id, 'species': self.species, 'lineage': self.ranks()}
+
+
+def _intern(value: Optional[str]) -> str:
+    return sys.intern(value.strip()) if value else ''
+
+
+class LineageRegistry:
+    """Thread-safe in-process LRU of lineages so each tax_id's strings are parsed and stored once."""
+
+    def __init__(self, maxsize: int = 65536):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Lineage]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, tax_id: str) -> Optional[Lineage]:
+        """Cached lineage for a tax_id, marking it recently used."""
+        with self._lock:
+            lineage = self._entries.get(tax_id)
+            if lineage is not None:
+                self._entries.move_to_end(tax_id)
+            return lineage
+
+    def register(self, tax_id: str, species: str, **ranks: str) -> Lineage:
+        """Add or complete a lineage; known ranks are kept when a source omits them."""
+        tax_id = _intern(str(tax_id))
+        species = _intern(species)
+        values = {field: _intern(ranks.get(rank)) for rank, field in zip(LINEAGE_RANKS, Lineage._fields[2:])}
+        with self._lock:
+            current = self._entries.get(tax_id)
+            lineage = Lineage(
+                tax_id=tax_id,
+                species=species or (current.species if current else ''),
+                **{field: value or (getattr(current, field) if current else '') for field, value in values.items()}
+            )
+            if lineage == current:
+                lineage = current
+            else:
+                self._entries[tax_id] = lineage
+            self._entries.move_to_end(tax_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return lineage
+
+    def from_row(self, row: Dict[str, str]) -> Lineage:
+        """Lineage for a relative abundance TSV row, parsing its ranks only on first sight."""
+        tax_id = row.get('tax_id', '')
+        lineage = self.get(tax_id) if tax_id else None
+        # Names-only entries (from translate_taxids) still need the row's ranks
+        if lineage is not None and lineage.species == row.get('species', '').strip() and any(lineage[2:]):
+            return lineage
+        return self.register(tax_id, row.get('species', ''), **{rank: row.get(rank, '') for rank in LINEAGE_RANKS})
+
+    def load_translated_names(self, assignment_file: Path, translated_file: Path) -> int:
+        """
+        Register species names from a translate_taxids output.
+
+        The translated read-assignment table has the same columns as the original,
+        with tax_id headers replaced by species names, so headers pair up by position.
+
+        Returns:
+            Number of tax_ids named
+        """
+        with open(assignment_file, 'r') as f:
+            tax_ids = next(csv.reader(f, delimiter='\t'), [])[1:]
+        with open(translated_file, 'r') as f:
+            names = next(csv.reader(f, delimiter='\t'), [])[1:]
+
+        if len(tax_ids) != len(names):
+            print(f"Warning: column mismatch between {assignment_file} and {translated_file}")
+            return 0
+
+        for tax_id, name in zip(tax_ids, names):
+            if tax_id and name:
+                self.register(tax_id, name)
+        return len(tax_ids)
+
+
+# Process-wide registry shared by all parsers
+lineage_registry = LineageRegistry()
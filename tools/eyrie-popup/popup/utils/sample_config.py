@@ -0,0 +1,73 @@
+"""Default sample configuration for a TRANA output directory."""
+
+from pathlib import Path
+from typing import Any, Dict
+
+
+def default_sample_config(trana_output_dirpath: Path, sample_id: str, sample_name: str, lims_id: str,
+                          run_id: str, run_dir: str, classification: str = '16S') -> Dict[str, Any]:
+    """Sample configuration (as written by generate-config) using TRANA's standard file names."""
+    return {
+        "sample": {
+            "sample_id": sample_id,
+            "sample_name": sample_name,
+            "lims_id": lims_id,
+            "barcode": sample_id if sample_id.startswith("barcode") else None,
+            "sequencing_run_id": run_id,
+            "classification_type": classification
+        },
+        "base_path": str(trana_output_dirpath.parent),
+        "run_directory": run_dir,
+        "fastqc": {
+            "enabled": True,
+            "directory": "fastqc",
+            "file": f"{sample_id}_fastqc.html",
+            "data_file": f"{sample_id}_fastqc.zip"
+        },
+        "krona": {
+            "enabled": True,
+            "directory": "krona", 
+            "file": f"{sample_id}_krona.html"
+        },
+        "multiqc": {
+            "enabled": True,
+            "directory": "multiqc",
+            "report_file": "multiqc_report.html",
+            "data_file": "multiqc_data/multiqc_data.json"
+        },
+        "nanoplot": {
+            "unprocessed": {
+                "enabled": True,
+                "directory": "nanoplot_unprocessed",
+                "stats_file": f"{sample_id}_nanoplot_unprocessed_NanoStats.txt",
+                "html_files": [
+                    f"{sample_id}_nanoplot_unprocessed_NanoPlot-report.html",
+                    f"{sample_id}_nanoplot_unprocessed_LengthvsQualityScatterPlot_dot.html",
+                    f"{sample_id}_nanoplot_unprocessed_LengthvsQualityScatterPlot_kde.html",
+                    f"{sample_id}_nanoplot_unprocessed_Non_weightedHistogramReadlength.html",
+                    f"{sample_id}_nanoplot_unprocessed_WeightedHistogramReadlength.html",
+                    f"{sample_id}_nanoplot_unprocessed_Yield_By_Length.html"
+                ]
+            },
+            "processed": {
+                "enabled": True,
+                "directory": "nanoplot_processed",
+                "stats_file": f"{sample_id}_nanoplot_processed_NanoStats.txt",
+                "html_files": [
+                    f"{sample_id}_nanoplot_processed_NanoPlot-report.html",
+                    f"{sample_id}_nanoplot_processed_LengthvsQualityScatterPlot_dot.html",
+                    f"{sample_id}_nanoplot_processed_LengthvsQualityScatterPlot_kde.html",
+                    f"{sample_id}_nanoplot_processed_Non_weightedHistogramReadlength.html",
+                    f"{sample_id}_nanoplot_processed_WeightedHistogramReadlength.html",
+                    f"{sample_id}_nanoplot_processed_Yield_By_Length.html"
+                ]
+            }
+        },
+        "results": {
+            "enabled": True,
+            "directory": "results",
+            "rel_abundance_file": f"{sample_id}_filtered.fastq_rel-abundance.tsv",
+            "read_assignment_file": f"{sample_id}_filtered.fastq_read-assignment-distributions.tsv",
+            "translated_file": f"{sample_id}_read-assignment-distributions_translated.tsv"
+        }
+    }
@@ -0,0 +1,113 @@
+"""Spike panel loading and compiled tax_id/name lookup."""
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+import yaml
+
+from ..config import SPIKE_PANELS_FILE, CACHE_DIR
+
+# Bump when the compiled cache layout changes
+PANEL_CACHE_VERSION = 1
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a species name for lookups."""
+    return " ".join(name.lower().split())
+
+
+class SpikePanel:
+    """Frozen lookup of spike taxa by tax_id and normalized name or synonym."""
+
+    __slots__ = ('_tax_ids', '_names')
+
+    def __init__(self, tax_ids: Dict[str, str], names: Dict[str, str]):
+        self._tax_ids = dict(tax_ids)
+        self._names = dict(names)
+
+    @classmethod
+    def compile(cls, entries) -> 'SpikePanel':
+        """Compile panel entries ({name, tax_ids, synonyms}) into lookup tables."""
+        tax_ids, names = {}, {}
+        for entry in entries or []:
+            if isinstance(entry, str):
+                entry = {'name': entry}
+            canonical = entry['name']
+            for tax_id in entry.get('tax_ids', []):
+                tax_ids[str(tax_id)] = canonical
+            for name in [canonical] + list(entry.get('synonyms', [])):
+                names[normalize_name(name)] = canonical
+        return cls(tax_ids, names)
+
+    def match(self, species_name: Optional[str], tax_id: Optional[str] = None) -> Optional[str]:
+        """Canonical spike name for a taxon, or None if it is not a spike."""
+        if tax_id:
+            canonical = self._tax_ids.get(str(tax_id))
+            if canonical:
+                return canonical
+        if species_name:
+            return self._names.get(normalize_name(species_name))
+        return None
+
+    def to_dict(self) -> Dict[str, Dict[str, str]]:
+        return {'tax_ids': self._tax_ids, 'names': self._names}
+
+
+def _read_panel_file(path: Path) -> Dict[str, list]:
+    with open(path, 'r') as f:
+        if path.suffix == '.json':
+            return json.load(f)
+        return yaml.safe_load(f) or {}
+
+
+@lru_cache(maxsize=None)
+def load_spike_panels(path: Optional[str] = None) -> Dict[str, SpikePanel]:
+    """
+    Load and compile the spike panels, reusing a disk cache keyed by the file's hash.
+
+    Args:
+        path: Panel YAML/JSON file; defaults to EYRIE_SPIKE_PANELS or the bundled panels
+
+    Returns:
+        Compiled panel per classification type
+    """
+    panel_file = Path(path or os.getenv('EYRIE_SPIKE_PANELS') or SPIKE_PANELS_FILE)
+    content = panel_file.read_bytes()
+    digest = hashlib.sha256(content).hexdigest()
+    cache_file = Path(CACHE_DIR) / f"spike_panels-v{PANEL_CACHE_VERSION}-{digest[:16]}.json"
+
+    try:
+        with open(cache_file, 'r') as f:
+            compiled = json.load(f)
+        return {
+            classification: SpikePanel(tables['tax_ids'], tables['names'])
+            for classification, tables in compiled.items()
+        }
+    except (OSError, ValueError, KeyError):
+        pass
+
+    panels = {
+        str(classification): SpikePanel.compile(entries)
+        for classification, entries in _read_panel_file(panel_file).items()
+    }
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump({classification: panel.to_dict() for classification, panel in panels.items()}, f)
+    except OSError as e:
+        print(f"Warning: could not cache spike panels in {cache_file}: {e}")
+
+    return panels
+
+
+def get_spike_panel(classification_type: Optional[str] = None) -> SpikePanel:
+    """Spike panel for a classification type, falling back to the default panel."""
+    panels = load_spike_panels()
+    if classification_type in panels:
+        return panels[classification_type]
+    return panels.get('default') or SpikePanel({}, {})
@@ -0,0 +1,46 @@
+"""Parsing of Nextflow human-readable durations, memory sizes and percentages."""
+
+import re
+from typing import Optional
+
+# Nextflow formats memory with binary multiples
+MEMORY_UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3, 'TB': 1024 ** 4, 'PB': 1024 ** 5}
+
+DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)\s*(ms|s|m|h|d)')
+_MEMORY = re.compile(r'^(\d+(?:\.\d+)?)\s*([KMGTP]?B)$', re.IGNORECASE)
+
+# Placeholders Nextflow writes for values that were not recorded
+MISSING = ('', '-')
+
+
+def parse_duration(value: str) -> Optional[float]:
+    """Seconds in a Nextflow duration such as '4.9s', '550ms' or '1h 2m 3s'."""
+    value = value.strip()
+    if value in MISSING:
+        return None
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return round(sum(float(amount) * DURATION_UNITS[unit] for amount, unit in parts), 3)
+
+
+def parse_memory(value: str) -> Optional[int]:
+    """Bytes in a Nextflow memory size such as '2.2 MB' or '1 GB'."""
+    match = _MEMORY.match(value.strip())
+    if not match:
+        return None
+    amount, unit = match.groups()
+    return int(float(amount) * MEMORY_UNITS[unit.upper()])
+
+
+def parse_percent(value: str) -> Optional[float]:
+    """Number in a percentage such as '46.2%'."""
+    value = value.strip().rstrip('%')
+    if value in MISSING:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
@@ -0,0 +1,8 @@
+"""Watch mode: ingest TRANA runs as the pipeline completes them."""
+
+from .events import InotifyEvents, PollingEvents, open_event_source
+from .runs import RunWatcher, discover_samples, is_run_complete, DEFAULT_MARKERS
+from .ingest import SampleIngester
+
+__all__ = ['InotifyEvents', 'PollingEvents', 'open_event_source', 'RunWatcher', 'discover_samples',
+           'is_run_complete', 'DEFAULT_MARKERS', 'SampleIngester']
@@ -0,0 +1,163 @@
+"""File system activity per run directory: inotify on Linux, polling elsewhere."""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+# inotify event flags (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT = struct.Struct('iIII')
+READ_SIZE = 64 * 1024
+
+
+def run_directories(base_path: Path) -> Set[str]:
+    """Names of the run directories directly under the watched base path."""
+    return {entry.name for entry in os.scandir(base_path) if entry.is_dir() and not entry.name.startswith('.')}
+
+
+class InotifyEvents:
+    """Recursive inotify watches on the base path, reporting which runs saw activity."""
+
+    def __init__(self, base_path: Path):
+        self.base_path = Path(base_path)
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._watches: Dict[int, Path] = {}
+        self._add_tree(self.base_path)
+
+    def _add_watch(self, directory: Path):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error in (errno.ENOENT, errno.ENOTDIR):  # Removed before we got to it
+                return
+            raise OSError(error, f'inotify_add_watch failed for {directory}')
+        self._watches[wd] = directory
+
+    def _add_tree(self, directory: Path):
+        self._add_watch(directory)
+        for root, dirs, _ in os.walk(directory):
+            dirs[:] = [name for name in dirs if not name.startswith('.')]
+            for name in dirs:
+                self._add_watch(Path(root) / name)
+
+    def _run_of(self, path: Path) -> Optional[str]:
+        parts = path.relative_to(self.base_path).parts
+        return parts[0] if parts else None
+
+    def wait(self, timeout: float) -> Set[str]:
+        """Runs with activity, waiting up to timeout seconds for the first event."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        runs = set()
+        while True:
+            try:
+                data = os.read(self._fd, READ_SIZE)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b'\0')
+                offset += _EVENT.size + length
+
+                if mask & IN_Q_OVERFLOW:
+                    # Events were dropped; treat every run as active
+                    runs |= run_directories(self.base_path)
+                    continue
+                directory = self._watches.get(wd)
+                if mask & IN_IGNORED:
+                    self._watches.pop(wd, None)
+                    continue
+                if directory is None or not name:
+                    continue
+
+                path = directory / os.fsdecode(name)
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    # Files may land in a new directory before its watch exists; the run is
+                    # marked active anyway, and the completion check looks at the tree itself
+                    try:
+                        self._add_tree(path)
+                    except OSError as e:
+                        print(f"⚠️  Cannot watch {path}: {e}")
+                run = self._run_of(path)
+                if run and not run.startswith('.'):
+                    runs.add(run)
+        return runs
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingEvents:
+    """Fallback that compares a cheap signature of every run directory each interval."""
+
+    def __init__(self, base_path: Path, interval: float):
+        self.base_path = Path(base_path)
+        self.interval = interval
+        self._signatures = {run: self._signature(run) for run in run_directories(self.base_path)}
+        self._next_scan = time.monotonic() + interval
+
+    def _signature(self, run: str) -> Tuple[int, int, int]:
+        """File count, total size and newest mtime of a run's tree."""
+        count = size = newest = 0
+        for root, dirs, files in os.walk(self.base_path / run):
+            dirs[:] = [name for name in dirs if not name.startswith('.')]
+            for name in files:
+                try:
+                    stat = os.stat(os.path.join(root, name))
+                except FileNotFoundError:
+                    continue
+                count += 1
+                size += stat.st_size
+                newest = max(newest, stat.st_mtime_ns)
+        return count, size, newest
+
+    def wait(self, timeout: float) -> Set[str]:
+        """Runs whose signature changed, scanning at most once per interval."""
+        delay = self._next_scan - time.monotonic()
+        if delay > timeout:
+            time.sleep(timeout)
+            return set()
+        time.sleep(max(delay, 0))
+        self._next_scan = time.monotonic() + self.interval
+
+        signatures = {run: self._signature(run) for run in run_directories(self.base_path)}
+        runs = {run for run, signature in signatures.items() if self._signatures.get(run) != signature}
+        self._signatures = signatures
+        return runs
+
+    def close(self):
+        pass
+
+
+def open_event_source(base_path: Path, poll_interval: float, polling: bool = False):
+    """inotify event source where available, otherwise (or if asked to) polling."""
+    if not polling:
+        try:
+            return InotifyEvents(base_path)
+        except (OSError, AttributeError) as e:
+            # AttributeError: libc without inotify (non-Linux)
+            print(f"⚠️  inotify unavailable ({e}), polling every {poll_interval}s")
+    return PollingEvents(base_path, poll_interval)
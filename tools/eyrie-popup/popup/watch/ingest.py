@@ -0,0 +1,74 @@
+"""Unattended single-sample ingest used by the watch workers."""
+
+import threading
+from pathlib import Path
+from typing import Optional
+
+from ..models import SampleConfig
+from ..parser import SampleParser
+from ..api import EyrieAPIClient, IngestQueue
+from ..utils.artifacts import sample_artifact_files
+from ..utils.ingest_manifest import IngestManifest, sample_input_files
+
+# Outcomes of SampleIngester.ingest
+INGESTED = 'ingested'
+UNCHANGED = 'unchanged'
+FAILED = 'failed'
+QUEUED = 'queued'
+
+
+class SampleIngester:
+    """Parse and upload samples like `popup upload`, with one API client per worker thread."""
+
+    def __init__(self, api_url: str, username: Optional[str] = None, password: Optional[str] = None,
+                 compact_hits: bool = False, push_artifacts: bool = False, force: bool = False,
+                 queue: Optional[IngestQueue] = None):
+        self.api_url = api_url
+        self.username = username
+        self.password = password
+        self.compact_hits = compact_hits
+        self.push_artifacts = push_artifacts
+        self.force = force
+        self.queue = queue
+        self._local = threading.local()
+
+    @property
+    def client(self) -> EyrieAPIClient:
+        # requests sessions are not shared between threads
+        if not hasattr(self._local, 'client'):
+            self._local.client = EyrieAPIClient(self.api_url, self.username, self.password)
+        return self._local.client
+
+    def ingest(self, config: SampleConfig, config_file: Optional[Path] = None) -> str:
+        """Upload one sample unless its inputs are unchanged since its last successful upload."""
+        manifest = IngestManifest(self.api_url, config.sample.sample_id)
+        snapshot = manifest.snapshot(sample_input_files(config, config_file))
+        # Same options as `popup upload`, so either command's manifest covers the other
+        upload_options = {'compact_hits': self.compact_hits, 'artifact_store': None,
+                          'push_artifacts': self.push_artifacts}
+        if not self.force and not manifest.changed_files(snapshot, upload_options):
+            return UNCHANGED
+
+        parser = SampleParser(config)
+        parsed_sample = parser.parse_sample()
+
+        if self.queue is not None:
+            self.client.queue_sample(self.queue, parsed_sample, config, self.compact_hits,
+                                     manifest={'snapshot': snapshot, 'options': upload_options})
+            return QUEUED
+
+        artifact_paths = None
+        if self.push_artifacts:
+            artifact_paths = self.client.push_artifacts(parser.seqrun_path, sample_artifact_files(parsed_sample.sample_data))
+            if artifact_paths is None:
+                return FAILED
+
+        if not self.client.upload_sample(parsed_sample, config, self.compact_hits, artifact_paths):
+            # Keep the sample for `popup drain` if Eyrie went away, rather than losing it
+            if not self.push_artifacts and not self.client.test_connection():
+                self.client.queue_sample(IngestQueue(), parsed_sample, config, self.compact_hits,
+                                         manifest={'snapshot': snapshot, 'options': upload_options})
+                return QUEUED
+            return FAILED
+        manifest.record(snapshot, upload_options)
+        return INGESTED
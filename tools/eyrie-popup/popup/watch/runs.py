@@ -0,0 +1,211 @@
+"""Detect completed TRANA run directories and ingest their samples through a worker queue."""
+
+import csv
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import yaml
+
+from ..config import DEFAULT_MARKERS, DEFAULT_SAMPLE_ID_TEMPLATE, RETRY_BACKOFF, MAX_RETRY_BACKOFF
+from ..models import SampleConfig
+from ..utils.sample_config import default_sample_config
+from .events import open_event_source, run_directories
+from .ingest import FAILED
+
+SAMPLESHEET_PATTERN = 'samplesheet*.csv'
+REL_ABUNDANCE_SUFFIX = '_filtered.fastq_rel-abundance.tsv'
+CONFIG_SUFFIX = '_config.yaml'
+
+_print_lock = threading.Lock()
+
+
+def _log(message: str):
+    """Print whole lines from the watcher and its worker threads."""
+    with _print_lock:
+        print(message, flush=True)
+
+
+def is_run_complete(run_path: Path, markers: Sequence[str] = DEFAULT_MARKERS) -> bool:
+    """Whether any completion marker exists in the run directory."""
+    return any(next(run_path.glob(marker), None) is not None for marker in markers)
+
+
+def discover_sample_names(run_path: Path) -> List[str]:
+    """Sample names from the run's samplesheet, or from its relative abundance results."""
+    for samplesheet in sorted(run_path.glob(SAMPLESHEET_PATTERN)):
+        with open(samplesheet, 'r', newline='') as f:
+            names = [row['sample'] for row in csv.DictReader(f) if row.get('sample')]
+        if names:
+            return list(dict.fromkeys(names))
+    return sorted(path.name[:-len(REL_ABUNDANCE_SUFFIX)]
+                  for path in (run_path / 'results').glob(f'*{REL_ABUNDANCE_SUFFIX}'))
+
+
+def discover_samples(run_path: Path, classification: str = '16S',
+                     sample_id_template: str = DEFAULT_SAMPLE_ID_TEMPLATE) -> List[Tuple[SampleConfig, Optional[Path]]]:
+    """
+    Sample configurations for every sample of a run.
+
+    A `<sample>_config.yaml` in the run directory is used as is, except that its
+    paths are pointed at the run directory; other samples get the generate-config
+    defaults with the run directory name as sequencing run ID.
+
+    Returns:
+        (config, config file or None) per sample
+    """
+    run = run_path.name
+    samples = []
+    for name in discover_sample_names(run_path):
+        config_file = run_path / f"{name}{CONFIG_SUFFIX}"
+        if config_file.exists():
+            with open(config_file, 'r') as f:
+                config_data = yaml.safe_load(f)
+        else:
+            config_file = None
+            config_data = default_sample_config(run_path, name, f"Sample_{name}", f"LIMS_{name}",
+                                                run, run, classification)
+            config_data['sample']['sample_id'] = sample_id_template.format(run=run, sample=name)
+            config_data['sample']['barcode'] = name
+        config_data.update(base_path=str(run_path.parent), run_directory=run)
+        samples.append((SampleConfig(**config_data), config_file))
+    return samples
+
+
+class RunWatcher:
+    """
+    Watch a directory of run outputs and ingest each run once it is complete.
+
+    Activity anywhere in a run directory restarts its settle timer; when a run
+    has been quiet for `settle` seconds and has a completion marker, its samples
+    are queued for a fixed pool of workers. The queue is bounded, so discovery
+    waits for the workers rather than piling up work. Runs changing again later
+    are queued again; `ingest` is expected to skip unchanged samples. Samples
+    whose ingest returns FAILED are queued again after an exponential backoff
+    while watching.
+    """
+
+    def __init__(self, base_path: Path, ingest: Callable[[SampleConfig, Optional[Path]], str],
+                 markers: Sequence[str] = DEFAULT_MARKERS, settle: float = 60.0, workers: int = 2,
+                 queue_size: int = 16, poll_interval: float = 30.0, polling: bool = False,
+                 classification: str = '16S', sample_id_template: str = DEFAULT_SAMPLE_ID_TEMPLATE):
+        self.base_path = Path(base_path)
+        self.ingest = ingest
+        self.markers = markers
+        self.settle = settle
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.polling = polling
+        self.classification = classification
+        self.sample_id_template = sample_id_template
+        self._queue: "queue.Queue[Optional[Tuple[SampleConfig, Optional[Path]]]]" = queue.Queue(maxsize=queue_size)
+        # Last activity per run awaiting ingest (monotonic seconds)
+        self._pending: Dict[str, float] = {}
+        # Failed samples awaiting another attempt: sample_id -> (due time, item), and failures so far
+        self._retries: Dict[str, Tuple[float, Tuple[SampleConfig, Optional[Path]]]] = {}
+        self._failures: Dict[str, int] = {}
+        self._retries_lock = threading.Lock()
+        self._retry_failed = False
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                config, config_file = item
+                sample_id = config.sample.sample_id
+                try:
+                    status = self.ingest(config, config_file)
+                except Exception as e:
+                    _log(f"❌ {sample_id}: {e}")
+                else:
+                    _log(f"  {sample_id}: {status}")
+                    if self._retry_failed:
+                        self._track_result(sample_id, item, status == FAILED)
+            finally:
+                self._queue.task_done()
+
+    def _track_result(self, sample_id: str, item: Tuple[SampleConfig, Optional[Path]], failed: bool):
+        with self._retries_lock:
+            if not failed:
+                self._retries.pop(sample_id, None)
+                self._failures.pop(sample_id, None)
+                return
+            failures = self._failures.get(sample_id, 0)
+            delay = min(RETRY_BACKOFF * 2 ** failures, MAX_RETRY_BACKOFF)
+            self._failures[sample_id] = failures + 1
+            self._retries[sample_id] = (time.monotonic() + delay, item)
+        _log(f"🔁 {sample_id}: retrying in {delay:.0f}s")
+
+    def _queue_retries(self, now: float):
+        with self._retries_lock:
+            due = [sample_id for sample_id, (retry_at, _) in self._retries.items() if retry_at <= now]
+            items = [self._retries.pop(sample_id)[1] for sample_id in due]
+        # Outside the lock: put blocks while the queue is full
+        for item in items:
+            self._queue.put(item)
+
+    def _queue_run(self, run: str):
+        run_path = self.base_path / run
+        if not run_path.is_dir():
+            return
+        if not is_run_complete(run_path, self.markers):
+            return
+        try:
+            samples = discover_samples(run_path, self.classification, self.sample_id_template)
+        except Exception as e:
+            _log(f"❌ {run}: cannot discover samples: {e}")
+            return
+        _log(f"📦 {run}: queueing {len(samples)} samples")
+        for sample in samples:
+            self._queue.put(sample)
+
+    def _queue_settled(self, now: float):
+        for run, last_activity in list(self._pending.items()):
+            if now - last_activity >= self.settle:
+                del self._pending[run]
+                self._queue_run(run)
+
+    def run(self, once: bool = False, stop: Optional[threading.Event] = None):
+        """
+        Ingest existing complete runs, then keep watching until stopped.
+
+        Args:
+            once: Only ingest the runs that are complete now, then return
+            stop: Event that ends watching (Ctrl-C does too)
+        """
+        self._retry_failed = not once
+        threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(self.workers)]
+        for thread in threads:
+            thread.start()
+
+        # Open the event source before the initial scan, so nothing written in between is missed
+        events = None if once else open_event_source(self.base_path, self.poll_interval, self.polling)
+        try:
+            for run in sorted(run_directories(self.base_path)):
+                self._queue_run(run)
+
+            while events and not (stop and stop.is_set()):
+                now = time.monotonic()
+                with self._retries_lock:
+                    retry_times = [retry_at for retry_at, _ in self._retries.values()]
+                timeout = min([last_activity + self.settle - now for last_activity in self._pending.values()]
+                              + [retry_at - now for retry_at in retry_times], default=self.settle)
+                if stop:
+                    timeout = min(timeout, 1.0)  # Notice the stop event promptly
+                for run in events.wait(max(timeout, 0.0)):
+                    self._pending[run] = time.monotonic()
+                self._queue_settled(time.monotonic())
+                self._queue_retries(time.monotonic())
+        except KeyboardInterrupt:
+            _log("\n🛑 Stopping, finishing queued samples...")
+        finally:
+            if events:
+                events.close()
+            for _ in threads:
+                self._queue.put(None)
+            for thread in threads:
+                thread.join()
@@ -0,0 +1,59 @@
+"""Cold start of popup subcommands: no parsing stack, bounded import time.
+
+Each command runs in a fresh interpreter under `python -X importtime`
+(see benchmarks/cli_startup.py). Budgets are the cumulative import time of
+the command's top-level imports, in milliseconds, with room for slower
+machines; the targets are what the command measured on the reference
+machine after imports were made lazy (the parsing stack alone costs about
+300 ms).
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PACKAGE_DIR / 'benchmarks'))
+
+from cli_startup import commands, run_once  # noqa: E402
+
+# command: (target ms, budget ms)
+IMPORT_BUDGETS = {
+    '--version': (75, 200),
+    'generate-config': (110, 300),
+    'test-connection': (225, 500),
+    'drain --list': (220, 500),
+    'verify-artifacts': (105, 300),
+    'upload --help': (70, 200),
+    'watch --help': (85, 200),
+}
+
+# Cold starts per command; the fastest one is compared against the budget
+RUNS = 3
+
+
+@pytest.fixture(scope='module')
+def env(tmp_path_factory):
+    tmp = tmp_path_factory.mktemp('popup')
+    return tmp, dict(os.environ, EYRIE_POPUP_CACHE=str(tmp / 'cache'),
+                     EYRIE_POPUP_QUEUE=str(tmp / 'queue.sqlite'), PYTHONPATH=str(PACKAGE_DIR))
+
+
+def test_every_command_has_a_budget(tmp_path):
+    assert {label for label, _, _ in commands(tmp_path)} == set(IMPORT_BUDGETS)
+
+
+@pytest.mark.parametrize('label', IMPORT_BUDGETS)
+def test_command_startup(env, label):
+    tmp, environ = env
+    popup_args, forbidden = next((args, forbidden) for name, args, forbidden in commands(tmp) if name == label)
+    runs = [run_once(popup_args, environ) for _ in range(RUNS)]
+
+    modules = runs[-1][2]
+    assert [module for module in forbidden if module in modules] == []
+
+    import_ms = min(run[1] for run in runs) * 1000
+    target, budget = IMPORT_BUDGETS[label]
+    assert import_ms <= budget, f"{label} imports took {import_ms:.0f} ms (target {target} ms, budget {budget} ms)"
@@ -0,0 +1,119 @@
+"""Lease and version handling of the durable upload queue."""
+
+import pytest
+
+from popup.api import ingest_queue
+from popup.api.ingest_queue import LEASE_SECONDS, IngestQueue
+from popup.config import MAX_RETRY_BACKOFF, RETRY_BACKOFF
+
+API = 'http://eyrie/api'
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(ingest_queue.time, 'time', clock)
+    return clock
+
+
+@pytest.fixture
+def queue(tmp_path, clock):
+    return IngestQueue(tmp_path / 'queue.sqlite')
+
+
+def payload(value):
+    return {'sample': {'sample_id': 'S1', 'value': value}, 'taxonomy': [], 'compact_hits': False}
+
+
+def test_claim_leases_entries_oldest_first(queue, clock):
+    for sample_id in ('S1', 'S2', 'S3'):
+        queue.put(API, sample_id, payload(sample_id))
+        clock.now += 1
+    queue.put('http://other/api', 'S4', payload('S4'))
+
+    assert [upload.sample_id for upload in queue.claim(API, limit=2)] == ['S1', 'S2']
+    assert [upload.sample_id for upload in queue.claim(API)] == ['S3']
+    assert queue.claim(API) == []
+
+
+def test_expired_lease_is_claimed_again(queue, clock):
+    queue.put(API, 'S1', payload(1), manifest={'snapshot': {}, 'options': {}})
+    first = queue.claim(API)[0]
+    assert first.manifest == {'snapshot': {}, 'options': {}}
+
+    clock.now += LEASE_SECONDS - 1
+    assert queue.claim(API) == []
+    clock.now += 1
+    assert queue.claim(API) == [first]
+
+
+def test_done_removes_the_entry(queue):
+    queue.put(API, 'S1', payload(1))
+    queue.done(queue.claim(API)[0])
+
+    assert len(queue) == 0
+
+
+def test_done_keeps_a_payload_queued_during_the_upload(queue):
+    queue.put(API, 'S1', payload(1))
+    uploading = queue.claim(API)[0]
+    queue.put(API, 'S1', payload(2))
+    queue.done(uploading)
+
+    newer = queue.claim(API)
+    assert [(upload.version, upload.payload) for upload in newer] == [(2, payload(2))]
+
+
+def test_failed_backs_off_exponentially(queue, clock):
+    queue.put(API, 'S1', payload(1))
+
+    for attempt in range(3):
+        upload = queue.claim(API)[0]
+        assert upload.attempts == attempt
+        queue.failed(upload, 'sample upload failed')
+        delay = RETRY_BACKOFF * 2 ** attempt
+
+        clock.now += delay - 1
+        assert queue.claim(API) == []
+        clock.now += 1
+
+    entry = queue.entries(API)[0]
+    assert entry['attempts'] == 3
+    assert entry['last_error'] == 'sample upload failed'
+
+
+def test_backoff_is_capped(queue, clock):
+    queue.put(API, 'S1', payload(1))
+    upload = queue.claim(API)[0]._replace(attempts=30)
+    queue.failed(upload, 'down')
+
+    assert queue.entries(API)[0]['next_attempt'] == clock.now + MAX_RETRY_BACKOFF
+
+
+def test_failed_leaves_a_newer_payload_due(queue):
+    queue.put(API, 'S1', payload(1))
+    uploading = queue.claim(API)[0]
+    queue.put(API, 'S1', payload(2))
+    queue.failed(uploading, 'sample upload failed')
+
+    newer = queue.claim(API)
+    assert [(upload.version, upload.attempts, upload.payload) for upload in newer] == [(2, 0, payload(2))]
+
+
+def test_put_replaces_a_waiting_payload_and_resets_retries(queue, clock):
+    queue.put(API, 'S1', payload(1))
+    queue.failed(queue.claim(API)[0], 'down')
+    queue.put(API, 'S1', payload(2))
+
+    assert len(queue) == 1
+    entry = queue.entries(API)[0]
+    assert (entry['attempts'], entry['last_error']) == (0, None)
+    assert queue.claim(API)[0].payload == payload(2)
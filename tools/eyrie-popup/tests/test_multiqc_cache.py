@@ -0,0 +1,51 @@
+"""On-disk cache of parsed multiqc_data.json files."""
+
+import json
+import os
+from collections import OrderedDict
+
+import pytest
+
+from popup.parser import multiqc
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / 'cache'
+    monkeypatch.setattr(multiqc, 'CACHE_DIR', str(cache_dir))
+    monkeypatch.setattr(multiqc, 'MULTIQC_CACHE_ENTRIES', 2)
+    monkeypatch.setattr(multiqc, '_parsed', OrderedDict())
+    return cache_dir
+
+
+def write_run(tmp_path, name):
+    data_file = tmp_path / name / 'multiqc_data.json'
+    data_file.parent.mkdir()
+    data_file.write_text(json.dumps({multiqc.RAW_DATA_PREFIX: {'multiqc_fastqc': {name: {'reads': 1}}}}))
+    return data_file
+
+
+def test_cache_keeps_the_most_recently_used_runs(tmp_path, cache_dir):
+    runs = [write_run(tmp_path, f'run{i}') for i in range(3)]
+    for age, data_file in enumerate(runs[:2], start=1):
+        multiqc.load_multiqc_data(data_file)
+        for cache_file in cache_dir.iterdir():
+            os.utime(cache_file, (age, age))  # Distinct, old mtimes
+
+    # A later process reading run0 from disk marks it as recently used
+    multiqc._parsed.clear()
+    assert multiqc.load_multiqc_data(runs[0]) == {'multiqc_fastqc': {'run0': {'reads': 1}}}
+    multiqc.load_multiqc_data(runs[2])
+
+    cached = {json.loads(path.read_text())['multiqc_fastqc'].popitem()[0] for path in cache_dir.iterdir()}
+    assert cached == {'run0', 'run2'}
+
+
+def test_memory_keeps_a_few_runs(tmp_path, cache_dir, monkeypatch):
+    monkeypatch.setattr(multiqc, 'MULTIQC_MEMORY_ENTRIES', 2)
+    runs = [write_run(tmp_path, f'run{i}') for i in range(3)]
+    for data_file in runs + runs[1:2]:
+        multiqc.load_multiqc_data(data_file)
+
+    assert list(multiqc._parsed) == [str(runs[2].resolve()), str(runs[1].resolve())]
+    assert not list(cache_dir.glob('*.tmp'))
@@ -0,0 +1,43 @@
+"""Per-read length and quality from NanoPlot's raw data file."""
+
+import gzip
+
+import numpy as np
+import pytest
+
+from popup.parser import nanoplot_data
+from popup.parser.nanoplot_data import read_raw_length_quality
+
+RAW = (
+    "\tquals\tlengths\tchannelIDs\n"
+    "0\t10.5\t100\t1\n"
+    "1\tnan\t200\t2\n"
+    "2\t\t300\t3\n"       # Missing quality
+    "3\t11\tabc\t4\n"     # Unparsable length
+    "4\t12\n"             # Truncated row
+    "5\t13.25\t500\t5\n"
+    "6\t14\t600\t6\n"
+)
+
+
+@pytest.mark.parametrize('chunk_rows', [2, 1000])
+@pytest.mark.parametrize('name', ['NanoPlot-data.tsv', 'NanoPlot-data.tsv.gz'])
+def test_malformed_rows_are_skipped(tmp_path, monkeypatch, chunk_rows, name):
+    monkeypatch.setattr(nanoplot_data, 'RAW_CHUNK_ROWS', chunk_rows)
+    raw_file = tmp_path / name
+    with (gzip.open if name.endswith('.gz') else open)(raw_file, 'wt') as f:
+        f.write(RAW)
+
+    lengths, qualities = read_raw_length_quality(raw_file)
+
+    assert lengths.tolist() == [100.0, 200.0, 500.0, 600.0]
+    np.testing.assert_array_equal(qualities, [10.5, np.nan, 13.25, 14.0])
+
+
+def test_missing_columns_give_no_reads(tmp_path):
+    raw_file = tmp_path / 'NanoPlot-data.tsv'
+    raw_file.write_text("\tlengths\n0\t100\n")
+
+    lengths, qualities = read_raw_length_quality(raw_file)
+
+    assert lengths.size == qualities.size == 0
@@ -0,0 +1,58 @@
+"""Retries of samples the watch workers failed to ingest."""
+
+import threading
+from types import SimpleNamespace
+
+from popup.config import RETRY_BACKOFF
+from popup.watch import RunWatcher
+from popup.watch.ingest import FAILED, INGESTED
+
+
+def sample(sample_id):
+    return SimpleNamespace(sample=SimpleNamespace(sample_id=sample_id)), None
+
+
+def process(watcher, *items):
+    """Ingest items on one worker thread, returning once it has finished them."""
+    for item in items:
+        watcher._queue.put(item)
+    watcher._queue.put(None)
+    worker = threading.Thread(target=watcher._worker)
+    worker.start()
+    worker.join()
+
+
+def test_failed_sample_is_queued_again_with_backoff(tmp_path):
+    results = iter([FAILED, FAILED, INGESTED])
+    ingested = []
+
+    def ingest(config, config_file):
+        ingested.append(config.sample.sample_id)
+        return next(results)
+
+    watcher = RunWatcher(tmp_path, ingest)
+    watcher._retry_failed = True
+    item = sample('S1')
+
+    process(watcher, item)
+    first_retry_at = watcher._retries['S1'][0]
+    watcher._queue_retries(first_retry_at - 1)
+    assert watcher._queue.empty()
+
+    watcher._queue_retries(first_retry_at)
+    assert 'S1' not in watcher._retries
+    process(watcher)
+    # Second failure waits twice as long
+    assert watcher._retries['S1'][0] - first_retry_at >= RETRY_BACKOFF
+
+    watcher._queue_retries(watcher._retries['S1'][0])
+    process(watcher)
+    assert ingested == ['S1', 'S1', 'S1']
+    assert watcher._retries == {} and watcher._failures == {}
+
+
+def test_failures_are_not_retried_with_once(tmp_path):
+    watcher = RunWatcher(tmp_path, lambda config, config_file: FAILED)
+    watcher.run(once=True)
+    process(watcher, sample('S1'))
+    assert watcher._retries == {}